@@ -5,18 +5,29 @@ Provides graphical interface for Meshtastic installation and configuration
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, filedialog
+from tkinter import ttk, scrolledtext
 import os
 import sys
 import subprocess
+import shlex
 import json
 import shutil
 import logging
+import atexit
 import re
 import threading
 import queue
 import time
+import random
 import select
+import concurrent.futures
+import fcntl
+import mmap
+import functools
+import ctypes
+import ctypes.util
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Tuple, List
@@ -30,6 +41,320 @@ PKG_NAME = "meshtasticd"
 CONFIG_DIR = "/etc/meshtasticd"
 BACKUP_DIR = "/etc/meshtasticd_backups"
 LOG_FILE = "/var/log/meshtastic_installer.log"
+BOOT_CONFIG_FILE = "/boot/firmware/config.txt"
+BOOT_CONFIG_COMMENT = "# MeshAdv config"
+
+# config.txt directives checked by the status indicators, matched in a single pass
+BOOT_CONFIG_TOKEN_RE = re.compile(
+    rb"^(dtparam=spi=on|dtoverlay=spi0-0cs|dtparam=i2c_arm=on|enable_uart=1|"
+    rb"dtoverlay=uart0|gpio=4=op,dh|dtoverlay=pps-gpio,gpiopin=17)",
+    re.M
+)
+
+# Package probes batched into one shell so a refresh forks once, not per check
+STATUS_PROBE_PACKAGES = (PKG_NAME, "avahi-daemon")
+STATUS_PROBE_UNITS = (PKG_NAME, "avahi-daemon")
+STATUS_PROBE_SCRIPT = f"""
+dpkg-query -W -f='${{Package}}=${{Status}}\\n' {' '.join(STATUS_PROBE_PACKAGES)} 2>/dev/null
+# One systemctl call for every unit; blocks are blank-line separated, in argument order
+units=({' '.join(STATUS_PROBE_UNITS)})
+i=0
+systemctl show -p ActiveState -p UnitFileState "${{units[@]}}" 2>/dev/null | while IFS= read -r line; do
+    if [ -z "$line" ]; then i=$((i + 1)); else printf '%s.%s\\n' "${{units[$i]}}" "$line"; fi
+done
+printf 'meshtasticd_bin=%s\\n' "$(command -v {PKG_NAME})"
+printf 'meshtastic_cli=%s\\n' "$(command -v meshtastic)"
+# pipx list is slow, so only ask it when meshtastic isn't on PATH
+printf 'pipx_meshtastic=%s\\n' "$(command -v meshtastic >/dev/null || pipx list 2>/dev/null | grep -c meshtastic)"
+"""
+STATUS_PROBE_TTL = 2.0
+# Queries that start the meshtastic CLI cost seconds each (interpreter + protobuf import), so their
+# results live longer and survive routine refreshes; the actions that change them drop them explicitly
+CLI_QUERY_TTL = 10.0
+CLI_QUERY_CHECKS = ("check_lora_region_status", "get_python_cli_version")
+# Memoised status checks that a service or Avahi change makes stale, see _invalidate_status_cache
+SERVICE_STATUS_CHECKS = ("_probe_all", "check_meshtasticd_service_status", "check_meshtasticd_boot_status",
+                         "check_lora_region_status")
+AVAHI_STATUS_CHECKS = ("_probe_all", "check_avahi_status")
+
+# Avahi setup/teardown, each run as one privileged shell; the enable script reads the service file on stdin
+AVAHI_SERVICES_DIR = "/etc/avahi/services"
+AVAHI_SERVICE_FILE = f"{AVAHI_SERVICES_DIR}/meshtastic.service"
+# The directory ships with avahi-daemon, so the builtin test usually spares the mkdir exec
+# The file is written beside its final name and renamed, so avahi never sees it half-written
+AVAHI_ENABLE_SCRIPT = (f"{{ [ -d {AVAHI_SERVICES_DIR} ] || mkdir -p {AVAHI_SERVICES_DIR}; }} && "
+                       f"cat > {AVAHI_SERVICE_FILE}.tmp && mv -f {AVAHI_SERVICE_FILE}.tmp {AVAHI_SERVICE_FILE} && "
+                       f"systemctl enable --now avahi-daemon")
+AVAHI_START_SCRIPT = "systemctl enable --now avahi-daemon"
+# Service advertisement piped into AVAHI_ENABLE_SCRIPT, kept as bytes so it's written as-is
+AVAHI_SERVICE_XML = b"""<?xml version="1.0" standalone="no"?><!--*-nxml-*-->
+<!DOCTYPE service-group SYSTEM "avahi-service.dtd">
+<service-group>
+<n>Meshtastic</n>
+<service protocol="ipv4">
+<type>_meshtastic._tcp</type>
+<port>4403</port>
+</service>
+</service-group>"""
+AVAHI_DISABLE_SCRIPT = f"systemctl disable --now avahi-daemon 2>/dev/null; rm -f {AVAHI_SERVICE_FILE}"
+
+# GUI output limits: queued messages, messages inserted per tick, lines kept in the widget
+OUTPUT_QUEUE_SIZE = 4096
+OUTPUT_BATCH_SIZE = 200
+OUTPUT_MAX_LINES = 5000
+
+# Lines of apt stdout/stderr kept for post-run checks; the rest is only streamed to the log
+APT_OUTPUT_TAIL_LINES = 200
+# apt/dpkg errors that mean another package manager holds the lock and a retry may succeed
+APT_LOCK_RE = re.compile(r"Could not get lock|dpkg was interrupted")
+# apt errors meaning dpkg is left half-configured and needs `dpkg --configure -a`
+DPKG_BROKEN_RE = re.compile(r"dpkg was interrupted|needs to be reconfigured|E: Sub-process /usr/bin/dpkg")
+
+# Paths whose changes should trigger a status refresh
+STATUS_WATCH_DIRS = [
+    os.path.dirname(BOOT_CONFIG_FILE),
+    CONFIG_DIR,
+    f"{CONFIG_DIR}/config.d",
+    "/etc/systemd/system/multi-user.target.wants",
+    "/run/systemd/units",
+]
+STATUS_POLL_INTERVAL = 5
+# IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+INOTIFY_MASK = 0x002 | 0x008 | 0x040 | 0x080 | 0x100 | 0x200
+# dpkg's conffile question line, e.g. " *** config.yaml (Y/I/N/O/D/Z) [default=N] ?"
+# (it has no trailing newline, so it is matched on the raw stream)
+CONFIG_PROMPT_RE = re.compile(rb"\*\*\* [^\n]* \(Y/I/N/O/D/Z\) \[default=[A-Z]\] \?")
+# How long the config conflict dialog waits before keeping the current config
+CONFIG_CHOICE_TIMEOUT_MS = 300000
+
+# Python CLI install steps after apt, run as one script. Each step prints ##STEP:name##
+# when it starts and ##DONE:name##, ##WARN:name## or ##FAIL:name## when it ends
+CLI_INSTALL_SCRIPT = r"""
+echo "##STEP:pytap2##"
+pip3 install --upgrade pytap2 --break-system-packages && echo "##DONE:pytap2##" || echo "##WARN:pytap2##"
+echo "##STEP:pipx_install##"
+pipx install "meshtastic[cli]" && echo "##DONE:pipx_install##" || { echo "##FAIL:pipx_install##"; exit 1; }
+exit 0
+"""
+CLI_STEP_RE = re.compile(r"^##(STEP|DONE|WARN|FAIL):(.*)##$")
+# pipx reports "installed package meshtastic X.Y.Z, installed using Python ..." on a fresh install
+PIPX_VERSION_RE = re.compile(r"installed package meshtastic (\S+?),")
+# Log messages per step: (started, done, warning)
+CLI_INSTALL_STEPS = {
+    "pytap2": ("Step 2/5: Installing pytap2 via pip3...",
+               "✅ pytap2 installed successfully",
+               "⚠️ pytap2 installation had issues, continuing..."),
+    "pipx_install": ("Step 3/5: Installing Meshtastic CLI via pipx...",
+                     "✅ Meshtastic CLI installed successfully via pipx", None),
+}
+CLI_INSTALL_TIMEOUT = 1200
+# What `pipx ensurepath` would add to ~/.bashrc; see _ensure_local_bin_on_path
+LOCAL_BIN_PATH_LINE = 'export PATH="$HOME/.local/bin:$PATH"\n'
+
+# Window in which refresh requests from worker threads are merged into one
+STATUS_DEBOUNCE_MS = 150
+
+# Terminal emulators to open the config editor in, with the flag that runs a command
+TERMINAL_EMULATORS = (
+    ("x-terminal-emulator", "-e"),
+    ("gnome-terminal", "--"),
+    ("xterm", "-e"),
+    ("lxterminal", "-e"),
+    ("mate-terminal", "-e"),
+    ("konsole", "-e"),
+)
+
+# Seconds between `sudo -v` refreshes; sudo's default credential timeout is 15 minutes
+SUDO_REFRESH_INTERVAL = 240
+
+# Held while a state-changing action runs, so two copies of the tool can't interleave them
+ACTION_LOCK_FILE = "/tmp/meshadv-mini.lock"
+
+# LoRa region parsing for `meshtastic --get lora.region` output
+REGION_MAP = {
+    "0": "UNSET",
+    "1": "US",
+    "2": "EU_433",
+    "3": "EU_868",
+    "4": "CN",
+    "5": "JP",
+    "6": "ANZ",
+    "7": "KR",
+    "8": "TW",
+    "9": "RU",
+    "10": "IN",
+    "11": "NZ_865",
+    "12": "TH",
+    "13": "UA_433",
+    "14": "UA_868",
+    "15": "MY_433",
+    "16": "MY_919",
+    "17": "SG_923"
+}
+# Regions offered by the Set Region dialog (common ones first, then alphabetical); "" marks the separator
+REGIONS = (
+    ("US", "United States (902-928 MHz)"),
+    ("EU_868", "Europe 868 MHz"),
+    ("ANZ", "Australia/New Zealand (915-928 MHz)"),
+    ("", "─── Other Regions ───"),
+    ("CN", "China (470-510 MHz)"),
+    ("EU_433", "Europe 433 MHz"),
+    ("IN", "India (865-867 MHz)"),
+    ("JP", "Japan (920-923 MHz)"),
+    ("KR", "Korea (920-923 MHz)"),
+    ("MY_433", "Malaysia 433 MHz"),
+    ("MY_919", "Malaysia 919-924 MHz"),
+    ("RU", "Russia (868-870 MHz)"),
+    ("SG_923", "Singapore 920-925 MHz"),
+    ("TH", "Thailand (920-925 MHz)"),
+    ("TW", "Taiwan (920-925 MHz)"),
+    ("UA_433", "Ukraine 433 MHz"),
+    ("UA_868", "Ukraine 868 MHz"),
+    ("UNSET", "Unset (must be configured)"),
+)
+VALID_REGIONS = frozenset(code for code, _ in REGIONS if code)
+LORA_REGION_RE = re.compile(r"lora\.region[:\s]+(\S+)")
+
+# Let grep pick the one interesting line out of the CLI's connection chatter. The CLI's
+# exit status is kept so a failed query can still be told apart from unparsable output.
+REGION_GREP_PATTERN = r"lora\.region[: ]+\S+|^(" + "|".join(sorted(VALID_REGIONS)) + r"|[0-9]+)$"
+REGION_QUERY_CMD = (
+    "out=$(meshtastic --host localhost --get lora.region 2>/dev/null); rc=$?; "
+    f"printf '%s\\n' \"$out\" | grep -m1 -Eo {shlex.quote(REGION_GREP_PATTERN)}; exit $rc"
+)
+
+def _messagebox():
+    """Import tkinter.messagebox on first use, keeping it off the startup path"""
+    import tkinter.messagebox
+    return tkinter.messagebox
+
+def _ttl_cache(seconds):
+    """Memoise a method's result per instance and arguments for a few seconds"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args):
+            key = (func.__name__,) + args
+            entry = self._status_cache.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                return entry[0]
+            value = func(self, *args)
+            self._status_cache[key] = (value, time.monotonic() + seconds)
+            return value
+        return wrapper
+    return decorator
+
+@functools.lru_cache(maxsize=None)
+def _read_dt(path):
+    """Read a device-tree node with a single raw read; these never change until reboot"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, 256)
+    finally:
+        os.close(fd)
+    return data.rstrip(b'\x00\n').decode('ascii', 'replace')
+
+@functools.lru_cache(maxsize=None)
+def _installed_terminals():
+    """Terminal emulators found on PATH, looked up once since they won't change while we run"""
+    return tuple((name, exec_flag) for name, exec_flag in TERMINAL_EMULATORS if shutil.which(name))
+
+def _prime_sudo():
+    """Validate sudo credentials once, then keep the timestamp fresh for later sudo calls.
+    
+    Returns whether sudo is usable without a password.
+    """
+    if os.geteuid() == 0:
+        return True
+    # Only prompt when there's a terminal to prompt on; otherwise just reuse a cached timestamp
+    cmd = ["sudo", "-v"] if sys.stdin.isatty() else ["sudo", "-n", "-v"]
+    if subprocess.run(cmd).returncode != 0:
+        return False
+        
+    def refresh():
+        subprocess.run(["sudo", "-n", "-v"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        schedule()
+        
+    def schedule():
+        timer = threading.Timer(SUDO_REFRESH_INTERVAL, refresh)
+        timer.daemon = True
+        timer.start()
+        
+    schedule()
+    return True
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that collects records in a large write buffer and flushes on a timer"""
+    
+    def __init__(self, filename, buffer_size=65536, flush_interval=1.0):
+        self.buffer_size = buffer_size
+        super().__init__(filename)
+        
+        # Flush periodically so the log file never lags far behind the GUI
+        self._closed = threading.Event()
+        self._flush_interval = flush_interval
+        threading.Thread(target=self._flush_loop, daemon=True).start()
+        
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+        
+    def emit(self, record):
+        # Unlike StreamHandler.emit, don't flush after every record
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            
+    def _flush_loop(self):
+        while not self._closed.wait(self._flush_interval):
+            self.flush()
+            
+    def close(self):
+        self._closed.set()
+        super().close()
+
+class SudoSession:
+    """A single long-lived privileged shell that runs the command lines sent to it in turn"""
+    
+    SENTINEL = "__MESHADV_DONE__"
+    
+    def __init__(self):
+        self._process = None
+        self._lock = threading.Lock()
+        
+    def _start(self):
+        # Credentials were primed in main(), so never prompt; plain bash if we're already root
+        cmd = ["bash"] if os.geteuid() == 0 else ["sudo", "-n", "bash"]
+        self._process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                         stderr=subprocess.STDOUT, text=True)
+        
+    def run(self, script):
+        """Run script in the shell, returning (exit status, combined stdout/stderr)"""
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._start()
+            self._process.stdin.write(f"{{\n{script}\n}} </dev/null 2>&1; echo \"{self.SENTINEL}$?\"\n")
+            self._process.stdin.flush()
+            
+            output = []
+            for line in self._process.stdout:
+                # The sentinel may follow output that had no trailing newline
+                marker = line.find(self.SENTINEL)
+                if marker >= 0:
+                    output.append(line[:marker])
+                    return int(line[marker + len(self.SENTINEL):]), "".join(output)
+                output.append(line)
+            self._process = None
+            raise RuntimeError(f"privileged shell exited unexpectedly: {''.join(output).strip()}")
+            
+    def close(self):
+        with self._lock:
+            if self._process is not None and self._process.poll() is None:
+                self._process.stdin.close()
+                self._process.wait()
+            self._process = None
 
 class MeshtasticGUI:
     def __init__(self, root):
@@ -38,7 +363,22 @@ class MeshtasticGUI:
         self.root.geometry("1000x800")  # Increased height from 700 to 800
         
         # Initialize threading first
-        self.output_queue = queue.Queue()
+        self.output_queue = queue.Queue(maxsize=OUTPUT_QUEUE_SIZE)
+        self.status_queue = queue.Queue()
+        self.status_refresh_event = threading.Event()
+        self._last_status = {}
+        # Runs the independent status checks of a refresh in parallel
+        self._probe_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        # Shared workers for button handlers; anything driving the meshtastic CLI or avahi goes
+        # through the single-worker executor so those commands never overlap
+        self._exec = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='meshadv')
+        self._cli_exec = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='meshadv-cli')
+        # meshtastic's TCPInterface class once imported, see _mesh_interface_class
+        self._mesh_iface_class = None
+        self._mesh_import_failed = False
+        # Shared root shell for file operations, so a flow costs one sudo instead of one per command
+        self._sudo = SudoSession()
+        atexit.register(self._sudo.close)
         
         # Setup logging
         self.setup_logging()
@@ -48,6 +388,32 @@ class MeshtasticGUI:
         self.hat_info = None
         self.current_channel = None
         
+        # Directives found in config.txt, invalidated when the file's mtime changes
+        self._config_txt_tokens = frozenset()
+        self._config_txt_mtime = None
+        
+        # config.txt contents for the enable handlers, and this session's backup of it
+        self._config_cache = {'stat': None, 'content': None, 'lines': frozenset()}
+        self._boot_backup_file = None
+        
+        # config.txt lines waiting for flush_boot_config, so several enables share one write
+        self._pending_boot_lines = []
+        self._pending_boot_lock = threading.Lock()
+        self._boot_flush_scheduled = False
+        # Held while anything (including raspi-config) modifies config.txt
+        self._boot_write_lock = threading.RLock()
+        
+        # Short-lived results of status probes, see _ttl_cache
+        self._status_cache = {}
+        # Set while a debounced refresh is scheduled, see request_status_update
+        self._status_update_pending = False
+        
+        # Dialogs built on first use and then hidden/shown rather than rebuilt
+        self._channel_dialog = None
+        self._file_dialog = None
+        self._message_dialog = None
+        self._region_dialog = None
+        
         # Detect hardware on startup
         self.detect_hardware()
         
@@ -57,37 +423,51 @@ class MeshtasticGUI:
         # Start checking for output updates
         self.check_output_queue()
         
+        # Probe status in the background so slow checks never block the GUI
+        threading.Thread(target=self._status_worker, daemon=True).start()
+        threading.Thread(target=self._status_watch_worker, daemon=True).start()
+        self._drain_status_queue()
+        
         # Update status indicators
         self.update_status_indicators()
         
     def setup_logging(self):
         """Setup logging with queue handler for GUI"""
-        # Create a custom handler that writes to queue
-        class QueueHandler(logging.Handler):
-            def __init__(self, queue):
+        # Create a custom handler that writes to the GUI output queue
+        class GUIHandler(logging.Handler):
+            def __init__(self, output_queue):
                 super().__init__()
-                self.queue = queue
+                self.output_queue = output_queue
                 
             def emit(self, record):
                 try:
                     # Format message without timestamp for GUI
                     msg = record.getMessage()
-                    self.queue.put(msg)
+                    while True:
+                        try:
+                            self.output_queue.put_nowait(msg)
+                            break
+                        except queue.Full:
+                            # Drop the oldest message rather than block the logger
+                            try:
+                                self.output_queue.get_nowait()
+                            except queue.Empty:
+                                pass
                 except Exception:
                     pass
         
         # Clear any existing handlers
         logging.getLogger().handlers.clear()
         
-        # Setup logging with queue handler
-        queue_handler = QueueHandler(self.output_queue)
-        queue_handler.setLevel(logging.INFO)
+        # GUI handler, fed by the listener thread
+        gui_handler = GUIHandler(self.output_queue)
+        gui_handler.setLevel(logging.INFO)
         
         # Try to add file handler too (with full format for file)
-        handlers = [queue_handler]
+        handlers = [gui_handler]
         try:
             os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
-            file_handler = logging.FileHandler(LOG_FILE)
+            file_handler = BufferedFileHandler(LOG_FILE)
             file_handler.setLevel(logging.INFO)
             file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
             file_handler.setFormatter(file_formatter)
@@ -95,9 +475,19 @@ class MeshtasticGUI:
         except:
             pass
         
+        # Callers only enqueue records; a single listener thread does the GUI and file output
+        log_queue = queue.Queue(-1)
+        self._log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+        
+        # Keep the bare message on the record; the listener's handlers add their own format
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        
         logging.basicConfig(
             level=logging.INFO,
-            handlers=handlers,
+            handlers=[queue_handler],
             force=True
         )
         
@@ -274,101 +664,66 @@ class MeshtasticGUI:
         ttk.Button(output_frame, text="Clear Output", 
                   command=self.clear_output).grid(row=1, column=0, pady=(5, 0), sticky=tk.E)
                   
+    @_ttl_cache(STATUS_PROBE_TTL)
+    def _probe_all(self):
+        """Run the batched package/service probe, reusing results for a couple of seconds"""
+        probe = {}
+        try:
+            # A plain (non-login) shell skips the profile scripts; pipx's bin dir is added by hand instead
+            local_bin = str(Path.home() / ".local" / "bin")
+            env = dict(os.environ, PATH=f"{local_bin}{os.pathsep}{os.environ.get('PATH', '')}")
+            # Values stay as bytes; the checks only compare short tokens
+            result = subprocess.run(["bash", "-c", STATUS_PROBE_SCRIPT],
+                                  capture_output=True, timeout=5, env=env)
+            for line in result.stdout.splitlines():
+                key, _, value = line.partition(b"=")
+                probe[key.decode()] = value.strip()
+        except (OSError, subprocess.SubprocessError) as e:
+            logging.error(f"Status probe failed: {e}")
+            
+        return probe
+        
+    @_ttl_cache(3.0)
     def check_python_cli_status(self):
         """Check if Meshtastic Python CLI is installed"""
-        try:
-            # Check if meshtastic command is available via pipx
-            result = subprocess.run(["meshtastic", "--version"], capture_output=True, text=True)
-            return result.returncode == 0
-        except:
-            try:
-                # Fallback: check if pipx has meshtastic installed
-                result = subprocess.run(["pipx", "list"], capture_output=True, text=True)
-                return "meshtastic" in result.stdout
-            except:
-                return False
+        probe = self._probe_all()
+        # Check if meshtastic command is on the PATH, falling back to pipx's package list
+        if probe.get("meshtastic_cli"):
+            return True
+        return probe.get("pipx_meshtastic", b"0") not in (b"", b"0")
 
+    @_ttl_cache(CLI_QUERY_TTL)
     def check_lora_region_status(self):
         """Check current LoRa region setting"""
         try:
             if not self.check_python_cli_status():
                 return "CLI Not Available"
                 
-            result = subprocess.run(
-                ["meshtastic", "--host", "localhost", "--get", "lora.region"],
-                capture_output=True, text=True, timeout=10
-            )
+            result = subprocess.run(REGION_QUERY_CMD, shell=True,
+                                  capture_output=True, text=True, timeout=10)
             
             if result.returncode == 0:
-                output = result.stdout.strip()
-                
-                # Log the raw output for debugging
-                logging.info(f"Raw CLI output for region: '{output}'")
-                
-                # Define region mapping for numeric values
-                region_map = {
-                    "0": "UNSET",
-                    "1": "US", 
-                    "2": "EU_433",
-                    "3": "EU_868",
-                    "4": "CN",
-                    "5": "JP",
-                    "6": "ANZ",
-                    "7": "KR",
-                    "8": "TW",
-                    "9": "RU",
-                    "10": "IN",
-                    "11": "NZ_865",
-                    "12": "TH",
-                    "13": "UA_433",
-                    "14": "UA_868",
-                    "15": "MY_433",
-                    "16": "MY_919",
-                    "17": "SG_923"
-                }
-                
-                # Valid region codes
-                valid_regions = ["UNSET", "US", "EU_868", "EU_433", "ANZ", "CN", "IN", "JP", "KR", 
-                               "MY_433", "MY_919", "RU", "SG_923", "TH", "TW", "UA_433", "UA_868"]
-                
-                lines = output.split('\n')
-                for line in lines:
-                    line = line.strip()
-                    
-                    # Skip empty lines and connection messages
-                    if not line or any(skip in line.lower() for skip in ['connected', 'requesting', 'node info']):
-                        continue
-                    
-                    # Check if line is just a region code
-                    if line in valid_regions:
-                        logging.info(f"Found direct region code: {line}")
-                        return line
-                    
-                    # Check for "lora.region: X" format
-                    if "lora.region:" in line:
-                        parts = line.split(":", 1)
-                        if len(parts) > 1:
-                            value = parts[1].strip()
-                            logging.info(f"Found lora.region value: '{value}'")
-                            
-                            # Check if it's a direct region code
-                            if value in valid_regions:
-                                return value
-                            
-                            # Check if it's a numeric value to map
-                            if value in region_map:
-                                mapped_region = region_map[value]
-                                logging.info(f"Mapped numeric value {value} to {mapped_region}")
-                                return mapped_region
-                    
-                    # Check for any numeric value that might be a region
-                    if line.isdigit() and line in region_map:
-                        mapped_region = region_map[line]
-                        logging.info(f"Found standalone numeric region {line} -> {mapped_region}")
-                        return mapped_region
+                line = result.stdout.strip()
+                
+                # Log the matched output for debugging
+                logging.info(f"CLI output for region: '{line}'")
+                
+                # Either "lora.region: X" or a bare region code/number
+                match = LORA_REGION_RE.search(line)
+                value = match.group(1) if match else line
+                
+                # Check if it's a direct region code
+                if value in VALID_REGIONS:
+                    return value
+                
+                # Check if it's a numeric value to map
+                mapped_region = REGION_MAP.get(value)
+                if mapped_region:
+                    logging.info(f"Mapped numeric value {value} to {mapped_region}")
+                    return mapped_region
                 
                 # If we get here, log what we couldn't parse
-                logging.warning(f"Could not parse region from output: '{output}'")
+                logging.warning(f"Could not parse region from output: '{line}'")
                 return "Unknown"
             else:
                 logging.error(f"CLI command failed with return code {result.returncode}")
@@ -377,12 +732,24 @@ class MeshtasticGUI:
             logging.error(f"Exception checking region status: {e}")
             return "Error"
 
+    @_ttl_cache(CLI_QUERY_TTL)
+    def get_python_cli_version(self):
+        """Get the installed Meshtastic CLI version, or None if it can't be run"""
+        try:
+            result = subprocess.run(["meshtastic", "--version"], capture_output=True, text=True, timeout=30)
+        except (OSError, subprocess.SubprocessError) as e:
+            logging.debug(f"meshtastic --version failed: {e}")
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip()
+
+    @_ttl_cache(3.0)
     def check_avahi_status(self):
         """Check if Avahi is installed and configured"""
         try:
             # Check if avahi-daemon is installed
-            result = subprocess.run(["dpkg", "-l", "avahi-daemon"], capture_output=True, text=True)
-            avahi_installed = result.returncode == 0 and "ii" in result.stdout
+            avahi_installed = self._pkg_probe_installed("avahi-daemon")
             
             if not avahi_installed:
                 return False
@@ -391,44 +758,46 @@ class MeshtasticGUI:
             service_file = "/etc/avahi/services/meshtastic.service"
             return os.path.exists(service_file)
             
-        except:
+        except (OSError, subprocess.SubprocessError) as e:
+            logging.debug(f"Avahi status probe failed: {e}")
             return False
-        """Check if Avahi is installed and configured"""
-        try:
-            # Check if avahi-daemon is installed
-            result = subprocess.run(["dpkg", "-l", "avahi-daemon"], capture_output=True, text=True)
-            avahi_installed = result.returncode == 0 and "ii" in result.stdout
             
-            if not avahi_installed:
-                return False
+    def _systemctl_status(self, unit):
+        """Get a unit's ActiveState and UnitFileState from the batched probe (unit must be in STATUS_PROBE_UNITS)"""
+        prefix = f"{unit}."
+        return {key[len(prefix):]: value for key, value in self._probe_all().items()
+                if key.startswith(prefix)}
                 
-            # Check if meshtastic service file exists
-            service_file = "/etc/avahi/services/meshtastic.service"
-            return os.path.exists(service_file)
-            
-        except:
-            return False
-            
+    def _pkg_probe_installed(self, package):
+        """Check the batched dpkg-query result for a package in STATUS_PROBE_PACKAGES"""
+        return b"install ok installed" in self._probe_all().get(package, b"")
+        
+    def _pkg_installed(self, name):
+        """Check whether a package is installed, trying its binary on PATH (and sbin) before asking dpkg"""
+        if shutil.which(name, path=f"{os.environ.get('PATH', '')}:/usr/sbin:/sbin"):
+            return True
+        if name in STATUS_PROBE_PACKAGES:
+            return self._pkg_probe_installed(name)
+        result = subprocess.run(["dpkg-query", "-W", "-f=${Status}", name],
+                              capture_output=True, text=True)
+        return result.stdout.startswith("install ok installed")
+        
+    @_ttl_cache(2.0)
     def check_meshtasticd_boot_status(self):
         """Check if meshtasticd is enabled to start on boot"""
-        try:
-            result = subprocess.run(["systemctl", "is-enabled", PKG_NAME], capture_output=True, text=True)
-            return result.returncode == 0 and result.stdout.strip() == "enabled"
-        except:
-            return False
+        return self._systemctl_status(PKG_NAME).get("UnitFileState") == b"enabled"
             
+    @_ttl_cache(2.0)
     def check_meshtasticd_service_status(self):
         """Check if meshtasticd service is currently running"""
-        try:
-            result = subprocess.run(["systemctl", "is-active", PKG_NAME], capture_output=True, text=True)
-            return result.returncode == 0 and result.stdout.strip() == "active"
-        except:
-            return False
+        return self._systemctl_status(PKG_NAME).get("ActiveState") == b"active"
                   
     def append_output(self, text):
         """Append text to output area"""
         self.output_text.config(state=tk.NORMAL)
         self.output_text.insert(tk.END, text + "\n")
+        # Keep the widget bounded so inserts stay cheap during long installs
+        self.output_text.delete("1.0", f"end-{OUTPUT_MAX_LINES} lines")
         self.output_text.see(tk.END)
         self.output_text.config(state=tk.DISABLED)
         
@@ -440,38 +809,209 @@ class MeshtasticGUI:
         
     def check_output_queue(self):
         """Check for new output messages"""
+        delay = 100
         try:
-            # Process all messages in queue
-            while True:
+            # Collect a batch of messages and insert them in one go
+            batch = []
+            while len(batch) < OUTPUT_BATCH_SIZE:
                 try:
-                    message = self.output_queue.get_nowait()
-                    self.append_output(message)
+                    batch.append(self.output_queue.get_nowait())
                 except queue.Empty:
                     break
                     
+            if batch:
+                self.append_output("\n".join(batch))
+            if len(batch) == OUTPUT_BATCH_SIZE:
+                # More is waiting; come back sooner
+                delay = 10
+                    
         except Exception as e:
             print(f"Error processing output queue: {e}")
         finally:
             # Schedule next check
-            self.root.after(100, self.check_output_queue)
+            self.root.after(delay, self.check_output_queue)
+            
+    def _pump_output(self, process, sinks, deadline=None):
+        """Feed each complete output line of process to its stream's sink until EOF.
+        
+        Raises subprocess.TimeoutExpired if the monotonic deadline passes first.
+        """
+        streams = {stream.fileno(): sink for stream, sink in sinks.items()}
+        partial = {fd: b"" for fd in streams}
+        while streams:
+            wait = 0.25
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    raise subprocess.TimeoutExpired(process.args, 0)
+            ready, _, _ = select.select(list(streams), [], [], wait)
+            for fd in ready:
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    # EOF: flush any unterminated last line
+                    if partial[fd].strip():
+                        streams[fd](partial[fd].decode(errors="replace").rstrip())
+                    del streams[fd]
+                    continue
+                *lines, partial[fd] = (partial[fd] + chunk).split(b"\n")
+                for line in lines:
+                    if line.strip():
+                        streams[fd](line.decode(errors="replace").rstrip())
+                        
+    def _watch_output(self, process, on_line, pattern, on_match, deadline):
+        """Log process stdout by line while watching the raw stream for pattern.
+        
+        Reads in bulk from a non-blocking pipe and scans the bytes as they arrive,
+        so prompts that don't end in a newline are still seen. Raises
+        subprocess.TimeoutExpired if the monotonic deadline passes first.
+        """
+        fd = process.stdout.fileno()
+        os.set_blocking(fd, False)
+        pending = bytearray()
+        while True:
+            wait = min(0.25, deadline - time.monotonic())
+            if wait <= 0:
+                raise subprocess.TimeoutExpired(process.args, 0)
+            ready, _, _ = select.select([fd], [], [], wait)
+            if not ready:
+                continue
+            try:
+                chunk = os.read(fd, 65536)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                # EOF: flush any unterminated last line
+                if pending.strip():
+                    on_line(pending.decode(errors="replace").rstrip())
+                return
+                
+            # Scan the unfinished line plus the new bytes, so a marker split across
+            # two reads is found, but only report matches that end in the new bytes
+            seen = len(pending)
+            pending += chunk
+            if any(match.end() > seen for match in pattern.finditer(pending)):
+                on_match()
+            *lines, rest = pending.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    on_line(line.decode(errors="replace").rstrip())
+            pending = bytearray(rest)
+            
+    def run_streamed(self, cmd: List[str], timeout, tail_lines=APT_OUTPUT_TAIL_LINES):
+        """Run cmd, logging its combined output live; returns (returncode, tail of the output).
+        
+        Raises subprocess.TimeoutExpired (after killing cmd) if it runs past timeout seconds.
+        """
+        tail = deque(maxlen=tail_lines)
+        
+        def on_line(line):
+            tail.append(line)
+            logging.info(f"Response: {line}")
+            
+        process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT)
+        try:
+            self._pump_output(process, {process.stdout: on_line},
+                              deadline=time.monotonic() + timeout)
+            returncode = process.wait()
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        finally:
+            process.stdout.close()
+        return returncode, "\n".join(tail)
+        
+    def _run_locked(self, worker, action):
+        """Run worker while holding ACTION_LOCK_FILE, or report that another action is in progress"""
+        fd = None
+        try:
+            try:
+                fd = os.open(ACTION_LOCK_FILE, os.O_RDONLY | os.O_CREAT, 0o666)
+            except PermissionError:
+                # Created by another user; flock only needs a read-only descriptor
+                fd = os.open(ACTION_LOCK_FILE, os.O_RDONLY)
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            logging.warning(f"⚠️ {action} skipped: another MeshAdv action is still running")
+            self.root.after(0, lambda: _messagebox().showwarning(
+                "Busy",
+                f"Another MeshAdv action is still running.\n"
+                f"Please wait for it to finish, then try the {action} again."
+            ))
+            return
+        except OSError as e:
+            if fd is not None:
+                os.close(fd)
+            logging.error(f"❌ {action} not started: could not lock {ACTION_LOCK_FILE}: {e}")
+            self.root.after(0, lambda err=e: _messagebox().showerror(
+                "Error",
+                f"Could not start the {action}: the lock file {ACTION_LOCK_FILE} is unusable.\n\n{err}"
+            ))
+            return
+        try:
+            worker()
+        finally:
+            os.close(fd)  # Also releases the lock
+            
+    def _mesh_interface_class(self):
+        """Get meshtastic's TCPInterface class, or None if the meshtastic library isn't importable"""
+        if self._mesh_iface_class is None and not self._mesh_import_failed:
+            try:
+                from meshtastic.tcp_interface import TCPInterface
+            except ImportError:
+                # The CLI is normally installed with pipx, out of reach of this interpreter
+                logging.debug("meshtastic library not importable, using the CLI")
+                self._mesh_import_failed = True
+                return None
+            self._mesh_iface_class = TCPInterface
+        return self._mesh_iface_class
+        
+    def _run_mesh_action(self, action):
+        """Run action(iface) in-process; returns False if the caller should use the CLI instead.
+        
+        Each action gets its own connection, opened with the node's current config and closed
+        afterwards, like a CLI run: meshtasticd serves one API client at a time, and a config
+        section written back from an older connection would undo other clients' changes.
+        """
+        iface_class = self._mesh_interface_class()
+        if iface_class is None:
+            return False
+        iface = None
+        try:
+            iface = iface_class(hostname="localhost")
+            action(iface)
+            return True
+        except Exception as e:
+            logging.warning(f"⚠️ In-process meshtastic call failed ({e}), falling back to the CLI")
+            return False
+        finally:
+            if iface is not None:
+                try:
+                    iface.close()
+                except Exception as e:
+                    logging.debug(f"Closing meshtastic interface failed: {e}")
             
     def run_command_async(self, cmd: List[str], callback=None):
         """Run command in background thread"""
         def worker():
             try:
                 logging.info(f"Running command: {' '.join(cmd)}")
-                result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+                process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
                 
-                if result.returncode == 0:
-                    if result.stdout.strip():
-                        logging.info(f"Command output: {result.stdout.strip()}")
-                else:
-                    logging.error(f"Command failed with code {result.returncode}")
-                    if result.stderr.strip():
-                        logging.error(f"Error: {result.stderr.strip()}")
+                # Log output line by line as it arrives instead of after the command exits
+                self._pump_output(process, {process.stdout: logging.info,
+                                            process.stderr: logging.warning})
+                returncode = process.wait()
+                process.stdout.close()
+                process.stderr.close()
+                
+                if returncode != 0:
+                    logging.error(f"Command failed with code {returncode}")
                         
                 if callback:
-                    self.root.after(0, callback, result.returncode == 0)
+                    self.root.after(0, callback, returncode == 0)
                     
             except Exception as e:
                 logging.error(f"Command exception: {e}")
@@ -485,126 +1025,137 @@ class MeshtasticGUI:
         # Detect Pi model
         try:
             if os.path.exists("/proc/device-tree/model"):
-                with open("/proc/device-tree/model", "r") as f:
-                    self.pi_model = f.read().strip().replace('\x00', '')
-        except:
-            pass
+                self.pi_model = _read_dt("/proc/device-tree/model").strip()
+        except OSError as e:
+            logging.debug(f"Pi model detection failed: {e}")
             
         # Detect HAT
         try:
             hat_info = {}
             if os.path.exists("/proc/device-tree/hat/product"):
-                with open("/proc/device-tree/hat/product", "r") as f:
-                    hat_info["product"] = f.read().strip().replace('\x00', '')
+                hat_info["product"] = _read_dt("/proc/device-tree/hat/product").strip()
             if os.path.exists("/proc/device-tree/hat/vendor"):
-                with open("/proc/device-tree/hat/vendor", "r") as f:
-                    hat_info["vendor"] = f.read().strip().replace('\x00', '')
+                hat_info["vendor"] = _read_dt("/proc/device-tree/hat/vendor").strip()
             if hat_info:
                 self.hat_info = hat_info
-        except:
-            pass
+        except OSError as e:
+            logging.debug(f"HAT detection failed: {e}")
             
+        # enable_uart=1 is required on all Pi models; Pi 5 also needs the uart0 overlay
+        if self.is_pi5:
+            self._required_uart_tokens = (b"enable_uart=1", b"dtoverlay=uart0")
+        else:
+            self._required_uart_tokens = (b"enable_uart=1",)
+            
+    @functools.cached_property
     def is_pi5(self) -> bool:
-        """Check if this is a Raspberry Pi 5"""
-        if self.pi_model:
-            return "Raspberry Pi 5" in self.pi_model
-        return False
+        """Check if this is a Raspberry Pi 5 (the model can't change while we're running)"""
+        return "Raspberry Pi 5" in (self.pi_model or "")
         
+    @_ttl_cache(3.0)
     def check_meshtasticd_status(self):
         """Check if meshtasticd is installed"""
         try:
             # First check with dpkg
-            result = subprocess.run(["dpkg", "-l", PKG_NAME], capture_output=True, text=True)
-            dpkg_installed = result.returncode == 0 and "ii" in result.stdout
+            probe = self._probe_all()
+            dpkg_installed = self._pkg_probe_installed(PKG_NAME)
             
             # Also check if the binary exists
             binary_exists = os.path.exists("/usr/sbin/meshtasticd") or os.path.exists("/usr/bin/meshtasticd")
             
-            # Check with which command as fallback
-            which_found = False
-            try:
-                result = subprocess.run(["which", PKG_NAME], capture_output=True, text=True)
-                which_found = result.returncode == 0
-            except:
-                pass
+            # Check the PATH lookup as fallback
+            which_found = bool(probe.get("meshtasticd_bin"))
             
             return dpkg_installed or binary_exists or which_found
-        except:
+        except (OSError, subprocess.SubprocessError) as e:
+            logging.debug(f"meshtasticd status probe failed: {e}")
             return False
             
-    def check_spi_status(self):
+    def _read_config_txt(self):
+        """Scan config.txt for status directives, reusing the result while its mtime is unchanged"""
+        st = os.stat(BOOT_CONFIG_FILE)
+        if st.st_mtime != self._config_txt_mtime:
+            found = frozenset()
+            if st.st_size:
+                # Match straight out of the page cache; no copy or decode into a str
+                fd = os.open(BOOT_CONFIG_FILE, os.O_RDONLY)
+                try:
+                    with mmap.mmap(fd, 0, prot=mmap.PROT_READ) as mm:
+                        found = frozenset(BOOT_CONFIG_TOKEN_RE.findall(mm))
+                finally:
+                    os.close(fd)
+            self._config_txt_tokens = found
+            self._config_txt_mtime = st.st_mtime
+        return self._config_txt_tokens
+        
+    def _read_config_tokens(self):
+        """Return the set of status-relevant directives present in config.txt"""
+        try:
+            return self._read_config_txt()
+        except OSError as e:
+            logging.debug(f"config.txt probe failed: {e}")
+            return frozenset()
+            
+    def _dev_node_exists(self, prefix):
+        """Check for a /dev entry starting with prefix using a single directory scan"""
+        try:
+            with os.scandir("/dev") as entries:
+                return any(entry.name.startswith(prefix) for entry in entries)
+        except OSError:
+            return False
+            
+    @_ttl_cache(2.0)
+    def check_spi_status(self, config_tokens=None):
         """Check if SPI is enabled in config and devices exist"""
         # Check if devices exist
-        devices_exist = os.path.exists("/dev/spidev0.0") or os.path.exists("/dev/spidev0.1")
+        devices_exist = self._dev_node_exists("spidev")
         
         # Check if configured in boot config
-        config_enabled = False
-        try:
-            with open("/boot/firmware/config.txt", "r") as f:
-                config_content = f.read()
-            # Check for both SPI parameters
-            has_spi_param = "dtparam=spi=on" in config_content
-            has_spi_overlay = "dtoverlay=spi0-0cs" in config_content
-            config_enabled = has_spi_param and has_spi_overlay
-        except:
-            pass
+        if config_tokens is None:
+            config_tokens = self._read_config_tokens()
+        # Check for both SPI parameters
+        has_spi_param = b"dtparam=spi=on" in config_tokens
+        has_spi_overlay = b"dtoverlay=spi0-0cs" in config_tokens
+        config_enabled = has_spi_param and has_spi_overlay
             
         return devices_exist and config_enabled
         
-    def check_i2c_status(self):
+    @_ttl_cache(2.0)
+    def check_i2c_status(self, config_tokens=None):
         """Check if I2C is enabled in config and devices exist"""
         # Check if devices exist
-        devices_exist = any(os.path.exists(f"/dev/i2c-{i}") for i in range(0, 10))
+        devices_exist = self._dev_node_exists("i2c-")
         
         # Check if configured in boot config
-        config_enabled = False
-        try:
-            with open("/boot/firmware/config.txt", "r") as f:
-                config_content = f.read()
-            config_enabled = "dtparam=i2c_arm=on" in config_content
-        except:
-            pass
+        if config_tokens is None:
+            config_tokens = self._read_config_tokens()
+        config_enabled = b"dtparam=i2c_arm=on" in config_tokens
             
         return devices_exist and config_enabled
         
-    def check_gps_uart_status(self):
+    @_ttl_cache(2.0)
+    def check_gps_uart_status(self, config_tokens=None):
         """Check if GPS/UART is enabled in config"""
-        try:
-            with open("/boot/firmware/config.txt", "r") as f:
-                config_content = f.read()
-            
-            # Check for enable_uart=1 (required for all Pi models)
-            has_uart_enabled = "enable_uart=1" in config_content
-            
-            # For Pi 5, also check for uart0 overlay
-            if self.is_pi5():
-                has_uart0_overlay = "dtoverlay=uart0" in config_content
-                return has_uart_enabled and has_uart0_overlay
-            else:
-                # For Pi 4 and earlier, only enable_uart=1 is needed
-                return has_uart_enabled
-                
-        except:
-            return False
+        if config_tokens is None:
+            config_tokens = self._read_config_tokens()
         
-    def check_hat_specific_status(self):
+        # Required directives were chosen for this Pi model in detect_hardware
+        return all(token in config_tokens for token in self._required_uart_tokens)
+        
+    def check_hat_specific_status(self, config_tokens=None):
         """Check if HAT specific options are configured"""
         if not self.hat_info or self.hat_info.get('product') != 'MeshAdv Mini':
             return False
             
-        # Check for GPIO and PPS configuration
-        try:
-            # Check if GPIO pins are configured in config.txt
-            with open("/boot/firmware/config.txt", "r") as f:
-                config_content = f.read()
-                
-            # Look for MeshAdv Mini specific configurations
-            has_gpio_config = "gpio=4=op,dh" in config_content
-            has_pps_config = "pps-gpio,gpiopin=17" in config_content
+        # Check for GPIO and PPS configuration in config.txt
+        if config_tokens is None:
+            config_tokens = self._read_config_tokens()
             
-            return has_gpio_config and has_pps_config
-        except:
-            return False
+        # Look for MeshAdv Mini specific configurations
+        has_gpio_config = b"gpio=4=op,dh" in config_tokens
+        has_pps_config = b"dtoverlay=pps-gpio,gpiopin=17" in config_tokens
+        
+        return has_gpio_config and has_pps_config
             
     def check_hat_config_status(self):
         """Check if HAT config file exists in config.d"""
@@ -613,10 +1164,12 @@ class MeshtasticGUI:
             return False
             
         try:
-            # Check if any config files exist in config.d
-            config_files = list(Path(config_d_dir).glob("*.yaml"))
-            return len(config_files) > 0
-        except:
+            # Check if any config files exist in config.d, stopping at the first one
+            with os.scandir(config_d_dir) as entries:
+                return any(entry.name.endswith(".yaml") and entry.is_file(follow_symlinks=False)
+                           for entry in entries)
+        except OSError as e:
+            logging.debug(f"config.d probe failed: {e}")
             return False
             
     def check_config_exists(self):
@@ -625,92 +1178,289 @@ class MeshtasticGUI:
                 os.path.exists(f"{CONFIG_DIR}/config.json"))
                 
     def update_status_indicators(self):
-        """Update all status indicators"""
+        """Request a background refresh of all status indicators"""
+        # Callers refresh after changing something, so don't serve stale probes; slow CLI
+        # queries are kept, since whatever changes them drops them itself
+        self._invalidate_status_cache(keep=CLI_QUERY_CHECKS)
+        self.status_refresh_event.set()
+        
+    def request_status_update(self):
+        """Schedule a status refresh, collapsing requests that arrive in quick succession"""
+        if self._status_update_pending:
+            return
+        self._status_update_pending = True
+        self.root.after(STATUS_DEBOUNCE_MS, self._do_status_update)
+        
+    def _do_status_update(self):
+        """Run the refresh scheduled by request_status_update"""
+        self._status_update_pending = False
+        self.update_status_indicators()
+        
+    def _invalidate_status_cache(self, *names, keep=()):
+        """Drop memoised probe results after something may have changed.
+        
+        With method names, only those entries are dropped; otherwise everything
+        except the methods listed in keep is.
+        """
+        if not names and not keep:
+            self._status_cache.clear()
+            return
+        for key in list(self._status_cache):
+            if (key[0] in names) if names else (key[0] not in keep):
+                self._status_cache.pop(key, None)
+        
+    def _status_worker(self):
+        """Run status probes off the Tk thread whenever a refresh is requested"""
+        while True:
+            self.status_refresh_event.wait()
+            self.status_refresh_event.clear()
+            try:
+                for update in self._collect_status_updates():
+                    self.status_queue.put(update)
+            except Exception as e:
+                logging.error(f"Error updating status indicators: {e}")
+                
+    def _status_watch_worker(self):
+        """Refresh status whenever config.txt, the meshtasticd config or systemd state changes"""
+        inotify_fd = -1
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            inotify_fd = libc.inotify_init1(os.O_CLOEXEC)
+            if inotify_fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            watched = [path for path in STATUS_WATCH_DIRS
+                       if libc.inotify_add_watch(inotify_fd, os.fsencode(path), INOTIFY_MASK) >= 0]
+            if not watched:
+                raise OSError("no status paths could be watched")
+                
+            # Block until the kernel reports a change; the refresh event coalesces bursts
+            try:
+                while True:
+                    os.read(inotify_fd, 4096)
+                    self.update_status_indicators()
+            finally:
+                os.close(inotify_fd)
+                inotify_fd = -1
+        except (OSError, AttributeError) as e:
+            if inotify_fd >= 0:
+                os.close(inotify_fd)
+            logging.debug(f"inotify unavailable ({e}), polling for status changes")
+            self._poll_status_paths()
+            
+    def _poll_status_paths(self):
+        """Fallback for _status_watch_worker: compare mtimes of the watched paths"""
+        def snapshot():
+            mtimes = []
+            for path in STATUS_WATCH_DIRS:
+                try:
+                    mtimes.append(os.stat(path).st_mtime)
+                except OSError:
+                    mtimes.append(None)
+            return mtimes
+            
+        last = snapshot()
+        while True:
+            time.sleep(STATUS_POLL_INTERVAL)
+            current = snapshot()
+            if current != last:
+                last = current
+                self.update_status_indicators()
+                
+    def _drain_status_queue(self):
+        """Apply status label updates posted by the status worker"""
+        try:
+            changed = False
+            while True:
+                try:
+                    name, text, color = self.status_queue.get_nowait()
+                except queue.Empty:
+                    break
+                changed |= self._set_status(name, text, color)
+            # Redraw once for the whole batch rather than per label
+            if changed:
+                self.root.tk.call('update', 'idletasks')
+        except Exception as e:
+            print(f"Error processing status queue: {e}")
+        finally:
+            self.root.after(150, self._drain_status_queue)
+            
+    def _set_status(self, name, text, color):
+        """Configure a status label, skipping the Tk call if nothing changed"""
+        if self._last_status.get(name) == (text, color):
+            return False
+        self._last_status[name] = (text, color)
+        getattr(self, name).config(text=text, foreground=color)
+        return True
+        
+    def _collect_status_updates(self):
+        """Run all status checks, yielding (label, text, color) updates as they complete"""
+        # Read config.txt once for all of the boot config checks
+        config_tokens = self._read_config_tokens()
+        
+        # Warm the shared package/service probe, then run the independent checks concurrently
+        self._probe_all()
+        pool = self._probe_pool
+        results = {
+            "meshtasticd": pool.submit(self.check_meshtasticd_status),
+            "spi": pool.submit(self.check_spi_status, config_tokens),
+            "i2c": pool.submit(self.check_i2c_status, config_tokens),
+            "gps_uart": pool.submit(self.check_gps_uart_status, config_tokens),
+            "hat_specific": pool.submit(self.check_hat_specific_status, config_tokens),
+            "hat_config": pool.submit(self.check_hat_config_status),
+            "config_exists": pool.submit(self.check_config_exists),
+            "python_cli": pool.submit(self.check_python_cli_status),
+            "avahi": pool.submit(self.check_avahi_status),
+            "boot": pool.submit(self.check_meshtasticd_boot_status),
+            "service": pool.submit(self.check_meshtasticd_service_status),
+            "region": pool.submit(self.check_lora_region_status),
+        }
+        
         # Status 1: meshtasticd
-        if self.check_meshtasticd_status():
-            self.status1.config(text="Installed", foreground="green")
+        if results["meshtasticd"].result():
+            yield ("status1", "Installed", "green")
         else:
-            self.status1.config(text="Not Installed", foreground="red")
+            yield ("status1", "Not Installed", "red")
             
         # Status 2: SPI
-        if self.check_spi_status():
-            self.status2.config(text="Enabled", foreground="green")
+        if results["spi"].result():
+            yield ("status2", "Enabled", "green")
         else:
-            self.status2.config(text="Disabled", foreground="red")
+            yield ("status2", "Disabled", "red")
             
         # Status 3: I2C
-        if self.check_i2c_status():
-            self.status3.config(text="Enabled", foreground="green")
+        if results["i2c"].result():
+            yield ("status3", "Enabled", "green")
         else:
-            self.status3.config(text="Disabled", foreground="red")
+            yield ("status3", "Disabled", "red")
             
         # Status 3.5: GPS/UART
-        if self.check_gps_uart_status():
-            self.status3_5.config(text="Enabled", foreground="green")
+        if results["gps_uart"].result():
+            yield ("status3_5", "Enabled", "green")
         else:
-            self.status3_5.config(text="Disabled", foreground="red")
+            yield ("status3_5", "Disabled", "red")
             
         # Status 4: HAT Specific
-        if self.check_hat_specific_status():
-            self.status4.config(text="Configured", foreground="green")
+        if results["hat_specific"].result():
+            yield ("status4", "Configured", "green")
         else:
-            self.status4.config(text="Not Configured", foreground="red")
+            yield ("status4", "Not Configured", "red")
             
         # Status 5: HAT Config
-        if self.check_hat_config_status():
-            self.status5.config(text="Set", foreground="green")
+        if results["hat_config"].result():
+            yield ("status5", "Set", "green")
         else:
-            self.status5.config(text="Not Set", foreground="red")
+            yield ("status5", "Not Set", "red")
             
         # Status 6: Config exists
-        if self.check_config_exists():
-            self.status6.config(text="Exists", foreground="green")
+        if results["config_exists"].result():
+            yield ("status6", "Exists", "green")
         else:
-            self.status6.config(text="Missing", foreground="red")
+            yield ("status6", "Missing", "red")
             
         # Status Python CLI: Python CLI installation
-        if self.check_python_cli_status():
-            self.status_python_cli.config(text="Installed", foreground="green")
+        if results["python_cli"].result():
+            yield ("status_python_cli", "Installed", "green")
             # Update send message status when CLI is available
-            self.status_send_message.config(text="Ready", foreground="green")
-        else:
-            self.status_python_cli.config(text="Not Installed", foreground="red")
-            self.status_send_message.config(text="CLI Required", foreground="red")
-            
-        # Status Region: LoRa region setting
-        region_status = self.check_lora_region_status()
-        if region_status == "UNSET":
-            self.status_region.config(text="UNSET", foreground="red")
-        elif region_status in ["US", "EU_868", "EU_433", "ANZ", "CN", "IN", "JP", "KR", 
-                               "MY_433", "MY_919", "RU", "SG_923", "TH", "TW", "UA_433", "UA_868"]:
-            self.status_region.config(text=region_status, foreground="green")
-        elif region_status == "CLI Not Available":
-            self.status_region.config(text="CLI Required", foreground="red")
-        elif region_status == "Error":
-            self.status_region.config(text="Error", foreground="orange")
+            yield ("status_send_message", "Ready", "green")
         else:
-            # Show the actual region code even if it's not in our common list
-            self.status_region.config(text=region_status, foreground="blue")
+            yield ("status_python_cli", "Not Installed", "red")
+            yield ("status_send_message", "CLI Required", "red")
             
         # Status Avahi: Avahi service
-        if self.check_avahi_status():
-            self.status_avahi.config(text="Enabled", foreground="green")
+        if results["avahi"].result():
+            yield ("status_avahi", "Enabled", "green")
         else:
-            self.status_avahi.config(text="Disabled", foreground="red")
+            yield ("status_avahi", "Disabled", "red")
             
         # Status Boot: meshtasticd boot enable
-        if self.check_meshtasticd_boot_status():
-            self.status_boot.config(text="Enabled", foreground="green")
+        if results["boot"].result():
+            yield ("status_boot", "Enabled", "green")
         else:
-            self.status_boot.config(text="Disabled", foreground="red")
+            yield ("status_boot", "Disabled", "red")
             
         # Status Service: meshtasticd service running
-        if self.check_meshtasticd_service_status():
-            self.status_service.config(text="Running", foreground="green")
+        if results["service"].result():
+            yield ("status_service", "Running", "green")
         else:
-            self.status_service.config(text="Stopped", foreground="red")
+            yield ("status_service", "Stopped", "red")
+            
+        # Status Region: LoRa region setting (last, as the CLI query is by far the slowest)
+        region_status = results["region"].result()
+        if region_status == "UNSET":
+            yield ("status_region", "UNSET", "red")
+        elif region_status in VALID_REGIONS:
+            yield ("status_region", region_status, "green")
+        elif region_status == "CLI Not Available":
+            yield ("status_region", "CLI Required", "red")
+        elif region_status == "Error":
+            yield ("status_region", "Error", "orange")
+        else:
+            # Show the actual region code even if it's not in our common list
+            yield ("status_region", region_status, "blue")
 
     # APT Lock Handling Methods
+    def _is_locked(self, path):
+        """Check whether a dpkg/apt lock file is currently held by another process"""
+        try:
+            # lockf() needs the file open for writing, which only works as root
+            fd = os.open(path, os.O_RDWR)
+        except PermissionError:
+            # Not root: look the file up in the kernel's table of held locks instead
+            try:
+                st = os.stat(path)
+                lock_id = f"{os.major(st.st_dev):02x}:{os.minor(st.st_dev):02x}:{st.st_ino}"
+                with open("/proc/locks", "r") as f:
+                    return any(lock_id in line.split() for line in f)
+            except OSError as e:
+                logging.debug(f"Could not check lock {path}: {e}")
+                return False
+        except OSError as e:
+            logging.debug(f"Could not open lock {path}: {e}")
+            return False
+            
+        try:
+            # dpkg and apt take fcntl (F_SETLK) locks, which is what lockf() uses
+            fcntl.lockf(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except (BlockingIOError, PermissionError):
+            return True
+        else:
+            fcntl.lockf(fd, fcntl.LOCK_UN)
+            return False
+        finally:
+            os.close(fd)
+            
+    def _find_apt_processes(self):
+        """Return the PIDs of running apt/apt-get/dpkg processes"""
+        pids = []
+        with os.scandir("/proc") as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f"/proc/{entry.name}/comm", "r") as f:
+                        if f.read().strip() in ("apt", "apt-get", "dpkg"):
+                            pids.append(entry.name)
+                except OSError:
+                    # Process exited while we were scanning
+                    continue
+        return pids
+        
+    def _kill_apt_processes(self):
+        """Kill any running apt/apt-get/dpkg processes with a single sudo kill"""
+        pids = self._find_apt_processes()
+        if pids:
+            subprocess.run(["sudo", "kill", "-9", *pids], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return pids
+        
+    def _wait_until(self, condition, timeout=2.0, interval=0.05):
+        """Poll condition until it holds or timeout expires; returns its final value"""
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+        return True
+        
     def check_and_fix_apt_locks(self):
         """Check for and attempt to fix apt lock issues"""
         try:
@@ -722,7 +1472,7 @@ class MeshtasticGUI:
                 logging.warning("⚠️ dpkg appears to be interrupted, attempting to fix...")
                 # Try to configure any interrupted packages
                 result = subprocess.run(["sudo", "dpkg", "--configure", "-a"], 
-                                      capture_output=True, text=True, 
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, 
                                       input="n\n", timeout=60)  # Default to keep current config
                 if result.returncode == 0:
                     logging.info("✅ dpkg configuration completed")
@@ -738,36 +1488,27 @@ class MeshtasticGUI:
             
             locks_found = []
             for lock_file in lock_files:
-                if os.path.exists(lock_file):
-                    try:
-                        # Try to see if the lock is actually held
-                        result = subprocess.run(["sudo", "lsof", lock_file], 
-                                              capture_output=True, text=True)
-                        if result.returncode == 0 and result.stdout.strip():
-                            locks_found.append(lock_file)
-                            logging.warning(f"⚠️ Lock file {lock_file} is held by process")
-                    except:
-                        pass
+                # Try to see if the lock is actually held
+                if os.path.exists(lock_file) and self._is_locked(lock_file):
+                    locks_found.append(lock_file)
+                    logging.warning(f"⚠️ Lock file {lock_file} is held by process")
             
             if locks_found:
                 logging.info("Attempting to kill apt-related processes...")
                 # Kill any hanging apt processes
-                subprocess.run(["sudo", "killall", "-9", "apt", "apt-get", "dpkg"], 
-                             capture_output=True, text=True)
+                self._kill_apt_processes()
                 
-                # Wait a moment for processes to die
-                time.sleep(2)
+                # Wait until the locks are released, rather than a fixed pause
+                self._wait_until(lambda: not any(self._is_locked(lock_file) for lock_file in locks_found))
                 
                 # Remove stale lock files if no processes are using them
                 for lock_file in locks_found:
                     try:
-                        result = subprocess.run(["sudo", "lsof", lock_file], 
-                                              capture_output=True, text=True)
-                        if result.returncode != 0:  # No process using the lock
+                        if not self._is_locked(lock_file):  # No process holding the lock
                             subprocess.run(["sudo", "rm", "-f", lock_file], check=True)
                             logging.info(f"✅ Removed stale lock file: {lock_file}")
-                    except:
-                        pass
+                    except subprocess.CalledProcessError as e:
+                        logging.warning(f"⚠️ Could not remove lock file {lock_file}: {e}")
             
             return True
             
@@ -775,10 +1516,47 @@ class MeshtasticGUI:
             logging.error(f"Error checking/fixing apt locks: {e}")
             return False
 
+    def _run_apt_streamed(self, cmd_args, timeout, interactive_input=None):
+        """Run an apt command with live logging, keeping only the tail of its output"""
+        stdout_tail = deque(maxlen=APT_OUTPUT_TAIL_LINES)
+        stderr_tail = deque(maxlen=APT_OUTPUT_TAIL_LINES)
+        
+        def log_stdout(line):
+            stdout_tail.append(line)
+            logging.info(line)
+            
+        def log_stderr(line):
+            stderr_tail.append(line)
+            logging.warning(line)
+            
+        process = subprocess.Popen(cmd_args, stdin=subprocess.PIPE if interactive_input else subprocess.DEVNULL,
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            if interactive_input:
+                # Answers are tiny, so this never blocks on the pipe buffer
+                process.stdin.write(interactive_input.encode())
+                process.stdin.close()
+            self._pump_output(process, {process.stdout: log_stdout, process.stderr: log_stderr},
+                              deadline=time.monotonic() + timeout)
+            returncode = process.wait()
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise subprocess.TimeoutExpired(cmd_args, timeout)
+        finally:
+            process.stdout.close()
+            process.stderr.close()
+            
+        return subprocess.CompletedProcess(cmd_args, returncode,
+                                           "\n".join(stdout_tail), "\n".join(stderr_tail))
+        
     def safe_apt_command(self, cmd_args, timeout=300, interactive_input=None):
         """Run apt command with better error handling and lock detection"""
-        max_retries = 3
-        retry_delay = 10
+        max_retries = 6
+        # Exponential backoff with jitter: ~0.5s, 1s, 2s, 4s, 8s between attempts, capped
+        base_delay = 0.5
+        backoff = 2.0
+        max_delay = 30
         
         for attempt in range(max_retries):
             try:
@@ -786,18 +1564,14 @@ class MeshtasticGUI:
                     logging.info(f"Retry attempt {attempt + 1}/{max_retries} for apt command...")
                     # Check and fix locks before retry
                     self.check_and_fix_apt_locks()
-                    time.sleep(retry_delay)
+                    delay = min(max_delay, base_delay * (backoff ** (attempt - 1))) + random.random() * 0.25
+                    time.sleep(delay)
                 
-                # Run the command
-                if interactive_input:
-                    result = subprocess.run(cmd_args, capture_output=True, text=True, 
-                                          timeout=timeout, input=interactive_input)
-                else:
-                    result = subprocess.run(cmd_args, capture_output=True, text=True, 
-                                          timeout=timeout)
+                # Run the command, streaming its output to the log as it arrives
+                result = self._run_apt_streamed(cmd_args, timeout, interactive_input)
                 
                 # Check for lock-related errors
-                if "Could not get lock" in result.stderr or "dpkg was interrupted" in result.stderr:
+                if APT_LOCK_RE.search(result.stderr):
                     if attempt < max_retries - 1:
                         logging.warning(f"⚠️ Lock detected on attempt {attempt + 1}, will retry...")
                         continue
@@ -810,9 +1584,9 @@ class MeshtasticGUI:
             except subprocess.TimeoutExpired:
                 logging.warning(f"⚠️ Command timed out on attempt {attempt + 1}")
                 if attempt < max_retries - 1:
-                    # Kill any hanging processes
-                    subprocess.run(["sudo", "killall", "-9", "apt", "apt-get", "dpkg"], 
-                                 capture_output=True, text=True)
+                    # Kill any hanging processes and wait for them to exit
+                    if self._kill_apt_processes():
+                        self._wait_until(lambda: not self._find_apt_processes())
                     continue
                 else:
                     logging.error("❌ Command timed out after all retries")
@@ -827,11 +1601,17 @@ class MeshtasticGUI:
         
         return None
 
-    def get_config_file_choice(self):
-        """Get user's choice for config file handling during installation"""
-        choice_made = threading.Event()
-        user_choice = {'value': 'n'}  # Default to keep current config
+    def get_config_file_choice(self, on_result):
+        """Ask for the config file choice during installation; on_result(choice) runs on the Tk thread"""
+        answered = {'done': False}
         
+        def finish(value):
+            # The first of a button press or the timeout wins
+            if answered['done']:
+                return
+            answered['done'] = True
+            self.root.after(0, on_result, value)
+            
         def show_config_dialog():
             config_window = tk.Toplevel(self.root)
             config_window.title("Configuration File Conflict")
@@ -906,42 +1686,155 @@ Choose what to do:"""
             button_frame.pack(pady=20)
             
             def apply_choice():
-                user_choice['value'] = selected_choice.get()
-                choice_made.set()
+                finish(selected_choice.get())
                 config_window.destroy()
             
             def cancel_install():
-                user_choice['value'] = 'cancel'
-                choice_made.set()
+                finish('cancel')
                 config_window.destroy()
+                
+            def choice_timed_out():
+                if not answered['done'] and config_window.winfo_exists():
+                    logging.warning("Config choice dialog timed out, using default (keep current)")
+                    finish('n')  # Default to keep current config
+                    config_window.destroy()
             
             ttk.Button(button_frame, text="Apply Choice", 
                       command=apply_choice).pack(side=tk.LEFT, padx=10)
             ttk.Button(button_frame, text="Cancel Installation", 
                       command=cancel_install).pack(side=tk.LEFT, padx=10)
+            
+            self.root.after(CONFIG_CHOICE_TIMEOUT_MS, choice_timed_out)
         
-        # Show dialog in main thread
+        # Show dialog in main thread; the caller carries on instead of waiting for it
         self.root.after(0, show_config_dialog)
-        
-        # Wait for user choice (with timeout)
-        if choice_made.wait(timeout=300):  # 5 minute timeout
-            return user_choice['value']
-        else:
-            logging.warning("Config choice dialog timed out, using default (keep current)")
-            return 'n'
             
     # Button handlers
     def handle_install_remove(self):
         """Handle install/remove meshtasticd"""
         if self.check_meshtasticd_status():
             # Show remove dialog
-            if messagebox.askyesno("Remove Meshtasticd", 
+            if _messagebox().askyesno("Remove Meshtasticd", 
                                  "Meshtasticd is currently installed. Do you want to remove it?"):
                 self.remove_meshtasticd()
         else:
             # Show install dialog
             self.install_meshtasticd()
             
+    def _read_boot_config(self):
+        """Read config.txt (world-readable) directly, returning its content and set of active lines.
+        
+        The cached copy is reused while the file's mtime and size are unchanged; the size
+        catches rewrites within vfat's 2 second mtime granularity.
+        """
+        st = os.stat(BOOT_CONFIG_FILE)
+        key = (st.st_mtime_ns, st.st_size)
+        if key != self._config_cache['stat']:
+            with open(BOOT_CONFIG_FILE, "r") as f:
+                content = f.read()
+            # Whole stripped lines, so "dtoverlay=uart0" doesn't match "dtoverlay=uart0-pi5"
+            self._config_cache['content'] = content
+            self._config_cache['lines'] = frozenset(
+                stripped for stripped in (line.strip() for line in content.splitlines())
+                if stripped and not stripped.startswith("#")
+            )
+            self._config_cache['stat'] = key
+        return self._config_cache['content'], self._config_cache['lines']
+        
+    def _backup_boot_config(self, content):
+        """Back up config.txt once per session, before the first change we make to it.
+        
+        content is the file as just read by _read_boot_config, so the backup is
+        written from memory rather than read back from disk by cp.
+        """
+        if self._boot_backup_file:
+            logging.info(f"config.txt already backed up to {self._boot_backup_file}")
+            return
+        backup_file = f"{BOOT_CONFIG_FILE}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        if os.geteuid() == 0:
+            shutil.copy2(BOOT_CONFIG_FILE, backup_file)
+        else:
+            # Same mode as config.txt, matching what copy2 gives the root branch
+            subprocess.run(["sudo", "install", "-m", self._boot_config_mode(), "/dev/stdin", backup_file],
+                           input=content, text=True, check=True)
+        self._boot_backup_file = backup_file
+        logging.info(f"Backed up config.txt to {backup_file}")
+        
+    def _boot_config_mode(self):
+        """config.txt's current permission bits as an octal string for install -m (0644 if it's missing)"""
+        try:
+            return f"{os.stat(BOOT_CONFIG_FILE).st_mode & 0o7777:04o}"
+        except OSError:
+            return "0644"
+            
+    def _write_boot_config(self, content):
+        """Replace config.txt atomically: stage next to it, then rename over it"""
+        # Same directory, so the rename never crosses filesystems
+        boot_dir, config_name = os.path.split(BOOT_CONFIG_FILE)
+        staged_file = os.path.join(boot_dir, f".{config_name}.tmp")
+        try:
+            if os.geteuid() == 0:
+                # Already root: no sudo processes needed at all
+                with open(staged_file, "w") as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(staged_file, BOOT_CONFIG_FILE)
+            else:
+                # Keep config.txt's own mode, as the old in-place tee did
+                subprocess.run(["sudo", "install", "-m", self._boot_config_mode(), "/dev/stdin", staged_file],
+                               input=content, text=True, check=True)
+                subprocess.run(["sudo", "mv", "-f", staged_file, BOOT_CONFIG_FILE], check=True)
+        finally:
+            self._config_cache['stat'] = None
+            
+    def queue_boot_config_lines(self, lines):
+        """Queue config.txt lines for the next flush_boot_config pass"""
+        with self._pending_boot_lock:
+            for line in lines:
+                if line not in self._pending_boot_lines:
+                    self._pending_boot_lines.append(line)
+            if self._boot_flush_scheduled:
+                return
+            self._boot_flush_scheduled = True
+        # Flush once Tk is idle so requests made close together coalesce
+        self.root.after_idle(self.flush_boot_config)
+        
+    def flush_boot_config(self):
+        """Write all queued config.txt lines with a single read/modify/write"""
+        with self._pending_boot_lock:
+            lines = self._pending_boot_lines
+            self._pending_boot_lines = []
+            self._boot_flush_scheduled = False
+        if not lines:
+            return
+            
+        def worker():
+            try:
+                with self._boot_write_lock:
+                    config_content, present_lines = self._read_boot_config()
+                    missing = [line for line in lines if line not in present_lines]
+                    
+                    if missing:
+                        # Backup original, then append everything missing under one comment
+                        self._backup_boot_config(config_content)
+                        if not config_content.endswith("\n"):
+                            config_content += "\n"
+                        config_content += f"\n{BOOT_CONFIG_COMMENT}\n" + "\n".join(missing) + "\n"
+                        self._write_boot_config(config_content)
+                        for line in missing:
+                            logging.info(f"Added {line} to config.txt")
+                    else:
+                        logging.info("Requested settings already present in config.txt")
+                        
+                self._invalidate_status_cache()
+                self.root.after(0, self.request_status_update)
+                
+            except Exception as e:
+                logging.error(f"config.txt update error: {e}")
+                
+        threading.Thread(target=worker, daemon=True).start()
+        
     def handle_enable_spi(self):
         """Handle SPI enable/disable"""
         if self.check_spi_status():
@@ -951,44 +1844,12 @@ Choose what to do:"""
             def worker():
                 try:
                     # Enable SPI via raspi-config
-                    subprocess.run(["sudo", "raspi-config", "nonint", "do_spi", "0"], check=False)
-                    
-                    # Add SPI configurations to config.txt
-                    config_file = "/boot/firmware/config.txt"
-                    backup_file = f"{config_file}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                    with self._boot_write_lock:
+                        subprocess.run(["sudo", "raspi-config", "nonint", "do_spi", "0"], check=False)
                     
-                    # Backup original
-                    subprocess.run(["sudo", "cp", config_file, backup_file], check=True)
-                    logging.info(f"Backed up config.txt to {backup_file}")
-                    
-                    # Read current config
-                    result = subprocess.run(["sudo", "cat", config_file], capture_output=True, text=True, check=True)
-                    config_content = result.stdout
-                    
-                    # Check and add SPI parameter
-                    config_updated = False
-                    if "dtparam=spi=on" not in config_content:
-                        config_content += "\n# SPI Configuration\ndtparam=spi=on\n"
-                        config_updated = True
-                        logging.info("Added SPI parameter to config.txt")
-                    
-                    # Check and add SPI overlay
-                    if "dtoverlay=spi0-0cs" not in config_content:
-                        if not config_updated:
-                            config_content += "\n# SPI Configuration\n"
-                        config_content += "dtoverlay=spi0-0cs\n"
-                        config_updated = True
-                        logging.info("Added SPI overlay to config.txt")
-                    
-                    if config_updated:
-                        # Write updated config using sudo
-                        subprocess.run(["sudo", "tee", config_file], input=config_content, text=True, check=True)
-                        logging.info("SPI configuration updated in config.txt")
-                    else:
-                        logging.info("SPI configuration already present in config.txt")
-                    
-                    logging.info("SPI configuration complete. Reboot may be required.")
-                    self.root.after(0, self.update_status_indicators)
+                    # Add SPI parameter and overlay to config.txt along with any other pending changes
+                    self.queue_boot_config_lines(["dtparam=spi=on", "dtoverlay=spi0-0cs"])
+                    logging.info("SPI configuration queued. Reboot may be required.")
                     
                 except Exception as e:
                     logging.error(f"SPI configuration error: {e}")
@@ -1004,34 +1865,12 @@ Choose what to do:"""
             def worker():
                 try:
                     # Enable I2C via raspi-config
-                    subprocess.run(["sudo", "raspi-config", "nonint", "do_i2c", "0"], check=False)
-                    
-                    # Add I2C ARM parameter to config.txt
-                    config_file = "/boot/firmware/config.txt"
-                    backup_file = f"{config_file}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                    with self._boot_write_lock:
+                        subprocess.run(["sudo", "raspi-config", "nonint", "do_i2c", "0"], check=False)
                     
-                    # Backup original if not already backed up recently
-                    backup_file = f"{config_file}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                    subprocess.run(["sudo", "cp", config_file, backup_file], check=True)
-                    logging.info(f"Backed up config.txt to {backup_file}")
-                    
-                    # Read current config
-                    result = subprocess.run(["sudo", "cat", config_file], capture_output=True, text=True, check=True)
-                    config_content = result.stdout
-                    
-                    # Add I2C ARM parameter if not present
-                    if "dtparam=i2c_arm=on" not in config_content:
-                        config_content += "\n# I2C Configuration\ndtparam=i2c_arm=on\n"
-                        
-                        # Write updated config using sudo
-                        subprocess.run(["sudo", "tee", config_file], input=config_content, text=True, check=True)
-                            
-                        logging.info("Added I2C ARM parameter to config.txt")
-                    else:
-                        logging.info("I2C ARM parameter already present in config.txt")
-                    
-                    logging.info("I2C configuration complete. Reboot may be required.")
-                    self.root.after(0, self.update_status_indicators)
+                    # Add I2C ARM parameter to config.txt along with any other pending changes
+                    self.queue_boot_config_lines(["dtparam=i2c_arm=on"])
+                    logging.info("I2C configuration queued. Reboot may be required.")
                     
                 except Exception as e:
                     logging.error(f"I2C configuration error: {e}")
@@ -1046,56 +1885,21 @@ Choose what to do:"""
             logging.info("Enabling GPS/UART interface...")
             def worker():
                 try:
-                    # Configure GPS/UART in config.txt
-                    config_file = "/boot/firmware/config.txt"
-                    backup_file = f"{config_file}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                    
-                    # Backup original
-                    subprocess.run(["sudo", "cp", config_file, backup_file], check=True)
-                    logging.info(f"Backed up config.txt to {backup_file}")
-                    
-                    # Read current config
-                    result = subprocess.run(["sudo", "cat", config_file], capture_output=True, text=True, check=True)
-                    config_content = result.stdout
-                    
-                    config_updated = False
-                    
-                    # Check and add enable_uart=1
-                    if "enable_uart=1" not in config_content:
-                        config_content += "\n# GPS/UART Configuration\nenable_uart=1\n"
-                        config_updated = True
-                        logging.info("Added enable_uart=1 to config.txt")
-                    else:
-                        logging.info("enable_uart=1 already present in config.txt")
-                    
-                    # Check and add uart0 overlay for Pi 5
-                    if self.is_pi5() and "dtoverlay=uart0" not in config_content:
-                        if not config_updated:
-                            config_content += "\n# GPS/UART Configuration\n"
-                        config_content += "dtoverlay=uart0\n"
-                        config_updated = True
-                        logging.info("Added uart0 overlay for Pi 5 to config.txt")
-                    elif self.is_pi5():
-                        logging.info("uart0 overlay already present in config.txt")
-                    
-                    if config_updated:
-                        # Write updated config using sudo
-                        subprocess.run(["sudo", "tee", config_file], input=config_content, text=True, check=True)
-                        logging.info("GPS/UART configuration written to config.txt")
-                    else:
-                        logging.info("No GPS/UART configuration changes needed")
+                    # Add enable_uart=1 (and the uart0 overlay on Pi 5) along with any other pending changes
+                    self.queue_boot_config_lines([token.decode() for token in self._required_uart_tokens])
                     
                     # Disable serial console to prevent conflicts with UART
                     logging.info("Disabling serial console to prevent UART conflicts...")
-                    result = subprocess.run(["sudo", "raspi-config", "nonint", "do_serial_cons", "1"], 
-                                          capture_output=True, text=True)
+                    with self._boot_write_lock:
+                        result = subprocess.run(["sudo", "raspi-config", "nonint", "do_serial_cons", "1"], 
+                                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                     if result.returncode == 0:
                         logging.info("✅ Serial console disabled successfully")
                     else:
                         logging.warning("⚠️ Failed to disable serial console")
                     
                     logging.info("GPS/UART configuration complete. Reboot required for changes to take effect")
-                    self.root.after(0, self.update_status_indicators)
+                    self.root.after(0, self.request_status_update)
                     
                 except Exception as e:
                     logging.error(f"GPS/UART configuration error: {e}")
@@ -1105,7 +1909,7 @@ Choose what to do:"""
     def handle_hat_specific(self):
         """Handle HAT specific configuration for MeshAdv Mini"""
         if not self.hat_info or self.hat_info.get('product') != 'MeshAdv Mini':
-            messagebox.showwarning("No Compatible HAT", 
+            _messagebox().showwarning("No Compatible HAT", 
                                  "MeshAdv Mini HAT not detected. This function is specific to MeshAdv Mini.")
             return
             
@@ -1114,23 +1918,42 @@ Choose what to do:"""
         # Configure GPIO and PPS settings
         self.configure_meshadv_mini()
         
+    def _remove_file(self, path):
+        """Delete path directly when its directory is writable, otherwise via sudo rm"""
+        if os.access(os.path.dirname(path), os.W_OK):
+            os.remove(path)
+        else:
+            subprocess.run(["sudo", "rm", str(path)], check=True)
+            
+    def _scan_available(self, directory):
+        """List .yaml files and subfolders of directory in one scandir pass (no per-entry stat)"""
+        yaml_files, folders = [], []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    folders.append(Path(entry.path))
+                elif entry.is_file() and entry.name.endswith(".yaml"):
+                    yaml_files.append(Path(entry.path))
+        return yaml_files, folders
+        
     def handle_hat_config(self):
         """Handle HAT configuration in meshtasticd config.d"""
         try:
             available_dir = f"{CONFIG_DIR}/available.d"
             config_d_dir = f"{CONFIG_DIR}/config.d"
             
-            # Create directories if they don't exist
-            subprocess.run(["sudo", "mkdir", "-p", available_dir], check=True)
-            subprocess.run(["sudo", "mkdir", "-p", config_d_dir], check=True)
+            # Create directories if they don't exist (usually they do, so skip the fork)
+            for directory in (available_dir, config_d_dir):
+                if not os.path.isdir(directory):
+                    subprocess.run(["sudo", "mkdir", "-p", directory], check=True)
             
             # Check for existing configs in config.d
-            existing_configs = list(Path(config_d_dir).glob("*.yaml"))
+            existing_configs, _ = self._scan_available(config_d_dir)
             if existing_configs:
                 config_names = [f.name for f in existing_configs]
                 logging.info(f"Found existing configs in config.d: {', '.join(config_names)}")
                 
-                replace_result = messagebox.askyesno(
+                replace_result = _messagebox().askyesno(
                     "Existing Configuration", 
                     f"Found existing configuration(s): {', '.join(config_names)}\n"
                     "Do you want to replace them?"
@@ -1142,23 +1965,20 @@ Choose what to do:"""
                 
                 # Remove existing configs
                 for config_file in existing_configs:
-                    subprocess.run(["sudo", "rm", str(config_file)], check=True)
+                    self._remove_file(config_file)
                     logging.info(f"Removed existing config: {config_file.name}")
             
             # Look for available configs (both .yaml files and folders)
             available_configs = []
             
-            # Add .yaml files
-            yaml_files = list(Path(available_dir).glob("*.yaml"))
+            # Add .yaml files, then folders (which contain configs), from a single directory scan
+            yaml_files, folders = self._scan_available(available_dir)
             available_configs.extend(yaml_files)
-            
-            # Add folders (which contain configs)
-            folders = [d for d in Path(available_dir).iterdir() if d.is_dir()]
             available_configs.extend(folders)
             
             if not available_configs:
                 logging.warning("No configuration files or folders found in available.d")
-                messagebox.showwarning(
+                _messagebox().showwarning(
                     "No Configurations Available",
                     f"No configuration files or folders found in {available_dir}"
                 )
@@ -1169,12 +1989,12 @@ Choose what to do:"""
             if self.hat_info:
                 hat_product = self.hat_info.get('product', '').lower()
                 hat_vendor = self.hat_info.get('vendor', '').lower()
+                # Drop empty fields, which would otherwise match every name
+                keywords = tuple(k for k in (hat_product, hat_vendor, 'meshadv') if k)
                 
                 for config_item in available_configs:
                     config_name = config_item.name.lower()
-                    if (hat_product in config_name or 
-                        hat_vendor in config_name or
-                        'meshadv' in config_name):
+                    if any(k in config_name for k in keywords):
                         matching_configs.append(config_item)
             
             if len(matching_configs) == 1:
@@ -1186,7 +2006,7 @@ Choose what to do:"""
                 
                 config_type = "Folder" if selected_config.is_dir() else "File"
                 
-                result = messagebox.askyesnocancel(
+                result = _messagebox().askyesnocancel(
                     "Confirm HAT Configuration",
                     f"Detected HAT: {hat_vendor} {hat_product}\n\n"
                     f"Auto-selected configuration:\n{selected_config.name} ({config_type})\n\n"
@@ -1212,7 +2032,7 @@ Choose what to do:"""
                 
         except Exception as e:
             logging.error(f"HAT configuration error: {e}")
-            messagebox.showerror("Error", f"HAT configuration failed: {e}")
+            _messagebox().showerror("Error", f"HAT configuration failed: {e}")
         
         # Update status after operation
         self.update_status_indicators()
@@ -1291,52 +2111,147 @@ Choose what to do:"""
                  text="Select a configuration to use:",
                  font=("TkDefaultFont", 10, "bold")).pack(pady=5)
         
-        selected_var = tk.StringVar()
-        
-        # Create scrollable frame for configs
-        canvas = tk.Canvas(selection_window)
-        scrollbar = ttk.Scrollbar(selection_window, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # A Treeview scrolls natively, so large lists don't need a canvas of per-item widgets
+        list_frame = ttk.Frame(selection_window)
+        config_tree = ttk.Treeview(list_frame, columns=("type",), selectmode="browse")
+        config_tree.heading("#0", text="Configuration")
+        config_tree.heading("type", text="Type")
+        config_tree.column("type", width=80, stretch=False)
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=config_tree.yview)
+        config_tree.configure(yscrollcommand=scrollbar.set)
         
         for config in available_configs:
             config_type = "Folder" if config.is_dir() else "File"
-            ttk.Radiobutton(scrollable_frame, 
-                          text=f"{config.name} ({config_type})",
-                          variable=selected_var, 
-                          value=str(config)).pack(pady=2, anchor='w', padx=20)
+            config_tree.insert("", tk.END, iid=str(config), text=config.name, values=(config_type,))
         
-        canvas.pack(side="left", fill="both", expand=True, padx=(20, 0), pady=10)
-        scrollbar.pack(side="right", fill="y", pady=10)
-        
-        def apply_selection():
-            if selected_var.get():
-                selected_config = Path(selected_var.get())
+        def apply_selection(event=None):
+            selection = config_tree.selection()
+            if selection:
+                selected_config = Path(selection[0])
                 selection_window.destroy()
                 self.copy_config_item(selected_config, config_d_dir)
         
+        config_tree.bind("<Double-1>", apply_selection)
+        
+        # Pack the button first so it keeps its space when the window is small
         ttk.Button(selection_window, text="Apply Selected", 
-                  command=apply_selection).pack(pady=20)
+                  command=apply_selection).pack(side="bottom", pady=20)
+        list_frame.pack(fill="both", expand=True, padx=20, pady=10)
+        config_tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
                   
+    def _write_privileged(self, path, content):
+        """Write text to a root-owned file: directly when root, else via the sudo shell. Returns success"""
+        if os.geteuid() == 0:
+            try:
+                with open(path, "w") as f:
+                    f.write(content)
+                return True
+            except OSError as e:
+                logging.debug(f"Direct write of {path} failed: {e}")
+                return False
+        # Quoted heredoc delimiter, so the shell expands nothing in content
+        status, output = self._sudo.run(
+            f"cat > {shlex.quote(path)} <<'MESHADV_EOF'\n{content.rstrip(chr(10))}\nMESHADV_EOF")
+        if status != 0:
+            logging.debug(f"Writing {path} failed: {output.strip()}")
+        return status == 0
+        
+    def _sudo_copy(self, source, dest):
+        """Copy a file with root privileges through the shared sudo shell"""
+        status, output = self._sudo.run(f"cp {shlex.quote(str(source))} {shlex.quote(str(dest))}")
+        if status != 0:
+            raise Exception(f"cp failed: {output.strip()}")
+            
+    def _hide_dialog(self, dialog):
+        """Hide a reusable dialog instead of destroying it"""
+        dialog.grab_release()
+        dialog.withdraw()
+        
+    def _show_dialog(self, dialog):
+        """Show a reusable dialog as a modal window"""
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+        
+    def show_file_selection(self, source_item, config_files, config_d_dir):
+        """Ask which config file in a folder to copy, reusing one dialog window"""
+        if self._file_dialog is None or not self._file_dialog['window'].winfo_exists():
+            file_window = tk.Toplevel(self.root)
+            file_window.geometry("350x250")
+            file_window.transient(self.root)
+            file_window.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(file_window))
+            
+            heading = ttk.Label(file_window, font=("TkDefaultFont", 10, "bold"))
+            heading.pack(pady=10)
+            choices = ttk.Frame(file_window)
+            choices.pack(fill=tk.X)
+            copy_button = ttk.Button(file_window, text="Copy Selected")
+            copy_button.pack(pady=20)
+            
+            self._file_dialog = {'window': file_window, 'heading': heading, 'choices': choices,
+                                 'button': copy_button, 'selected': tk.StringVar(), 'files': None}
+            
+        dialog = self._file_dialog
+        file_window = dialog['window']
+        selected_file = dialog['selected']
+        file_window.title(f"Select Config from {source_item.name}")
+        dialog['heading'].configure(text=f"Multiple config files found in {source_item.name}:")
+        
+        # Only rebuild the radio buttons when the list of files has changed
+        files = tuple(str(config_file) for config_file in config_files)
+        if files != dialog['files']:
+            for widget in dialog['choices'].winfo_children():
+                widget.destroy()
+            for config_file in config_files:
+                ttk.Radiobutton(dialog['choices'], 
+                              text=config_file.name,
+                              variable=selected_file, 
+                              value=str(config_file)).pack(pady=2, anchor='w', padx=20)
+            dialog['files'] = files
+        selected_file.set("")
+        
+        def copy_selected_file():
+            if selected_file.get():
+                config_file = Path(selected_file.get())
+                dest_path = Path(config_d_dir) / config_file.name
+                try:
+                    self._sudo_copy(config_file, dest_path)
+                except Exception as e:
+                    logging.error(f"Failed to copy config item: {e}")
+                    _messagebox().showerror("Configuration Error", f"Failed to copy configuration: {e}")
+                    return
+                logging.info(f"Copied {config_file.name} from folder {source_item.name} to config.d")
+                self._hide_dialog(file_window)
+                
+                _messagebox().showinfo(
+                    "Configuration Applied",
+                    f"Configuration '{config_file.name}' has been applied.\n"
+                    "Restart meshtasticd service for changes to take effect."
+                )
+                
+                self.update_status_indicators()
+                
+        dialog['button'].configure(command=copy_selected_file)
+        self._show_dialog(file_window)
+        
     def copy_config_item(self, source_item, config_d_dir):
         """Copy the correct configuration file from available.d to config.d"""
         try:
-            if source_item.is_file():
+            # Scanning tells folders from files without a separate stat
+            try:
+                config_files, _ = self._scan_available(source_item)
+            except NotADirectoryError:
+                config_files = None
+                
+            if config_files is None:
                 # Copy single YAML file directly
                 dest_path = Path(config_d_dir) / source_item.name
-                subprocess.run(["sudo", "cp", str(source_item), str(dest_path)], check=True)
+                self._sudo_copy(source_item, dest_path)
                 logging.info(f"Copied {source_item.name} to config.d")
                 
             else:
                 # If it's a folder, look for a config file inside it
-                config_files = list(source_item.glob("*.yaml"))
                 if not config_files:
                     raise Exception(f"No YAML config files found in folder {source_item.name}")
                 
@@ -1344,53 +2259,15 @@ Choose what to do:"""
                     # Single config file in folder - copy it
                     config_file = config_files[0]
                     dest_path = Path(config_d_dir) / config_file.name
-                    subprocess.run(["sudo", "cp", str(config_file), str(dest_path)], check=True)
+                    self._sudo_copy(config_file, dest_path)
                     logging.info(f"Copied {config_file.name} from folder {source_item.name} to config.d")
                     
                 else:
                     # Multiple config files in folder - ask user to select
-                    def show_file_selection():
-                        file_window = tk.Toplevel(self.root)
-                        file_window.title(f"Select Config from {source_item.name}")
-                        file_window.geometry("350x250")
-                        file_window.transient(self.root)
-                        file_window.grab_set()
-                        
-                        ttk.Label(file_window, 
-                                 text=f"Multiple config files found in {source_item.name}:",
-                                 font=("TkDefaultFont", 10, "bold")).pack(pady=10)
-                        
-                        selected_file = tk.StringVar()
-                        
-                        for config_file in config_files:
-                            ttk.Radiobutton(file_window, 
-                                          text=config_file.name,
-                                          variable=selected_file, 
-                                          value=str(config_file)).pack(pady=2, anchor='w', padx=20)
-                        
-                        def copy_selected_file():
-                            if selected_file.get():
-                                config_file = Path(selected_file.get())
-                                dest_path = Path(config_d_dir) / config_file.name
-                                subprocess.run(["sudo", "cp", str(config_file), str(dest_path)], check=True)
-                                logging.info(f"Copied {config_file.name} from folder {source_item.name} to config.d")
-                                file_window.destroy()
-                                
-                                messagebox.showinfo(
-                                    "Configuration Applied",
-                                    f"Configuration '{config_file.name}' has been applied.\n"
-                                    "Restart meshtasticd service for changes to take effect."
-                                )
-                                
-                                self.update_status_indicators()
-                        
-                        ttk.Button(file_window, text="Copy Selected", 
-                                  command=copy_selected_file).pack(pady=20)
-                    
-                    show_file_selection()
+                    self.show_file_selection(source_item, config_files, config_d_dir)
                     return
             
-            messagebox.showinfo(
+            _messagebox().showinfo(
                 "Configuration Applied",
                 f"Configuration '{source_item.name}' has been applied.\n"
                 "Restart meshtasticd service for changes to take effect."
@@ -1400,7 +2277,7 @@ Choose what to do:"""
             
         except Exception as e:
             logging.error(f"Failed to copy config item: {e}")
-            messagebox.showerror(
+            _messagebox().showerror(
                 "Configuration Error",
                 f"Failed to copy configuration: {e}"
             )
@@ -1412,7 +2289,7 @@ Choose what to do:"""
         try:
             # Check if config file exists
             if not os.path.exists(config_file):
-                if messagebox.askyesno("Create Config File", 
+                if _messagebox().askyesno("Create Config File", 
                                      f"Config file {config_file} does not exist.\n"
                                      "Create it now?"):
                     # Create basic config file
@@ -1427,31 +2304,21 @@ Choose what to do:"""
             # Open nano in a new terminal window
             logging.info(f"Opening config file in nano: {config_file}")
             
-            # Try different terminal emulators
-            terminal_commands = [
-                ["x-terminal-emulator", "-e", "sudo", "nano", config_file],
-                ["gnome-terminal", "--", "sudo", "nano", config_file],
-                ["xterm", "-e", "sudo", "nano", config_file],
-                ["lxterminal", "-e", "sudo", "nano", config_file],
-                ["mate-terminal", "-e", "sudo", "nano", config_file],
-                ["konsole", "-e", "sudo", "nano", config_file],
-            ]
-            
+            # Try the installed terminal emulators in order of preference
             success = False
-            for cmd in terminal_commands:
+            for terminal, exec_flag in _installed_terminals():
                 try:
-                    if shutil.which(cmd[0]):
-                        subprocess.Popen(cmd)
-                        success = True
-                        logging.info(f"Opened nano with: {cmd[0]}")
-                        break
+                    subprocess.Popen([terminal, exec_flag, "sudo", "nano", config_file])
+                    success = True
+                    logging.info(f"Opened nano with: {terminal}")
+                    break
                 except Exception as e:
-                    logging.warning(f"Failed to open with {cmd[0]}: {e}")
+                    logging.warning(f"Failed to open with {terminal}: {e}")
                     continue
             
             if not success:
                 # Fallback: show instructions
-                messagebox.showinfo(
+                _messagebox().showinfo(
                     "Edit Config File",
                     f"Could not open terminal automatically.\n\n"
                     f"Please run this command manually:\n"
@@ -1462,18 +2329,25 @@ Choose what to do:"""
                 
         except Exception as e:
             logging.error(f"Failed to edit config file: {e}")
-            messagebox.showerror("Error", f"Failed to edit config file: {e}")
+            _messagebox().showerror("Error", f"Failed to edit config file: {e}")
             
     def install_meshtasticd(self):
         """Install meshtasticd with channel selection"""
-        # Channel selection dialog
+        # Channel selection dialog, built once and reused
+        if self._channel_dialog is not None and self._channel_dialog['window'].winfo_exists():
+            self._channel_dialog['selected'].set("beta")
+            self._show_dialog(self._channel_dialog['window'])
+            return
+            
         channel_window = tk.Toplevel(self.root)
         channel_window.title("Select Channel")
         channel_window.geometry("300x250")  # Increased height from 200 to 250
         channel_window.transient(self.root)
+        channel_window.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(channel_window))
         channel_window.grab_set()
         
         selected_channel = tk.StringVar(value="beta")
+        self._channel_dialog = {'window': channel_window, 'selected': selected_channel}
         
         ttk.Label(channel_window, text="Select Meshtastic Channel:", 
                  font=("TkDefaultFont", 12, "bold")).pack(pady=10)
@@ -1487,12 +2361,57 @@ Choose what to do:"""
         
         def install_with_channel():
             channel = selected_channel.get()
-            channel_window.destroy()
+            self._hide_dialog(channel_window)
             self.perform_installation(channel)
             
         ttk.Button(channel_window, text="Install", 
                   command=install_with_channel).pack(pady=20)
                   
+    def _install_gpg_key(self, key_url, gpg_file):
+        """Download, dearmor and install a repository key as one curl | gpg | tee pipeline.
+        
+        The key bytes only pass through kernel pipes, and all three stages run
+        concurrently. Returns True on success, logging which stage failed otherwise.
+        """
+        # Open the key file first so a failing open() doesn't leave curl running
+        sink = open(gpg_file, "wb") if os.geteuid() == 0 else None
+        curl = subprocess.Popen(["curl", "-fsSL", key_url], stdout=subprocess.PIPE)
+        if sink is not None:
+            # Already root: gpg can write the key file itself
+            gpg = subprocess.Popen(["gpg", "--dearmor"], stdin=curl.stdout, stdout=sink,
+                                   stderr=subprocess.DEVNULL)
+            curl.stdout.close()  # So curl sees SIGPIPE if gpg exits early
+            sink.close()
+            tee = None
+        else:
+            gpg = subprocess.Popen(["gpg", "--dearmor"], stdin=curl.stdout, stdout=subprocess.PIPE,
+                                   stderr=subprocess.DEVNULL)
+            curl.stdout.close()
+            tee = subprocess.Popen(["sudo", "tee", gpg_file], stdin=gpg.stdout, stdout=subprocess.DEVNULL)
+            gpg.stdout.close()
+            
+        tee_code = tee.wait() if tee else 0
+        gpg_code = gpg.wait()
+        curl_code = curl.wait()
+        
+        if curl_code != 0:
+            logging.error(f"❌ Failed to download GPG key")
+        elif gpg_code != 0:
+            logging.error(f"❌ GPG key processing failed")
+        elif tee_code != 0:
+            logging.error(f"❌ Failed to install GPG key")
+        else:
+            return True
+        # Don't leave a truncated key behind for apt to trip over
+        if tee is None:
+            try:
+                os.unlink(gpg_file)
+            except OSError:
+                pass
+        else:
+            self._sudo.run(f"rm -f {shlex.quote(gpg_file)}")
+        return False
+        
     def perform_installation(self, channel):
         """Perform the actual installation with improved error handling"""
         def worker():
@@ -1510,46 +2429,21 @@ Choose what to do:"""
                 list_file = f"{REPO_DIR}/{REPO_PREFIX}:{channel}.list"
                 gpg_file = f"{GPG_DIR}/network_Meshtastic_{channel}.gpg"
                 
-                # Create repository file
-                logging.info(f"Step 1/5: Creating repository configuration...")
+                # Create repository file and fetch GPG key; they're independent until apt update
+                logging.info(f"Step 1-3/5: Writing repository file and installing GPG key from {channel} repository...")
                 repo_content = f"deb {repo_url} /\n"
-                result = subprocess.run(["sudo", "tee", list_file], input=repo_content, text=True, capture_output=True)
-                if result.returncode != 0:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+                    repo_future = pool.submit(self._write_privileged, list_file, repo_content)
+                    key_ok = self._install_gpg_key(f"{repo_url}Release.key", gpg_file)
+                    repo_ok = repo_future.result()
+                    
+                if not repo_ok:
                     logging.error(f"❌ Failed to create repository file")
                     return
                 logging.info(f"✅ Repository file created successfully")
-                
-                # Fetch GPG key
-                logging.info(f"Step 2/5: Downloading GPG key from {channel} repository...")
-                result = subprocess.run(["curl", "-fsSL", f"{repo_url}Release.key"], 
-                                      capture_output=True, text=True)
-                
-                if result.returncode != 0:
-                    logging.error(f"❌ Failed to download GPG key")
-                    return
-                logging.info(f"✅ GPG key downloaded successfully")
-                
-                # Process GPG key
-                logging.info(f"Step 3/5: Processing and installing GPG key...")
-                gpg_process = subprocess.Popen(
-                    ["gpg", "--dearmor"],
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
-                
-                gpg_output, gpg_error = gpg_process.communicate(input=result.stdout.encode('utf-8'))
-                
-                if gpg_process.returncode != 0:
-                    logging.error(f"❌ GPG key processing failed")
+                if not key_ok:
                     return
-                
-                # Write GPG key
-                write_result = subprocess.run(["sudo", "tee", gpg_file], input=gpg_output, capture_output=True)
-                if write_result.returncode != 0:
-                    logging.error(f"❌ Failed to install GPG key")
-                    return
-                logging.info(f"✅ GPG key installed successfully")
+                logging.info(f"✅ GPG key downloaded and installed successfully")
                 
                 # Update package list with safe apt command
                 logging.info(f"Step 4/5: Updating package database...")
@@ -1589,14 +2483,15 @@ Choose what to do:"""
                         logging.warning("Non-interactive installation failed, trying interactive mode...")
                         logging.info(f"Non-interactive error: {result.stderr}")
                         
-                        # Get more detailed error information first
-                        logging.info("Checking dpkg status for more details...")
-                        dpkg_result = subprocess.run(["sudo", "dpkg", "--configure", "-a"], 
-                                                   capture_output=True, text=True, input="n\n")
-                        if dpkg_result.stdout.strip():
-                            logging.info(f"dpkg configure output: {dpkg_result.stdout}")
-                        if dpkg_result.stderr.strip():
-                            logging.warning(f"dpkg configure warnings: {dpkg_result.stderr}")
+                        # Only repair dpkg when apt reported it broken; a conffile prompt doesn't need it
+                        if DPKG_BROKEN_RE.search(result.stderr):
+                            logging.info("Checking dpkg status for more details...")
+                            dpkg_result = subprocess.run(["sudo", "dpkg", "--configure", "-a"], 
+                                                       capture_output=True, text=True, input="n\n")
+                            if dpkg_result.stdout.strip():
+                                logging.info(f"dpkg configure output: {dpkg_result.stdout}")
+                            if dpkg_result.stderr.strip():
+                                logging.warning(f"dpkg configure warnings: {dpkg_result.stderr}")
                         
                         # Now try interactive installation
                         logging.info("Starting interactive installation process...")
@@ -1604,85 +2499,66 @@ Choose what to do:"""
                             ["sudo", "apt", "install", "-y", PKG_NAME],
                             stdin=subprocess.PIPE,
                             stdout=subprocess.PIPE,
-                            stderr=subprocess.STDOUT,  # Combine stderr with stdout
-                            text=True,
-                            bufsize=1,  # Line buffered
-                            universal_newlines=True
+                            stderr=subprocess.STDOUT  # Combine stderr with stdout
                         )
                         
-                        # Monitor output for config prompts
-                        output_lines = []
-                        config_prompt_detected = False
+                        # Keep draining output while the user decides; the dialog answers through a callback
+                        # Only the tail is kept for the failure report, however long apt runs
+                        output_lines = deque(maxlen=APT_OUTPUT_TAIL_LINES)
+                        prompt_state = {'awaiting_choice': False, 'cancelled': False, 'choice': None}
                         
-                        try:
-                            # Read output line by line with timeout
-                            timeout_count = 0
-                            max_timeout = 60  # 60 seconds to detect prompt
-                            
-                            while install_process.poll() is None and timeout_count < max_timeout:
-                                # Check if there's output ready
-                                ready, _, _ = select.select([install_process.stdout], [], [], 1.0)
-                                
-                                if ready:
-                                    line = install_process.stdout.readline()
-                                    if line:
-                                        output_lines.append(line.strip())
-                                        logging.info(f"Install output: {line.strip()}")
-                                        
-                                        # Check for config file prompt indicators
-                                        if any(indicator in line.lower() for indicator in [
-                                            "configuration file", "config.yaml", "what would you like to do",
-                                            "package distributor", "modified", "your options are"
-                                        ]):
-                                            config_prompt_detected = True
-                                            logging.info("🔍 Configuration file prompt detected!")
-                                            break
-                                    timeout_count = 0  # Reset timeout if we got output
-                                else:
-                                    timeout_count += 1
-                            
-                            if config_prompt_detected:
-                                # Get user's choice through dialog
-                                user_choice = self.get_config_file_choice()
-                                
-                                if user_choice == 'cancel':
-                                    install_process.terminate()
-                                    logging.info("Installation cancelled by user")
-                                    return
-                                
-                                logging.info(f"User chose: {user_choice}")
-                                
+                        def send_choice(user_choice):
+                            try:
                                 # Send the choice to the process
-                                install_process.stdin.write(f"{user_choice}\n")
+                                install_process.stdin.write(f"{user_choice}\n".encode())
                                 install_process.stdin.flush()
+                            except (OSError, ValueError) as e:
+                                logging.warning(f"Could not send choice to installer: {e}")
                                 
-                                # Wait for completion
-                                stdout, _ = install_process.communicate(timeout=300)
-                                result_code = install_process.returncode
-                                
-                                # Log remaining output
-                                if stdout:
-                                    for line in stdout.split('\n'):
-                                        if line.strip():
-                                            logging.info(f"Install output: {line.strip()}")
-                                
-                            else:
-                                # No prompt detected, wait for completion
-                                stdout, _ = install_process.communicate(timeout=300)
-                                result_code = install_process.returncode
+                        def on_choice(user_choice):
+                            prompt_state['awaiting_choice'] = False
+                            if install_process.poll() is not None:
+                                return
+                            if user_choice == 'cancel':
+                                prompt_state['cancelled'] = True
+                                install_process.terminate()
+                                return
+                            logging.info(f"User chose: {user_choice}")
+                            prompt_state['choice'] = user_choice
+                            send_choice(user_choice)
                                 
-                                # Log all output
-                                if stdout:
-                                    for line in stdout.split('\n'):
-                                        if line.strip():
-                                            logging.info(f"Install output: {line.strip()}")
+                        def on_output(line):
+                            # _watch_output has already stripped the line ending
+                            output_lines.append(line)
+                            logging.info(f"Install output: {line}")
+                            
+                        def on_prompt():
+                            # Ask the user once; should dpkg ask about another conffile, give it the same answer
+                            if prompt_state['awaiting_choice'] or prompt_state['cancelled']:
+                                return
+                            if prompt_state['choice'] is not None:
+                                logging.info(f"Another configuration file prompt, answering {prompt_state['choice']} again")
+                                send_choice(prompt_state['choice'])
+                                return
+                            prompt_state['awaiting_choice'] = True
+                            logging.info("🔍 Configuration file prompt detected!")
+                            self.get_config_file_choice(on_choice)
+                        
+                        try:
+                            self._watch_output(install_process, on_output, CONFIG_PROMPT_RE, on_prompt,
+                                               deadline=time.monotonic() + 600)
+                            result_code = install_process.wait()
+                            
+                            if prompt_state['cancelled']:
+                                logging.info("Installation cancelled by user")
+                                return
                             
                             if result_code == 0:
                                 logging.info(f"✅ Package installed successfully (interactive mode)")
                             else:
                                 logging.error(f"❌ Interactive installation also failed with code: {result_code}")
                                 # Log the captured output for debugging
-                                logging.error("Complete installation output:")
+                                logging.error(f"Last {len(output_lines)} lines of installation output:")
                                 for line in output_lines:
                                     logging.error(f"  {line}")
                                 return
@@ -1695,6 +2571,9 @@ Choose what to do:"""
                             install_process.kill()
                             logging.error(f"❌ Installation error: {e}")
                             return
+                        finally:
+                            install_process.stdin.close()
+                            install_process.stdout.close()
                 else:
                     # No existing config, should install without prompts
                     env = os.environ.copy()
@@ -1721,6 +2600,7 @@ Choose what to do:"""
                 logging.info("="*50)
                 
                 # Force status update after a brief delay to ensure package is registered
+                self._invalidate_status_cache()
                 def delayed_update():
                     self.update_status_indicators()
                     
@@ -1746,14 +2626,16 @@ Choose what to do:"""
                 
                 # Stop service
                 logging.info("Step 1/4: Stopping meshtasticd service...")
-                result = subprocess.run(["sudo", "systemctl", "stop", PKG_NAME], capture_output=True, text=True)
+                result = subprocess.run(["sudo", "systemctl", "stop", PKG_NAME],
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 if result.returncode == 0:
                     logging.info("✅ Service stopped successfully")
                 else:
                     logging.info("ℹ️ Service was not running or already stopped")
                 
                 logging.info("Step 2/4: Disabling meshtasticd service...")
-                result = subprocess.run(["sudo", "systemctl", "disable", PKG_NAME], capture_output=True, text=True)
+                result = subprocess.run(["sudo", "systemctl", "disable", PKG_NAME],
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 if result.returncode == 0:
                     logging.info("✅ Service disabled successfully")
                 else:
@@ -1776,22 +2658,27 @@ Choose what to do:"""
                         repo_files = list(Path(REPO_DIR).glob(f"{REPO_PREFIX}:*.list"))
                         gpg_files = list(Path(GPG_DIR).glob("network_Meshtastic_*.gpg"))
                         
+                        # One rm for every file, run in the shared sudo shell
+                        stale_files = repo_files + gpg_files
                         files_removed = 0
-                        for repo_file in repo_files:
-                            result = subprocess.run(["sudo", "rm", str(repo_file)], capture_output=True, text=True)
-                            if result.returncode == 0:
-                                logging.info(f"✅ Removed repository file: {repo_file.name}")
-                                files_removed += 1
-                            else:
-                                logging.warning(f"⚠️ Could not remove {repo_file.name}")
-                            
-                        for gpg_file in gpg_files:
-                            result = subprocess.run(["sudo", "rm", str(gpg_file)], capture_output=True, text=True)
-                            if result.returncode == 0:
-                                logging.info(f"✅ Removed GPG key: {gpg_file.name}")
-                                files_removed += 1
-                            else:
-                                logging.warning(f"⚠️ Could not remove {gpg_file.name}")
+                        if stale_files and os.geteuid() == 0:
+                            for stale_file in stale_files:
+                                try:
+                                    os.unlink(stale_file)
+                                except OSError as e:
+                                    logging.warning(f"⚠️ Could not remove {stale_file.name}: {e}")
+                        elif stale_files:
+                            status, output = self._sudo.run(
+                                "rm -f " + " ".join(shlex.quote(str(f)) for f in stale_files))
+                            if status != 0:
+                                logging.warning(f"⚠️ Could not remove some repository files: {output.strip()}")
+                        for stale_file in stale_files:
+                            if os.path.exists(stale_file):
+                                logging.warning(f"⚠️ Could not remove {stale_file.name}")
+                                continue
+                            kind = "repository file" if stale_file in repo_files else "GPG key"
+                            logging.info(f"✅ Removed {kind}: {stale_file.name}")
+                            files_removed += 1
                                 
                         if files_removed > 0:
                             logging.info(f"✅ Cleaned up {files_removed} repository files")
@@ -1803,7 +2690,8 @@ Choose what to do:"""
                         
                     logging.info("✅ REMOVAL COMPLETED SUCCESSFULLY!")
                     logging.info("Meshtasticd has been completely uninstalled")
-                    self.root.after(0, self.update_status_indicators)
+                    self._invalidate_status_cache()
+                    self.root.after(0, self.request_status_update)
                 else:
                     logging.error("❌ REMOVAL FAILED!")
                     logging.error("Package removal encountered errors")
@@ -1827,13 +2715,14 @@ Choose what to do:"""
             def worker():
                 try:
                     result = subprocess.run(["sudo", "systemctl", "enable", PKG_NAME], 
-                                          capture_output=True, text=True)
+                                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
                     if result.returncode == 0:
                         logging.info("✅ meshtasticd enabled to start on boot")
                     else:
                         logging.error(f"❌ Failed to enable meshtasticd on boot: {result.stderr}")
                     
-                    self.root.after(0, self.update_status_indicators)
+                    self._invalidate_status_cache()
+                    self.root.after(0, self.request_status_update)
                     
                 except Exception as e:
                     logging.error(f"Error enabling meshtasticd on boot: {e}")
@@ -1844,7 +2733,7 @@ Choose what to do:"""
         """Handle Python CLI installation"""
         if self.check_python_cli_status():
             # Already installed, offer to reinstall or show version
-            if messagebox.askyesno("Python CLI Installed", 
+            if _messagebox().askyesno("Python CLI Installed", 
                                  "Meshtastic Python CLI is already installed.\n"
                                  "Do you want to reinstall/upgrade it?"):
                 self.install_python_cli()
@@ -1860,9 +2749,9 @@ Choose what to do:"""
         def worker():
             try:
                 logging.info("Checking Meshtastic Python CLI version...")
-                result = subprocess.run(["meshtastic", "--version"], capture_output=True, text=True)
-                if result.returncode == 0:
-                    logging.info(f"✅ Meshtastic Python CLI version: {result.stdout.strip()}")
+                version = self.get_python_cli_version()
+                if version is not None:
+                    logging.info(f"✅ Meshtastic Python CLI version: {version}")
                 else:
                     logging.error("❌ Failed to get Python CLI version")
             except Exception as e:
@@ -1870,6 +2759,26 @@ Choose what to do:"""
                 
         threading.Thread(target=worker, daemon=True).start()
     
+    def _ensure_local_bin_on_path(self):
+        """Do pipx ensurepath's job without starting pipx: put ~/.local/bin on PATH in ~/.bashrc.
+        
+        Also updates this process's PATH so the freshly installed CLI can be found right away.
+        """
+        home = Path.home()
+        local_bin = str(home / ".local" / "bin")
+        if local_bin not in os.environ.get("PATH", "").split(os.pathsep):
+            os.environ["PATH"] = f"{local_bin}{os.pathsep}{os.environ.get('PATH', '')}"
+            
+        for rc_file in (home / ".bashrc", home / ".profile"):
+            try:
+                if ".local/bin" in rc_file.read_text(errors="replace"):
+                    return
+            except FileNotFoundError:
+                continue
+                
+        with open(home / ".bashrc", "a") as f:
+            f.write(f"\n# Added by Meshtastic Configuration Tool\n{LOCAL_BIN_PATH_LINE}")
+            
     def install_python_cli(self):
         """Install Meshtastic Python CLI"""
         def worker():
@@ -1878,125 +2787,113 @@ Choose what to do:"""
                 logging.info("STARTING MESHTASTIC PYTHON CLI INSTALLATION")
                 logging.info("="*50)
                 
-                # Step 1: Install python3-full
-                logging.info("Step 1/5: Installing python3-full...")
-                result = self.safe_apt_command(["sudo", "apt", "install", "-y", "python3-full"], timeout=300)
+                # Step 1: Install python3-full and pipx in one apt run, so dpkg triggers run once
+                logging.info("Step 1/5: Installing python3-full and pipx...")
+                result = self.safe_apt_command(["sudo", "apt", "install", "-y", "python3-full", "pipx"], timeout=600)
                 if result and result.returncode == 0:
-                    logging.info("✅ python3-full installed successfully")
-                else:
-                    logging.warning("⚠️ python3-full installation had issues, continuing...")
-                
-                # Step 2: Install pytap2 via pip3
-                logging.info("Step 2/5: Installing pytap2 via pip3...")
-                try:
-                    result = subprocess.run(
-                        ["pip3", "install", "--upgrade", "pytap2", "--break-system-packages"],
-                        capture_output=True, text=True, timeout=300
-                    )
-                    if result.returncode == 0:
-                        logging.info("✅ pytap2 installed successfully")
-                    else:
-                        logging.warning(f"⚠️ pytap2 installation warning: {result.stderr}")
-                        logging.info("Continuing with installation...")
-                except Exception as e:
-                    logging.warning(f"⚠️ pytap2 installation issue: {e}, continuing...")
-                
-                # Step 3: Install pipx
-                logging.info("Step 3/5: Installing pipx...")
-                result = self.safe_apt_command(["sudo", "apt", "install", "-y", "pipx"], timeout=300)
-                if result and result.returncode == 0:
-                    logging.info("✅ pipx installed successfully")
+                    logging.info("✅ python3-full and pipx installed successfully")
+                elif shutil.which("pipx"):
+                    logging.warning("⚠️ apt installation had issues, continuing...")
                 else:
                     logging.error("❌ Failed to install pipx")
                     return
                 
-                # Step 4: Install meshtastic CLI via pipx
-                logging.info("Step 4/5: Installing Meshtastic CLI via pipx...")
+                # Steps 2-5 run as one user-level script; its ##KIND:step## markers drive the log
+                install_state = {'failed': False, 'version': None}
+                
+                def on_line(line):
+                    marker = CLI_STEP_RE.match(line)
+                    if not marker:
+                        logging.info(line)
+                        installed = PIPX_VERSION_RE.search(line)
+                        if installed:
+                            install_state['version'] = installed.group(1)
+                        return
+                    kind, value = marker.groups()
+                    started, done, warning = CLI_INSTALL_STEPS[value]
+                    if kind == "STEP":
+                        logging.info(started)
+                    elif kind == "DONE":
+                        logging.info(done)
+                    elif kind == "WARN":
+                        logging.warning(warning)
+                    elif kind == "FAIL":
+                        install_state['failed'] = True
+                        
                 logging.info("This may take several minutes as it downloads and compiles dependencies...")
+                process = subprocess.Popen(["bash", "-c", CLI_INSTALL_SCRIPT],
+                                           stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                           stderr=subprocess.STDOUT)
                 try:
-                    result = subprocess.run(
-                        ["pipx", "install", "meshtastic[cli]"],
-                        capture_output=True, text=True, timeout=600  # 10 minute timeout
-                    )
-                    if result.returncode == 0:
-                        logging.info("✅ Meshtastic CLI installed successfully via pipx")
-                    else:
-                        logging.error(f"❌ Failed to install Meshtastic CLI: {result.stderr}")
-                        return
+                    self._pump_output(process, {process.stdout: on_line},
+                                      deadline=time.monotonic() + CLI_INSTALL_TIMEOUT)
+                    process.wait()
                 except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
                     logging.error("❌ Meshtastic CLI installation timed out")
                     return
-                except Exception as e:
-                    logging.error(f"❌ Meshtastic CLI installation error: {e}")
+                finally:
+                    process.stdout.close()
+                    
+                if install_state['failed']:
+                    logging.error("❌ Failed to install Meshtastic CLI")
                     return
                 
-                # Step 5: Ensure pipx path
-                logging.info("Step 5/5: Ensuring pipx PATH configuration...")
-                try:
-                    result = subprocess.run(
-                        ["pipx", "ensurepath"],
-                        capture_output=True, text=True, timeout=60
-                    )
-                    if result.returncode == 0:
-                        logging.info("✅ pipx PATH configured successfully")
-                        if result.stdout.strip():
-                            logging.info(f"pipx ensurepath output: {result.stdout.strip()}")
-                    else:
-                        logging.warning(f"⚠️ pipx ensurepath warning: {result.stderr}")
-                except Exception as e:
-                    logging.warning(f"⚠️ pipx ensurepath issue: {e}")
-                
-                # Step 6: Verify installation
-                logging.info("Step 6/6: Verifying Meshtastic CLI installation...")
+                logging.info("Step 4/5: Ensuring pipx PATH configuration...")
                 try:
-                    # Try to run meshtastic --version
-                    result = subprocess.run(
-                        ["meshtastic", "--version"],
-                        capture_output=True, text=True, timeout=30
-                    )
-                    if result.returncode == 0:
-                        version_info = result.stdout.strip()
-                        logging.info(f"✅ INSTALLATION COMPLETED SUCCESSFULLY!")
-                        logging.info(f"Meshtastic CLI version: {version_info}")
-                        logging.info("You can now use 'meshtastic' command from the terminal")
-                        
-                        # Show success message
-                        self.root.after(0, lambda: messagebox.showinfo(
-                            "Installation Complete - Restart Required",
-                            f"Meshtastic Python CLI installed successfully!\n\n"
-                            f"Version: {version_info}\n\n"
-                            f"IMPORTANT: To use the CLI commands, you need to:\n"
-                            f"1. Close this application\n"
-                            f"2. Close your terminal\n"
-                            f"3. Open a new terminal\n"
-                            f"4. Test with: meshtastic --version\n\n"
-                            f"The PATH environment needs to be refreshed."
-                        ))
-                    else:
-                        logging.warning("⚠️ Installation completed but version check failed")
-                        logging.warning("You may need to restart your terminal or update your PATH")
-                        logging.warning("Try running: source ~/.bashrc")
-                        
-                        self.root.after(0, lambda: messagebox.showwarning(
-                            "Installation Complete - Restart Required",
-                            "Meshtastic CLI was installed but may not be in your PATH yet.\n\n"
-                            "IMPORTANT: To use the CLI commands, you need to:\n"
-                            "1. Close this application\n"
-                            "2. Close your terminal\n"
-                            "3. Open a new terminal\n"
-                            "4. Test with: meshtastic --version\n\n"
-                            "If it still doesn't work, try running:\n"
-                            "source ~/.bashrc"
-                        ))
-                        
-                except Exception as e:
-                    logging.warning(f"⚠️ Version check failed: {e}")
-                    logging.info("Installation may have succeeded but verification failed")
+                    self._ensure_local_bin_on_path()
+                    logging.info("✅ pipx PATH configured successfully")
+                except OSError as e:
+                    logging.warning(f"⚠️ Could not update PATH configuration ({e}), continuing...")
+                
+                # pipx names the version it installed; only start the CLI itself when it didn't
+                logging.info("Step 5/5: Verifying Meshtastic CLI installation...")
+                if not install_state['version']:
+                    self._invalidate_status_cache("get_python_cli_version")
+                    install_state['version'] = self.get_python_cli_version()
+                
+                if install_state['version']:
+                    version_info = install_state['version']
+                    logging.info(f"✅ INSTALLATION COMPLETED SUCCESSFULLY!")
+                    logging.info(f"Meshtastic CLI version: {version_info}")
+                    logging.info("You can now use 'meshtastic' command from the terminal")
+                    
+                    # Show success message
+                    self.root.after(0, lambda: _messagebox().showinfo(
+                        "Installation Complete - Restart Required",
+                        f"Meshtastic Python CLI installed successfully!\n\n"
+                        f"Version: {version_info}\n\n"
+                        f"IMPORTANT: To use the CLI commands, you need to:\n"
+                        f"1. Close this application\n"
+                        f"2. Close your terminal\n"
+                        f"3. Open a new terminal\n"
+                        f"4. Test with: meshtastic --version\n\n"
+                        f"The PATH environment needs to be refreshed."
+                    ))
+                else:
+                    logging.warning("⚠️ Installation completed but version check failed")
+                    logging.warning("You may need to restart your terminal or update your PATH")
+                    logging.warning("Try running: source ~/.bashrc")
+                    
+                    self.root.after(0, lambda: _messagebox().showwarning(
+                        "Installation Complete - Restart Required",
+                        "Meshtastic CLI was installed but may not be in your PATH yet.\n\n"
+                        "IMPORTANT: To use the CLI commands, you need to:\n"
+                        "1. Close this application\n"
+                        "2. Close your terminal\n"
+                        "3. Open a new terminal\n"
+                        "4. Test with: meshtastic --version\n\n"
+                        "If it still doesn't work, try running:\n"
+                        "source ~/.bashrc"
+                    ))
+                    
                 
                 logging.info("="*50)
                 
                 # Update status indicators
-                self.root.after(0, self.update_status_indicators)
+                self._invalidate_status_cache()
+                self.root.after(0, self.request_status_update)
                     
             except Exception as e:
                 logging.error(f"❌ PYTHON CLI INSTALLATION ERROR: {e}")
@@ -2007,16 +2904,24 @@ Choose what to do:"""
     def handle_send_message(self):
         """Handle sending a message via Meshtastic CLI"""
         if not self.check_python_cli_status():
-            messagebox.showerror("Python CLI Required", 
+            _messagebox().showerror("Python CLI Required", 
                                "Meshtastic Python CLI is not installed.\n"
                                "Please install it first using the 'Install Python CLI' button.")
             return
             
-        # Create message input dialog
+        # Message input dialog, built once and reused
+        if self._message_dialog is not None and self._message_dialog['window'].winfo_exists():
+            self._message_dialog['message'].set("")
+            self._message_dialog['update_count'](self._message_dialog['entry'])
+            self._show_dialog(self._message_dialog['window'])
+            self._message_dialog['entry'].focus()
+            return
+            
         message_window = tk.Toplevel(self.root)
         message_window.title("Send Meshtastic Message")
         message_window.geometry("450x250")  # Increased height from 200 to 250
         message_window.transient(self.root)
+        message_window.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(message_window))
         message_window.grab_set()
         
         # Make window modal and bring to front
@@ -2041,16 +2946,21 @@ Choose what to do:"""
         # Character counter
         char_label = ttk.Label(message_window, text="0/200 characters", foreground="gray")
         char_label.pack()
+        counter_state = {'over': False}
         
-        def update_char_count(*args):
-            count = len(message_var.get())
+        def update_char_count(entry):
+            count = len(entry.get())
             char_label.config(text=f"{count}/200 characters")
-            if count > 200:
-                char_label.config(foreground="red")
-            else:
-                char_label.config(foreground="gray")
+            # Only recolour when the count crosses the limit
+            over = count > 200
+            if over != counter_state['over']:
+                counter_state['over'] = over
+                char_label.config(foreground="red" if over else "gray")
         
-        message_var.trace('w', update_char_count)
+        # Updated on key release rather than through a variable trace on every change
+        message_entry.bind('<KeyRelease>', lambda e: update_char_count(e.widget))
+        self._message_dialog = {'window': message_window, 'message': message_var, 'entry': message_entry,
+                                'update_count': update_char_count}
         
         # Buttons
         button_frame = ttk.Frame(message_window)
@@ -2059,17 +2969,17 @@ Choose what to do:"""
         def send_message():
             message_text = message_var.get().strip()
             if not message_text:
-                messagebox.showwarning("Empty Message", "Please enter a message to send.")
+                _messagebox().showwarning("Empty Message", "Please enter a message to send.")
                 return
             if len(message_text) > 200:
-                messagebox.showwarning("Message Too Long", "Message must be 200 characters or less.")
+                _messagebox().showwarning("Message Too Long", "Message must be 200 characters or less.")
                 return
                 
-            message_window.destroy()
+            self._hide_dialog(message_window)
             self.send_mesh_message(message_text)
         
         def cancel_message():
-            message_window.destroy()
+            self._hide_dialog(message_window)
         
         # Bind Enter key to send
         message_window.bind('<Return>', lambda e: send_message())
@@ -2085,26 +2995,25 @@ Choose what to do:"""
         def worker():
             try:
                 logging.info(f"Sending message to mesh: '{message_text}'")
-                result = subprocess.run(
-                    ["meshtastic", "--host", "localhost", "--sendtext", message_text],
-                    capture_output=True, text=True, timeout=30
-                )
+                if self._run_mesh_action(lambda iface: iface.sendText(message_text)):
+                    returncode, output = 0, ""
+                else:
+                    returncode, output = self.run_streamed(
+                        ["meshtastic", "--host", "localhost", "--sendtext", message_text], timeout=30)
                 
-                if result.returncode == 0:
+                if returncode == 0:
                     logging.info("✅ Message sent successfully!")
-                    if result.stdout.strip():
-                        logging.info(f"Response: {result.stdout.strip()}")
                     
-                    self.root.after(0, lambda: messagebox.showinfo(
+                    self.root.after(0, lambda: _messagebox().showinfo(
                         "Message Sent",
                         f"Message sent successfully to the mesh network!\n\n"
                         f"Message: '{message_text}'"
                     ))
                 else:
-                    error_msg = result.stderr.strip() if result.stderr.strip() else "Unknown error"
+                    error_msg = output.strip() or "Unknown error"
                     logging.error(f"❌ Failed to send message: {error_msg}")
                     
-                    self.root.after(0, lambda: messagebox.showerror(
+                    self.root.after(0, lambda: _messagebox().showerror(
                         "Message Failed",
                         f"Failed to send message to mesh network.\n\n"
                         f"Error: {error_msg}\n\n"
@@ -2113,24 +3022,24 @@ Choose what to do:"""
                     
             except subprocess.TimeoutExpired:
                 logging.error("❌ Message sending timed out")
-                self.root.after(0, lambda: messagebox.showerror(
+                self.root.after(0, lambda: _messagebox().showerror(
                     "Timeout",
                     "Message sending timed out.\n"
                     "Check if meshtasticd is running and device is connected."
                 ))
             except Exception as e:
                 logging.error(f"❌ Message sending error: {e}")
-                self.root.after(0, lambda: messagebox.showerror(
+                self.root.after(0, lambda: _messagebox().showerror(
                     "Error",
                     f"Error sending message: {e}"
                 ))
                 
-        threading.Thread(target=worker, daemon=True).start()
+        self._cli_exec.submit(worker)
     
     def handle_set_region(self):
         """Handle setting LoRa region"""
         if not self.check_python_cli_status():
-            messagebox.showerror("Python CLI Required", 
+            _messagebox().showerror("Python CLI Required", 
                                "Meshtastic Python CLI is not installed.\n"
                                "Please install it first using the 'Install Python CLI' button.")
             return
@@ -2138,30 +3047,52 @@ Choose what to do:"""
         # Get current region first
         current_region = self.check_lora_region_status()
         
-        # Create region selection dialog
+        # Region selection dialog, built once and reused
+        if self._region_dialog is None or not self._region_dialog['window'].winfo_exists():
+            self._build_region_dialog()
+        dialog = self._region_dialog
+        
+        # Only the current region, its highlight, the default choice and the UNSET warnings change
+        previous = dialog['current']
+        if previous in dialog['radios']:
+            dialog['radios'][previous].configure(style='TRadiobutton')
+        if current_region in dialog['radios']:
+            dialog['radios'][current_region].configure(style='Selected.TRadiobutton')
+        dialog['current'] = current_region
+        dialog['current_label'].config(text=f"Current Region: {current_region}")
+        dialog['selected'].set(current_region if current_region != "UNSET" else "US")
+        
+        if current_region == "UNSET":
+            dialog['unset_label'].pack(pady=5, after=dialog['current_label'])
+            dialog['warning_frame'].pack(fill='x', padx=20, pady=10, before=dialog['button_frame'])
+        else:
+            dialog['unset_label'].pack_forget()
+            dialog['warning_frame'].pack_forget()
+            
+        self._show_dialog(dialog['window'])
+        dialog['window'].focus_force()
+        
+    def _build_region_dialog(self):
+        """Create the hidden region selection dialog used by handle_set_region"""
         region_window = tk.Toplevel(self.root)
+        region_window.withdraw()
         region_window.title("Set LoRa Region")
         region_window.geometry("800x650")  # Increased width from 700 to 800
         region_window.transient(self.root)
-        region_window.grab_set()
-        
-        # Make window modal and bring to front
-        region_window.focus_force()
-        region_window.lift()
+        region_window.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(region_window))
         
         # Title and current status
         ttk.Label(region_window, 
                  text="Set LoRa Region",
                  font=("TkDefaultFont", 14, "bold")).pack(pady=10)
         
-        ttk.Label(region_window, 
-                 text=f"Current Region: {current_region}",
-                 font=("TkDefaultFont", 11)).pack(pady=5)
+        current_label = ttk.Label(region_window, font=("TkDefaultFont", 11))
+        current_label.pack(pady=5)
         
-        if current_region == "UNSET":
-            ttk.Label(region_window, 
-                     text="⚠️ Region is UNSET - This must be configured!",
-                     foreground="red", font=("TkDefaultFont", 10, "bold")).pack(pady=5)
+        # Packed by handle_set_region only while the region is UNSET
+        unset_label = ttk.Label(region_window, 
+                               text="⚠️ Region is UNSET - This must be configured!",
+                               foreground="red", font=("TkDefaultFont", 10, "bold"))
         
         # Instructions
         ttk.Label(region_window, 
@@ -2181,31 +3112,10 @@ Choose what to do:"""
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Define regions (common ones first, then alphabetical)
-        regions = [
-            ("US", "United States (902-928 MHz)"),
-            ("EU_868", "Europe 868 MHz"),
-            ("ANZ", "Australia/New Zealand (915-928 MHz)"),
-            ("", "─── Other Regions ───"),  # Separator
-            ("CN", "China (470-510 MHz)"),
-            ("EU_433", "Europe 433 MHz"),
-            ("IN", "India (865-867 MHz)"),
-            ("JP", "Japan (920-923 MHz)"),
-            ("KR", "Korea (920-923 MHz)"),
-            ("MY_433", "Malaysia 433 MHz"),
-            ("MY_919", "Malaysia 919-924 MHz"),
-            ("RU", "Russia (868-870 MHz)"),
-            ("SG_923", "Singapore 920-925 MHz"),
-            ("TH", "Thailand (920-925 MHz)"),
-            ("TW", "Taiwan (920-925 MHz)"),
-            ("UA_433", "Ukraine 433 MHz"),
-            ("UA_868", "Ukraine 868 MHz"),
-            ("UNSET", "Unset (must be configured)")
-        ]
-        
-        selected_region = tk.StringVar(value=current_region if current_region != "UNSET" else "US")
-        
-        for region_code, region_name in regions:
+        selected_region = tk.StringVar(value="US")
+        radios = {}
+        
+        for region_code, region_name in REGIONS:
             if region_code == "":  # Separator
                 ttk.Separator(scrollable_frame, orient='horizontal').pack(fill='x', pady=5)
                 ttk.Label(scrollable_frame, text=region_name, 
@@ -2218,41 +3128,43 @@ Choose what to do:"""
             radio = ttk.Radiobutton(frame, text=f"{region_code} - {region_name}",
                                   variable=selected_region, value=region_code)
             radio.pack(anchor='w')
-            
-            # Highlight current region
-            if region_code == current_region:
-                radio.configure(style='Selected.TRadiobutton')
+            radios[region_code] = radio
         
         canvas.pack(side="left", fill="both", expand=True, padx=10)
         scrollbar.pack(side="right", fill="y")
         
-        # Warning for UNSET
-        if current_region == "UNSET":
-            warning_frame = ttk.Frame(region_window)
-            warning_frame.pack(fill='x', padx=20, pady=10)
-            ttk.Label(warning_frame, 
-                     text="⚠️ Important: Setting the wrong region may violate local regulations!",
-                     foreground="red", font=("TkDefaultFont", 9, "bold")).pack()
-            ttk.Label(warning_frame, 
-                     text="Make sure to select the correct region for your location.",
-                     foreground="red", font=("TkDefaultFont", 9)).pack()
+        # Warning for UNSET, packed by handle_set_region like unset_label
+        warning_frame = ttk.Frame(region_window)
+        ttk.Label(warning_frame, 
+                 text="⚠️ Important: Setting the wrong region may violate local regulations!",
+                 foreground="red", font=("TkDefaultFont", 9, "bold")).pack()
+        ttk.Label(warning_frame, 
+                 text="Make sure to select the correct region for your location.",
+                 foreground="red", font=("TkDefaultFont", 9)).pack()
         
         # Buttons
         button_frame = ttk.Frame(region_window)
         button_frame.pack(pady=20)
         
+        self._region_dialog = {
+            'window': region_window, 'selected': selected_region, 'radios': radios, 'current': None,
+            'current_label': current_label, 'unset_label': unset_label,
+            'warning_frame': warning_frame, 'button_frame': button_frame,
+        }
+        
         def apply_region():
             new_region = selected_region.get()
+            current_region = self._region_dialog['current']
             if new_region == current_region:
-                messagebox.showinfo("No Change", f"Region is already set to {new_region}")
-                region_window.destroy()
+                _messagebox().showinfo("No Change", f"Region is already set to {new_region}")
+                self._hide_dialog(region_window)
                 return
                 
-            region_window.destroy()
+            self._hide_dialog(region_window)
             self.set_lora_region(new_region, current_region)
         
         def cancel_region():
-            region_window.destroy()
+            self._hide_dialog(region_window)
         
         ttk.Button(button_frame, text="Apply Region", 
                   command=apply_region).pack(side=tk.LEFT, padx=10)
@@ -2264,17 +3176,23 @@ Choose what to do:"""
         def worker():
             try:
                 logging.info(f"Changing LoRa region from {old_region} to {new_region}...")
-                result = subprocess.run(
-                    ["meshtastic", "--host", "localhost", "--set", "lora.region", new_region],
-                    capture_output=True, text=True, timeout=30
-                )
                 
-                if result.returncode == 0:
+                def write_region(iface):
+                    lora = iface.localNode.localConfig.lora
+                    region_enum = lora.DESCRIPTOR.fields_by_name["region"].enum_type
+                    lora.region = region_enum.values_by_name[new_region].number
+                    iface.localNode.writeConfig("lora")
+                    
+                if self._run_mesh_action(write_region):
+                    returncode, output = 0, ""
+                else:
+                    returncode, output = self.run_streamed(
+                        ["meshtastic", "--host", "localhost", "--set", "lora.region", new_region], timeout=30)
+                
+                if returncode == 0:
                     logging.info("✅ LoRa region updated successfully!")
-                    if result.stdout.strip():
-                        logging.info(f"Response: {result.stdout.strip()}")
                     
-                    self.root.after(0, lambda: messagebox.showinfo(
+                    self.root.after(0, lambda: _messagebox().showinfo(
                         "Region Updated",
                         f"LoRa region updated successfully!\n\n"
                         f"Changed from: {old_region}\n"
@@ -2283,12 +3201,13 @@ Choose what to do:"""
                     ))
                     
                     # Update status indicator
-                    self.root.after(0, self.update_status_indicators)
+                    self._invalidate_status_cache("check_lora_region_status")
+                    self.root.after(0, self.request_status_update)
                 else:
-                    error_msg = result.stderr.strip() if result.stderr.strip() else "Unknown error"
+                    error_msg = output.strip() or "Unknown error"
                     logging.error(f"❌ Failed to set LoRa region: {error_msg}")
                     
-                    self.root.after(0, lambda: messagebox.showerror(
+                    self.root.after(0, lambda: _messagebox().showerror(
                         "Region Update Failed",
                         f"Failed to update LoRa region.\n\n"
                         f"Error: {error_msg}\n\n"
@@ -2297,19 +3216,19 @@ Choose what to do:"""
                     
             except subprocess.TimeoutExpired:
                 logging.error("❌ Region setting timed out")
-                self.root.after(0, lambda: messagebox.showerror(
+                self.root.after(0, lambda: _messagebox().showerror(
                     "Timeout",
                     "Region setting timed out.\n"
                     "Check if meshtasticd is running and device is connected."
                 ))
             except Exception as e:
                 logging.error(f"❌ Region setting error: {e}")
-                self.root.after(0, lambda: messagebox.showerror(
+                self.root.after(0, lambda: _messagebox().showerror(
                     "Error",
                     f"Error setting region: {e}"
                 ))
                 
-        threading.Thread(target=worker, daemon=True).start()
+        self._cli_exec.submit(self._run_locked, worker, "LoRa region change")
             
     def handle_start_stop(self):
         """Handle starting/stopping meshtasticd service"""
@@ -2319,42 +3238,44 @@ Choose what to do:"""
             def worker():
                 try:
                     result = subprocess.run(["sudo", "systemctl", "stop", PKG_NAME], 
-                                          capture_output=True, text=True)
+                                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
                     if result.returncode == 0:
                         logging.info("✅ meshtasticd service stopped")
                     else:
                         logging.error(f"❌ Failed to stop meshtasticd: {result.stderr}")
                     
-                    self.root.after(0, self.update_status_indicators)
+                    self._invalidate_status_cache(*SERVICE_STATUS_CHECKS)
+                    self.root.after(0, self.request_status_update)
                     
                 except Exception as e:
                     logging.error(f"Error stopping meshtasticd: {e}")
                     
-            threading.Thread(target=worker, daemon=True).start()
+            self._exec.submit(self._run_locked, worker, "meshtasticd start/stop")
         else:
             # Service is stopped, offer to start it
             logging.info("Starting meshtasticd service...")
             def worker():
                 try:
                     result = subprocess.run(["sudo", "systemctl", "start", PKG_NAME], 
-                                          capture_output=True, text=True)
+                                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
                     if result.returncode == 0:
                         logging.info("✅ meshtasticd service started")
                     else:
                         logging.error(f"❌ Failed to start meshtasticd: {result.stderr}")
                     
-                    self.root.after(0, self.update_status_indicators)
+                    self._invalidate_status_cache(*SERVICE_STATUS_CHECKS)
+                    self.root.after(0, self.request_status_update)
                     
                 except Exception as e:
                     logging.error(f"Error starting meshtasticd: {e}")
                     
-            threading.Thread(target=worker, daemon=True).start()
+            self._exec.submit(self._run_locked, worker, "meshtasticd start/stop")
             
     def handle_enable_disable_avahi(self):
         """Handle Avahi setup/removal for auto-discovery"""
         if self.check_avahi_status():
             # Show disable dialog
-            if messagebox.askyesno("Disable Avahi", 
+            if _messagebox().askyesno("Disable Avahi", 
                                  "Avahi is currently enabled. Do you want to disable it?\n\n"
                                  "This will:\n"
                                  "• Remove the Meshtastic service file\n"
@@ -2376,8 +3297,7 @@ Choose what to do:"""
                 
                 # Check if avahi-daemon is installed
                 logging.info("Step 1/4: Checking if avahi-daemon is installed...")
-                result = subprocess.run(["dpkg", "-l", "avahi-daemon"], capture_output=True, text=True)
-                avahi_installed = result.returncode == 0 and "ii" in result.stdout
+                avahi_installed = self._pkg_installed("avahi-daemon")
                 
                 if not avahi_installed:
                     logging.info("Step 1/4: Installing avahi-daemon...")
@@ -2401,82 +3321,57 @@ Choose what to do:"""
                     logging.info("✅ avahi-daemon is already installed")
                 
                 # Check if service file already exists
-                service_file = "/etc/avahi/services/meshtastic.service"
+                service_file = AVAHI_SERVICE_FILE
                 logging.info("Step 2/4: Checking for existing Meshtastic service file...")
                 
                 if os.path.exists(service_file):
                     logging.info("ℹ️ Meshtastic service file already exists")
-                    replace = messagebox.askyesno(
+                    replace = _messagebox().askyesno(
                         "Service File Exists",
                         f"Avahi service file already exists at:\n{service_file}\n\n"
                         "Do you want to replace it with a fresh copy?"
                     )
                     if not replace:
                         logging.info("User chose not to replace existing service file")
-                        # Still need to enable the service
-                        logging.info("Step 3/4: Enabling avahi-daemon service...")
-                        subprocess.run(["sudo", "systemctl", "enable", "avahi-daemon"], check=False)
-                        logging.info("Step 4/4: Starting avahi-daemon service...")
-                        subprocess.run(["sudo", "systemctl", "start", "avahi-daemon"], check=False)
+                        # Still need to enable and start the service
+                        logging.info("Step 3/4: Enabling and starting avahi-daemon service...")
+                        subprocess.run(["sudo", "sh", "-c", AVAHI_START_SCRIPT], check=False)
                         logging.info("✅ AVAHI SETUP COMPLETED (using existing file)")
                         logging.info("="*50)
-                        self.root.after(0, self.update_status_indicators)
+                        self._invalidate_status_cache(*AVAHI_STATUS_CHECKS)
+                        self.root.after(0, self.request_status_update)
                         return
                 
                 # Create the Avahi service file
                 logging.info("Step 3/4: Creating Meshtastic service file...")
                 
-                service_content = """<?xml version="1.0" standalone="no"?><!--*-nxml-*-->
-<!DOCTYPE service-group SYSTEM "avahi-service.dtd">
-<service-group>
-<n>Meshtastic</n>
-<service protocol="ipv4">
-<type>_meshtastic._tcp</type>
-<port>4403</port>
-</service>
-</service-group>"""
-                
-                # Create avahi services directory if it doesn't exist
-                subprocess.run(["sudo", "mkdir", "-p", "/etc/avahi/services"], check=True)
-                
-                # Write the service file
-                result = subprocess.run(["sudo", "tee", service_file], 
-                                      input=service_content, text=True, capture_output=True)
+                # Create the directory, write the file and enable + start avahi-daemon in one privileged shell
+                logging.info("Step 4/4: Enabling and starting avahi-daemon service...")
+                result = subprocess.run(["sudo", "sh", "-c", AVAHI_ENABLE_SCRIPT],
+                                      input=AVAHI_SERVICE_XML,
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+                error_output = result.stderr.decode(errors="replace").strip()
                 
                 if result.returncode == 0:
                     logging.info("✅ Meshtastic service file created successfully")
-                    
-                    # Enable and start avahi-daemon service
-                    logging.info("Step 4/4: Enabling and starting avahi-daemon service...")
-                    
-                    result = subprocess.run(["sudo", "systemctl", "enable", "avahi-daemon"], 
-                                          capture_output=True, text=True)
-                    if result.returncode == 0:
-                        logging.info("✅ avahi-daemon enabled to start on boot")
-                    else:
-                        logging.warning("⚠️ Failed to enable avahi-daemon")
-                    
-                    result = subprocess.run(["sudo", "systemctl", "start", "avahi-daemon"], 
-                                          capture_output=True, text=True)
-                    if result.returncode == 0:
-                        logging.info("✅ avahi-daemon started successfully")
-                    else:
-                        logging.warning("⚠️ Failed to start avahi-daemon")
-                    
+                    logging.info("✅ avahi-daemon enabled and started")
                     logging.info("✅ AVAHI SETUP COMPLETED SUCCESSFULLY!")
                     logging.info("Android clients can now auto-discover this device")
                     logging.info("The device will advertise as 'Meshtastic' on port 4403")
+                elif os.path.exists(service_file):
+                    logging.warning(f"⚠️ Service file written but avahi-daemon failed to start: {error_output}")
                 else:
-                    logging.error("❌ Failed to create service file")
+                    logging.error(f"❌ Failed to create service file: {error_output}")
                     
                 logging.info("="*50)
-                self.root.after(0, self.update_status_indicators)
+                self._invalidate_status_cache(*AVAHI_STATUS_CHECKS)
+                self.root.after(0, self.request_status_update)
                 
             except Exception as e:
                 logging.error(f"❌ AVAHI SETUP ERROR: {e}")
                 logging.info("="*50)
                 
-        threading.Thread(target=worker, daemon=True).start()
+        self._cli_exec.submit(self._run_locked, worker, "Avahi setup")
         
     def disable_avahi(self):
         """Disable Avahi and remove Meshtastic service"""
@@ -2487,35 +3382,16 @@ Choose what to do:"""
                 logging.info("STARTING AVAHI REMOVAL")
                 logging.info("="*50)
                 
-                # Stop avahi-daemon service
-                logging.info("Step 1/3: Stopping avahi-daemon service...")
-                result = subprocess.run(["sudo", "systemctl", "stop", "avahi-daemon"], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
-                    logging.info("✅ avahi-daemon service stopped")
-                else:
-                    logging.info("ℹ️ avahi-daemon was not running or already stopped")
-                
-                # Disable avahi-daemon from starting on boot
-                logging.info("Step 2/3: Disabling avahi-daemon from starting on boot...")
-                result = subprocess.run(["sudo", "systemctl", "disable", "avahi-daemon"], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
-                    logging.info("✅ avahi-daemon disabled from starting on boot")
-                else:
-                    logging.info("ℹ️ avahi-daemon was not enabled or already disabled")
-                
-                # Remove Meshtastic service file
-                logging.info("Step 3/3: Removing Meshtastic service file...")
-                service_file = "/etc/avahi/services/meshtastic.service"
-                
-                if os.path.exists(service_file):
-                    result = subprocess.run(["sudo", "rm", service_file], 
-                                          capture_output=True, text=True)
-                    if result.returncode == 0:
-                        logging.info("✅ Meshtastic service file removed")
-                    else:
-                        logging.warning("⚠️ Failed to remove Meshtastic service file")
+                # disable --now stops and disables in one systemd transaction; the rm shares the same shell
+                logging.info("Stopping and disabling avahi-daemon, removing Meshtastic service file...")
+                had_service_file = os.path.exists(AVAHI_SERVICE_FILE)
+                result = subprocess.run(["sudo", "sh", "-c", AVAHI_DISABLE_SCRIPT],
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+                if result.returncode != 0:
+                    # rm -f runs last, so a non-zero status means the file could not be removed
+                    logging.warning(f"⚠️ Failed to remove Meshtastic service file: {result.stderr.strip()}")
+                elif had_service_file:
+                    logging.info("✅ Meshtastic service file removed")
                 else:
                     logging.info("ℹ️ Meshtastic service file was not found")
                 
@@ -2524,13 +3400,14 @@ Choose what to do:"""
                 logging.info("avahi-daemon service has been stopped and disabled")
                 logging.info("="*50)
                 
-                self.root.after(0, self.update_status_indicators)
+                self._invalidate_status_cache(*AVAHI_STATUS_CHECKS)
+                self.root.after(0, self.request_status_update)
                 
             except Exception as e:
                 logging.error(f"❌ AVAHI REMOVAL ERROR: {e}")
                 logging.info("="*50)
                 
-        threading.Thread(target=worker, daemon=True).start()
+        self._cli_exec.submit(self._run_locked, worker, "Avahi removal")
             
     def configure_meshadv_mini(self):
         """Configure MeshAdv Mini specific settings"""
@@ -2538,20 +3415,14 @@ Choose what to do:"""
             try:
                 logging.info("Configuring MeshAdv Mini GPIO and PPS settings...")
                 
-                # Read current config.txt
-                config_file = "/boot/firmware/config.txt"
-                backup_file = f"{config_file}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                
-                # Backup original
-                subprocess.run(["sudo", "cp", config_file, backup_file], check=True)
-                logging.info(f"Backed up config.txt to {backup_file}")
-                
-                # Read current config
-                result = subprocess.run(["sudo", "cat", config_file], capture_output=True, text=True, check=True)
-                config_content = result.stdout
-                
-                # MeshAdv Mini specific configurations
-                meshadv_config = """
+                # Hold the config.txt lock so this doesn't race a queued flush or raspi-config
+                with self._boot_write_lock:
+                    # Read current config, then back up the original from that copy
+                    config_content, _ = self._read_boot_config()
+                    self._backup_boot_config(config_content)
+                    
+                    # MeshAdv Mini specific configurations
+                    meshadv_config = """
 # MeshAdv Mini Configuration
 # GPIO 4 configuration - turn on at boot
 gpio=4=op,dh
@@ -2559,26 +3430,26 @@ gpio=4=op,dh
 # PPS configuration for GPS on GPIO 17
 dtoverlay=pps-gpio,gpiopin=17
 """
-                
-                # Check if already configured
-                if "MeshAdv Mini Configuration" not in config_content:
-                    # Add configuration
-                    config_content += meshadv_config
                     
-                    # Write updated config using sudo
-                    subprocess.run(["sudo", "tee", config_file], input=config_content, text=True, check=True)
+                    # Check if already configured
+                    if "MeshAdv Mini Configuration" not in config_content:
+                        # Add configuration
+                        config_content += meshadv_config
                         
-                    logging.info("MeshAdv Mini configuration added to config.txt")
-                    logging.info("Reboot required for changes to take effect")
+                        # Write updated config using sudo
+                        self._write_boot_config(config_content)
+                        
+                        logging.info("MeshAdv Mini configuration added to config.txt")
+                        logging.info("Reboot required for changes to take effect")
                     
-                    self.root.after(0, lambda: messagebox.showinfo(
-                        "Configuration Complete", 
-                        "MeshAdv Mini configuration added.\nReboot required for changes to take effect."
-                    ))
-                else:
-                    logging.info("MeshAdv Mini configuration already present")
+                        self.root.after(0, lambda: _messagebox().showinfo(
+                            "Configuration Complete", 
+                            "MeshAdv Mini configuration added.\nReboot required for changes to take effect."
+                        ))
+                    else:
+                        logging.info("MeshAdv Mini configuration already present")
                     
-                self.root.after(0, self.update_status_indicators)
+                self.root.after(0, self.request_status_update)
                 
             except Exception as e:
                 logging.error(f"MeshAdv Mini configuration error: {e}")
@@ -2593,20 +3464,26 @@ def main():
     try:
         import yaml
     except ImportError:
-        if messagebox.askyesno("Missing Dependency", 
+        if _messagebox().askyesno("Missing Dependency", 
                              "PyYAML is required for YAML configuration support.\n"
                              "Install it now? (sudo apt install python3-yaml)"):
             try:
                 subprocess.run(["sudo", "apt", "install", "-y", "python3-yaml"], check=True)
-                messagebox.showinfo("Success", "PyYAML installed successfully!")
+                _messagebox().showinfo("Success", "PyYAML installed successfully!")
             except subprocess.CalledProcessError:
-                messagebox.showwarning("Installation Failed", 
+                _messagebox().showwarning("Installation Failed", 
                                      "Could not install PyYAML automatically.\n"
                                      "Please install manually: sudo apt install python3-yaml")
     
+    # Authenticate sudo up front, before any worker thread starts issuing sudo commands
+    sudo_ready = _prime_sudo()
+    
     # Create and run GUI
     root = tk.Tk()
     app = MeshtasticGUI(root)
+    # Logged only now so it reaches the GUI's log rather than a terminal that may not exist
+    if not sudo_ready:
+        logging.warning("⚠️ sudo credentials not available; privileged actions will fail until you run 'sudo -v' or start the tool with sudo")
     
     try:
         root.mainloop()
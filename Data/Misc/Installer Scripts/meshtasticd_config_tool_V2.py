@@ -20,12 +20,15 @@ import threading
 import queue
 import time
 import select
+import selectors
+import weakref
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Tuple, List, Callable
+from typing import Optional, Dict, Tuple, List, Callable, Any, FrozenSet
 from dataclasses import dataclass
 from enum import Enum
-from concurrent.futures import ThreadPoolExecutor, Future
+from concurrent.futures import ThreadPoolExecutor, Future, wait
 import contextlib
 
 # Configuration Management
@@ -60,6 +63,10 @@ class AppConfig:
     
     # Status update interval (milliseconds)
     STATUS_UPDATE_INTERVAL: int = 100
+    STATUS_DEBOUNCE_MS: int = 150
+    
+    # Seconds between refreshes of the sudo timestamp (sudo's default timeout is 15 minutes)
+    SUDO_REFRESH_INTERVAL: int = 240
 
 class StatusType(Enum):
     """Status types for indicators"""
@@ -76,6 +83,17 @@ class OperationResult:
         self.message = message
         self.details = details
 
+class CommandResult:
+    """Outcome of a probe command; a command that couldn't run or timed out has returncode -1"""
+    def __init__(self, returncode: int, stdout: str = "", stderr: str = ""):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+    
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
 # Error Management
 class MeshtasticError(Exception):
     """Base exception for Meshtastic operations"""
@@ -97,9 +115,16 @@ class HardwareError(MeshtasticError):
 class HardwareDetector:
     """Handles hardware detection for Pi model and HATs"""
     
-    def __init__(self):
+    VERSION_CACHE_TTL = 10.0
+    
+    def __init__(self, system_manager: Optional["SystemManager"] = None):
+        # Answers version lookups from its package index when given
+        self.system = system_manager
         self.pi_model: Optional[str] = None
         self.hat_info: Optional[Dict[str, str]] = None
+        self._is_pi5 = False
+        # (time.monotonic() of the lookup, version), see _get_meshtasticd_version
+        self._version_cache: Tuple[float, str] = (0.0, "")
         self._detect_hardware()
     
     def _detect_hardware(self):
@@ -110,12 +135,21 @@ class HardwareDetector:
         except Exception as e:
             logging.warning(f"Hardware detection error: {e}")
     
+    @staticmethod
+    def _read_device_tree(name: str) -> Optional[str]:
+        """Read a /proc/device-tree string property, or None if the node doesn't exist"""
+        try:
+            with open(f"/proc/device-tree/{name}", "r") as f:
+                return f.read().strip().replace('\x00', '')
+        except FileNotFoundError:
+            return None
+    
     def _detect_pi_model(self):
         """Detect Raspberry Pi model"""
         try:
-            if os.path.exists("/proc/device-tree/model"):
-                with open("/proc/device-tree/model", "r") as f:
-                    self.pi_model = f.read().strip().replace('\x00', '')
+            self.pi_model = self._read_device_tree("model")
+            # The model can't change while we run, so settle this once
+            self._is_pi5 = bool(self.pi_model and "Raspberry Pi 5" in self.pi_model)
         except Exception as e:
             logging.warning(f"Failed to detect Pi model: {e}")
     
@@ -123,12 +157,10 @@ class HardwareDetector:
         """Detect HAT information"""
         try:
             hat_info = {}
-            if os.path.exists("/proc/device-tree/hat/product"):
-                with open("/proc/device-tree/hat/product", "r") as f:
-                    hat_info["product"] = f.read().strip().replace('\x00', '')
-            if os.path.exists("/proc/device-tree/hat/vendor"):
-                with open("/proc/device-tree/hat/vendor", "r") as f:
-                    hat_info["vendor"] = f.read().strip().replace('\x00', '')
+            for key in ("product", "vendor"):
+                value = self._read_device_tree(f"hat/{key}")
+                if value is not None:
+                    hat_info[key] = value
             if hat_info:
                 self.hat_info = hat_info
         except Exception as e:
@@ -136,7 +168,7 @@ class HardwareDetector:
     
     def is_pi5(self) -> bool:
         """Check if this is a Raspberry Pi 5"""
-        return self.pi_model and "Raspberry Pi 5" in self.pi_model
+        return self._is_pi5
     
     def get_hardware_info(self) -> Dict[str, str]:
         """Get formatted hardware information"""
@@ -147,18 +179,30 @@ class HardwareDetector:
             "meshtasticd_version": self._get_meshtasticd_version()
         }
     
+    def invalidate_version(self):
+        """Forget the cached meshtasticd version after installing or removing it"""
+        self._version_cache = (0.0, "")
+    
     def _get_meshtasticd_version(self) -> str:
-        """Get meshtasticd version using dpkg-query"""
+        """Get meshtasticd version, looked up with dpkg-query at most every VERSION_CACHE_TTL seconds"""
+        checked_at, version = self._version_cache
+        if version and time.monotonic() - checked_at < self.VERSION_CACHE_TTL:
+            return version
+        version = self._query_meshtasticd_version()
+        self._version_cache = (time.monotonic(), version)
+        return version
+    
+    def _query_meshtasticd_version(self) -> str:
+        """Get meshtasticd version from the package index, or with dpkg-query when there is none"""
+        if self.system is not None:
+            return self.system.package_version("meshtasticd") or "Not installed"
         try:
             result = subprocess.run(["dpkg-query", "-W", "-f=${Version}", "meshtasticd"], 
                                   capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                version = result.stdout.strip()
-                return version if version else "Not installed"
-            else:
-                return "Not installed"
-        except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
+        except (subprocess.TimeoutExpired, OSError):
             return "Not installed"
+        version = result.stdout.strip() if result.returncode == 0 else ""
+        return version if version else "Not installed"
 
 # Thread Management
 class ThreadManager:
@@ -166,16 +210,13 @@ class ThreadManager:
     
     def __init__(self, max_workers: int = 4):
         self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="MeshtasticWorker")
-        self.active_futures: List[Future] = []
+        # Futures drop out on their own once neither the pool nor the caller holds them
+        self.active_futures: weakref.WeakSet[Future] = weakref.WeakSet()
     
     def submit_task(self, func: Callable, *args, **kwargs) -> Future:
         """Submit a task to the thread pool"""
         future = self.executor.submit(func, *args, **kwargs)
-        self.active_futures.append(future)
-        
-        # Clean up completed futures
-        self.active_futures = [f for f in self.active_futures if not f.done()]
-        
+        self.active_futures.add(future)
         return future
     
     def shutdown(self, wait: bool = True):
@@ -186,8 +227,16 @@ class ThreadManager:
 class SystemManager:
     """Handles all system-level operations"""
     
+    # Seconds the dpkg package index is reused, long enough to cover one status sweep
+    PACKAGE_INDEX_TTL = 5.0
+    
     def __init__(self, config: AppConfig):
         self.config = config
+        # (monotonic time loaded, {package: (dpkg status, version)}), see load_package_index
+        self._package_index: Tuple[float, Dict[str, Tuple[str, str]]] = (0.0, {})
+        self._package_index_lock = threading.Lock()
+        # Whether sudo -n works without a password (None once a lapse has been reported), see prime_sudo
+        self._sudo_ready: Optional[bool] = False
     
     @contextlib.contextmanager
     def safe_file_operation(self, filepath: str, mode: str = 'r'):
@@ -202,15 +251,29 @@ class SystemManager:
             if file_handle:
                 file_handle.close()
     
-    def run_command(self, cmd: List[str], timeout: int = None, input_text: str = None) -> subprocess.CompletedProcess:
-        """Run a command with proper error handling"""
+    def read_file(self, filepath: str) -> str:
+        """Read a text file directly, falling back to sudo cat only if we lack permission"""
+        try:
+            with open(filepath, 'r') as f:
+                return f.read()
+        except PermissionError:
+            result = self.run_sudo_command(["cat", filepath])
+            if result.returncode != 0:
+                raise ConfigurationError(f"Failed to read {filepath}: {result.stderr.strip()}")
+            return result.stdout
+        except Exception as e:
+            raise ConfigurationError(f"File operation failed for {filepath}: {e}")
+    
+    def run_command(self, cmd: List[str], timeout: int = None, input_text: str = None,
+                    text: bool = True) -> subprocess.CompletedProcess:
+        """Run a command with proper error handling (text=False keeps output as raw bytes)"""
         timeout = timeout or self.config.DEFAULT_TIMEOUT
         
         try:
             result = subprocess.run(
                 cmd, 
                 capture_output=True, 
-                text=True, 
+                text=text, 
                 timeout=timeout,
                 input=input_text
             )
@@ -220,34 +283,212 @@ class SystemManager:
         except Exception as e:
             raise MeshtasticError(f"Command failed: {e}")
     
+    def probe_command(self, cmd: List[str], timeout: int = None) -> CommandResult:
+        """Run a read-only check; failures come back as a CommandResult instead of an exception"""
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True,
+                                    timeout=timeout or self.config.CLI_TIMEOUT)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            return CommandResult(-1, "", str(e))
+        return CommandResult(result.returncode, result.stdout, result.stderr)
+    
+    def run_command_streaming(self, cmd: List[str], on_line: Callable[[str], None] = logging.info,
+                              timeout: int = None, input_text: str = None, env: Dict[str, str] = None,
+                              tail_lines: int = 200) -> subprocess.CompletedProcess:
+        """Run a command, passing each line of its combined stdout/stderr to on_line as it arrives.
+        
+        Only the last tail_lines lines are kept, returned as the result's stdout (stderr is merged in).
+        """
+        timeout = timeout or self.config.DEFAULT_TIMEOUT
+        deadline = time.monotonic() + timeout
+        tail = deque(maxlen=tail_lines)
+        
+        try:
+            process = subprocess.Popen(cmd, stdin=subprocess.PIPE if input_text is not None else subprocess.DEVNULL,
+                                       stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env)
+        except Exception as e:
+            raise MeshtasticError(f"Command failed: {e}")
+        
+        def emit(raw: bytes):
+            line = raw.decode(errors="replace").rstrip()
+            if line:
+                tail.append(line)
+                on_line(line)
+        
+        try:
+            if input_text is not None:
+                process.stdin.write(input_text.encode())
+                process.stdin.close()
+            
+            fd = process.stdout.fileno()
+            pending = b""
+            with selectors.DefaultSelector() as selector:
+                selector.register(fd, selectors.EVENT_READ)
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        process.kill()
+                        process.wait()
+                        raise MeshtasticError(f"Command timed out: {' '.join(cmd)}")
+                    if not selector.select(remaining):
+                        continue
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        break
+                    *lines, pending = (pending + chunk).split(b"\n")
+                    for raw in lines:
+                        emit(raw)
+            emit(pending)
+            returncode = process.wait()
+        finally:
+            process.stdout.close()
+        return subprocess.CompletedProcess(cmd, returncode, "\n".join(tail), "")
+    
+    def as_root(self, cmd: List[str]) -> List[str]:
+        """Prefix cmd with a non-interactive sudo, unless we already are root"""
+        if os.geteuid() == 0:
+            return cmd
+        return ["sudo", "-n"] + cmd
+    
+    def _sudo_validate(self, interactive: bool = False) -> bool:
+        """Check (or with interactive, ask for) sudo credentials and remember whether sudo -n works"""
+        try:
+            result = subprocess.run(["sudo", "-v"] if interactive else ["sudo", "-n", "-v"],
+                                    stdout=subprocess.DEVNULL, stderr=None if interactive else subprocess.DEVNULL,
+                                    timeout=self.config.CLI_TIMEOUT * 4)
+            ready = result.returncode == 0
+        except Exception as e:
+            logging.warning(f"⚠️ Could not validate sudo credentials: {e}")
+            ready = False
+        if ready:
+            self._sudo_ready = True
+        else:
+            self._report_sudo_lapse()
+        return ready
+    
+    def _report_sudo_lapse(self):
+        """Log once per lapse that elevated commands will fail until sudo has credentials again"""
+        if self._sudo_ready is None:
+            return
+        self._sudo_ready = None
+        logging.error("🔐 sudo credentials required — run 'sudo -v' in a terminal or start the tool with sudo")
+    
+    def prime_sudo(self):
+        """Validate sudo credentials once, then keep the timestamp fresh every SUDO_REFRESH_INTERVAL seconds.
+        
+        Only prompts when started from a terminal; sudo -n never prompts, so without cached
+        credentials elevated commands fail with one logged error rather than a prompt each.
+        """
+        if os.geteuid() == 0:
+            return
+        self._sudo_validate(interactive=sys.stdin.isatty())
+        
+        def refresh():
+            self._sudo_validate()
+            schedule()
+        
+        def schedule():
+            timer = threading.Timer(self.config.SUDO_REFRESH_INTERVAL, refresh)
+            timer.daemon = True
+            timer.start()
+        
+        schedule()
+    
+    def _check_sudo_result(self, result: subprocess.CompletedProcess) -> subprocess.CompletedProcess:
+        """Report a sudo -n refused for want of a password, once, rather than per command"""
+        if result.returncode != 0 and "a password is required" in f"{result.stdout or ''}{result.stderr or ''}":
+            self._report_sudo_lapse()
+        return result
+    
     def run_sudo_command(self, cmd: List[str], timeout: int = None, input_text: str = None) -> subprocess.CompletedProcess:
-        """Run a command with sudo"""
-        sudo_cmd = ["sudo"] + cmd
-        return self.run_command(sudo_cmd, timeout, input_text)
+        """run_command as root"""
+        return self._check_sudo_result(self.run_command(self.as_root(cmd), timeout, input_text))
+    
+    def run_sudo_streaming(self, cmd: List[str], timeout: int = None,
+                           input_text: str = None) -> subprocess.CompletedProcess:
+        """run_command_streaming as root"""
+        return self._check_sudo_result(
+            self.run_command_streaming(self.as_root(cmd), timeout=timeout, input_text=input_text))
+    
+    def run_batched_checks(self, specs: List[Tuple[str, str]]) -> Dict[str, str]:
+        """Run several shell checks in a single bash process.
+        
+        Each spec is (name, shell command); returns {name: command output on one line}.
+        A check that prints nothing maps to ""; if bash itself fails the dict is empty.
+        """
+        script = "\n".join(
+            f"printf '%s=%s\\n' {name} \"$( ({command}) 2>/dev/null | tr '\\n' ' ')\""
+            for name, command in specs
+        )
+        results = {}
+        result = self.probe_command(["bash", "-c", script], timeout=30)
+        if result.returncode < 0:
+            logging.warning(f"Batched status checks failed: {result.stderr}")
+            return results
+        for line in result.stdout.splitlines():
+            name, _, value = line.partition("=")
+            results[name] = value.strip()
+        return results
+    
+    def load_package_index(self) -> Dict[str, Tuple[str, str]]:
+        """Map every package dpkg knows to its (status, version), from one dpkg-query reused for PACKAGE_INDEX_TTL seconds"""
+        with self._package_index_lock:
+            loaded_at, index = self._package_index
+            if index and time.monotonic() - loaded_at < self.PACKAGE_INDEX_TTL:
+                return index
+            index = {}
+            result = self.probe_command(["dpkg-query", "-W", "-f=${Package}\t${Status}\t${Version}\n"])
+            if result.returncode < 0:
+                logging.warning(f"⚠️ Could not read the dpkg package list: {result.stderr}")
+            for line in result.stdout.splitlines():
+                name, _, rest = line.partition("\t")
+                status, _, version = rest.partition("\t")
+                # Multiarch packages are listed once per architecture; keep an installed entry
+                if not index.get(name, ("", ""))[0].endswith(" installed"):
+                    index[name] = (status, version)
+            self._package_index = (time.monotonic(), index)
+            return index
+    
+    def invalidate_package_index(self):
+        """Forget the cached package index after installing or removing packages"""
+        with self._package_index_lock:
+            self._package_index = (0.0, {})
     
     def check_package_installed(self, package_name: str) -> bool:
         """Check if a package is installed via dpkg"""
-        try:
-            result = self.run_command(["dpkg", "-l", package_name])
-            return result.returncode == 0 and "ii" in result.stdout
-        except:
-            return False
+        # Status is "<want> <error> <state>"; "installed" is the state shown as ii (or hi when held) by dpkg -l
+        return self.load_package_index().get(package_name, ("", ""))[0].endswith(" installed")
+    
+    def package_version(self, package_name: str) -> Optional[str]:
+        """Version of an installed package from the package index, None if it isn't installed"""
+        status, version = self.load_package_index().get(package_name, ("", ""))
+        return version if status.endswith(" installed") and version else None
+    
+    @staticmethod
+    def service_state_command(service_name: str) -> List[str]:
+        """systemctl call printing a unit's UnitFileState and ActiveState as KEY=value"""
+        return ["systemctl", "show", "-p", "UnitFileState", "-p", "ActiveState", service_name]
+    
+    @staticmethod
+    def parse_service_state(output: str) -> Tuple[bool, bool]:
+        """(is_enabled, is_active) from service_state_command output, on separate lines or one"""
+        state = dict(field.split("=", 1) for field in output.split() if "=" in field)
+        return state.get("UnitFileState") == "enabled", state.get("ActiveState") == "active"
+    
+    def get_service_state(self, service_name: str) -> Tuple[bool, bool]:
+        """Return (is_enabled, is_active) for a service from a single systemctl call"""
+        result = self.probe_command(self.service_state_command(service_name))
+        if not result.ok:
+            return False, False
+        return self.parse_service_state(result.stdout)
     
     def check_service_enabled(self, service_name: str) -> bool:
         """Check if a service is enabled"""
-        try:
-            result = self.run_command(["systemctl", "is-enabled", service_name])
-            return result.returncode == 0 and result.stdout.strip() == "enabled"
-        except:
-            return False
+        return self.get_service_state(service_name)[0]
     
     def check_service_active(self, service_name: str) -> bool:
         """Check if a service is active"""
-        try:
-            result = self.run_command(["systemctl", "is-active", service_name])
-            return result.returncode == 0 and result.stdout.strip() == "active"
-        except:
-            return False
+        return self.get_service_state(service_name)[1]
     
     def backup_file(self, filepath: str) -> str:
         """Create a backup of a file"""
@@ -255,54 +496,258 @@ class SystemManager:
         backup_path = f"{filepath}.backup_{timestamp}"
         
         try:
-            self.run_sudo_command(["cp", filepath, backup_path])
+            if os.geteuid() == 0:
+                shutil.copy2(filepath, backup_path)
+            else:
+                self.run_sudo_command(["cp", filepath, backup_path])
             return backup_path
         except Exception as e:
             raise ConfigurationError(f"Failed to backup {filepath}: {e}")
+    
+    def write_file_atomic(self, filepath: str, content: str):
+        """Replace a root-owned file by writing a sibling temp file and renaming it over the original.
+        
+        Runs in-process when already root, otherwise as a single sudo shell fed through stdin.
+        """
+        tmp_path = f"{filepath}.tmp"
+        if os.geteuid() == 0:
+            with self.safe_file_operation(tmp_path, 'w') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+            return
+        result = self.run_sudo_command(["sh", "-c", 'cat > "$1.tmp" && mv -f "$1.tmp" "$1"', "sh", filepath],
+                                       input_text=content)
+        if result.returncode != 0:
+            raise ConfigurationError(f"Failed to write {filepath}: {result.stderr.strip()}")
+
+# In-process meshtasticd connection
+class MeshtasticClient:
+    """Reads settings from the local meshtasticd in-process, so reads don't start the meshtastic CLI each time.
+    
+    Every read opens its own TCPInterface, which downloads the node's current config, and closes it
+    again: meshtasticd serves one API client at a time, and a held connection would go stale.
+    Unavailable when the meshtastic library isn't importable by this interpreter (it's usually
+    installed with pipx); callers then fall back to the CLI.
+    """
+    
+    # Seconds to wait before connecting again after a failure, doubling up to the maximum
+    RECONNECT_BACKOFF = 5.0
+    RECONNECT_BACKOFF_MAX = 120.0
+    
+    def __init__(self, hostname: str = "localhost"):
+        self.hostname = hostname
+        self._interface_class = None
+        self._import_failed = False
+        self._backoff = self.RECONNECT_BACKOFF
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+    
+    def _connect(self):
+        """A fresh connection with the node's config loaded; None while unavailable or backing off"""
+        if self._import_failed or time.monotonic() < self._retry_at:
+            return None
+        if self._interface_class is None:
+            try:
+                from meshtastic.tcp_interface import TCPInterface
+            except ImportError:
+                logging.debug("meshtastic library not importable, using the CLI")
+                self._import_failed = True
+                return None
+            self._interface_class = TCPInterface
+        return self._interface_class(hostname=self.hostname)
+    
+    def get_region(self) -> Optional[str]:
+        """Current LoRa region name, or None if it couldn't be read in-process"""
+        with self._lock:
+            iface = None
+            try:
+                iface = self._connect()
+                if iface is None:
+                    return None
+                lora = iface.localNode.localConfig.lora
+                region = lora.DESCRIPTOR.fields_by_name["region"].enum_type.values_by_number[lora.region].name
+                self._backoff = self.RECONNECT_BACKOFF
+                return region
+            except Exception as e:
+                logging.debug(f"In-process region read failed: {e}")
+                self._retry_at = time.monotonic() + self._backoff
+                self._backoff = min(self._backoff * 2, self.RECONNECT_BACKOFF_MAX)
+                return None
+            finally:
+                if iface is not None:
+                    try:
+                        iface.close()
+                    except Exception as e:
+                        logging.debug(f"Closing meshtastic interface failed: {e}")
 
 # Status Checking
 class StatusChecker:
     """Handles all status checking operations"""
     
+    # Seconds a sweep waits for its checks; the region query alone may take 10
+    SWEEP_TIMEOUT = 15
+    # Results reported for checks that failed or timed out (anything else reports False)
+    SWEEP_DEFAULTS = {"lora_region": "Error", "meshtasticd_version": "Not installed"}
+    
+    # Region names and the numeric values the CLI may print instead, both mapped to the name
+    REGION_TABLE = {
+        "0": "UNSET", "1": "US", "2": "EU_433", "3": "EU_868",
+        "4": "CN", "5": "JP", "6": "ANZ", "7": "KR", "8": "TW",
+        "9": "RU", "10": "IN", "11": "NZ_865", "12": "TH",
+        "13": "UA_433", "14": "UA_868", "15": "MY_433",
+        "16": "MY_919", "17": "SG_923",
+        **{name: name for name in ("UNSET", "US", "EU_868", "EU_433", "ANZ", "CN", "IN", "JP", "KR",
+                                   "MY_433", "MY_919", "RU", "SG_923", "TH", "TW", "UA_433", "UA_868")},
+    }
+    # A "lora.region: VALUE" field, or a line holding just a number or just a region name
+    REGION_RE = re.compile(r"lora\.region\s*:[ \t]*(\S+)|^[ \t]*(\d+)[ \t]*$|^[ \t]*([A-Z][A-Z0-9_]*)[ \t]*$", re.M)
+    
     def __init__(self, config: AppConfig, system_manager: SystemManager, hardware: HardwareDetector):
         self.config = config
         self.system = system_manager
         self.hardware = hardware
+        # Reads the LoRa region without starting the CLI when the meshtastic library is available
+        self.mesh_client = MeshtasticClient()
+        # Results of the batched checks while a status sweep is running
+        self._sweep_results: Optional[Dict[str, str]] = None
+        # Runs the checks of a sweep concurrently, created on first use
+        self._sweep_pool: Optional[ThreadPoolExecutor] = None
+        # {directory: entry names} listed once at the start of a status sweep, see _dir_entries
+        self._dir_cache: Optional[Dict[str, FrozenSet[str]]] = None
+        # ((st_mtime_ns, st_size), content, directives) of the last boot config read, see _read_boot_config
+        self._boot_config_cache: Optional[Tuple[Tuple[int, int], str, FrozenSet[str]]] = None
+    
+    def _batched_check_specs(self) -> List[Tuple[str, str]]:
+        """Shell checks run together by SystemManager.run_batched_checks"""
+        pkg = self.config.PKG_NAME
+        return [
+            ("meshtasticd_state", " ".join(SystemManager.service_state_command(pkg))),
+            # Like before: a meshtastic on PATH must run; otherwise look in pipx's list
+            ("python_cli", "if command -v meshtastic >/dev/null; then meshtastic --version >/dev/null && echo yes; "
+                           "else pipx list | grep -q meshtastic && echo yes; fi"),
+        ]
+    
+    def _batched_checks(self) -> Dict[str, str]:
+        """Results of the batched checks, shared by every check in the current status sweep"""
+        if self._sweep_results is not None:
+            return self._sweep_results
+        return self.system.run_batched_checks(self._batched_check_specs())
+    
+    @contextlib.contextmanager
+    def status_sweep(self):
+        """Run the batched checks and list the probed directories once for all status checks made inside the block"""
+        self._sweep_results = self.system.run_batched_checks(self._batched_check_specs())
+        self._dir_cache = {path: self._list_dir(path) for path in self._probe_dirs()}
+        try:
+            yield
+        finally:
+            self._sweep_results = None
+            self._dir_cache = None
+    
+    def sweep(self) -> Dict[str, Any]:
+        """Run every status check concurrently; returns {check name: result}.
+        
+        Checks that fail or don't finish within SWEEP_TIMEOUT get their SWEEP_DEFAULTS value.
+        """
+        checks = {
+            "meshtasticd": self.check_meshtasticd_status,
+            "spi": self.check_spi_status,
+            "i2c": self.check_i2c_status,
+            "gps_uart": self.check_gps_uart_status,
+            "hat_specific": self.check_hat_specific_status,
+            "hat_config": self.check_hat_config_status,
+            "config_exists": self.check_config_exists,
+            "python_cli": self.check_python_cli_status,
+            "lora_region": self.check_lora_region_status,
+            "avahi": self.check_avahi_status,
+            "boot": self.check_meshtasticd_boot_status,
+            "service": self.check_meshtasticd_service_status,
+            "meshtasticd_version": self.hardware._get_meshtasticd_version,
+        }
+        if self._sweep_pool is None:
+            self._sweep_pool = ThreadPoolExecutor(max_workers=min(8, len(checks)),
+                                                  thread_name_prefix="MeshtasticStatus")
+        
+        with self.status_sweep():
+            futures = {name: self._sweep_pool.submit(check) for name, check in checks.items()}
+            wait(futures.values(), timeout=self.SWEEP_TIMEOUT)
+        
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result(timeout=0)
+            except Exception as e:
+                logging.warning(f"Status check {name} failed: {e}")
+                results[name] = self.SWEEP_DEFAULTS.get(name, False)
+        return results
     
     def check_meshtasticd_status(self) -> bool:
         """Check if meshtasticd is installed"""
+        # Check via dpkg
+        dpkg_installed = self.system.check_package_installed(self.config.PKG_NAME)
+        
+        # Check if binary exists
+        binary_paths = ["/usr/sbin/meshtasticd", "/usr/bin/meshtasticd"]
+        binary_exists = any(os.path.exists(path) for path in binary_paths)
+        
+        # Look it up on PATH in-process
+        which_found = shutil.which(self.config.PKG_NAME) is not None
+        
+        return dpkg_installed or binary_exists or which_found
+    
+    def _read_boot_config(self) -> str:
+        """Read the boot config, reusing the last read while the file's mtime and size are unchanged"""
+        st = os.stat(self.config.BOOT_CONFIG_FILE)
+        # The FAT boot partition only keeps 2-second mtimes, so the size guards quick rewrites
+        key = (st.st_mtime_ns, st.st_size)
+        if self._boot_config_cache is None or self._boot_config_cache[0] != key:
+            with open(self.config.BOOT_CONFIG_FILE, "r") as f:
+                content = f.read()
+            # Active directive lines, without comments or surrounding whitespace
+            directives = frozenset(filter(None, (line.split("#", 1)[0].strip() for line in content.splitlines())))
+            self._boot_config_cache = (key, content, directives)
+        return self._boot_config_cache[1]
+    
+    def _boot_directives(self) -> FrozenSet[str]:
+        """The boot config's active directive lines, for exact O(1) presence checks"""
+        self._read_boot_config()
+        return self._boot_config_cache[2]
+    
+    def _probe_dirs(self) -> List[str]:
+        """Directories whose entries the status checks look up"""
+        return ["/dev", self.config.CONFIG_DIR, f"{self.config.CONFIG_DIR}/config.d"]
+    
+    @staticmethod
+    def _list_dir(path: str) -> FrozenSet[str]:
+        """Names in a directory; empty if it doesn't exist or can't be read"""
         try:
-            # Check via dpkg
-            dpkg_installed = self.system.check_package_installed(self.config.PKG_NAME)
-            
-            # Check if binary exists
-            binary_paths = ["/usr/sbin/meshtasticd", "/usr/bin/meshtasticd"]
-            binary_exists = any(os.path.exists(path) for path in binary_paths)
-            
-            # Check with which command
-            which_found = False
-            try:
-                result = self.system.run_command(["which", self.config.PKG_NAME])
-                which_found = result.returncode == 0
-            except:
-                pass
-            
-            return dpkg_installed or binary_exists or which_found
-        except:
-            return False
+            return frozenset(os.listdir(path))
+        except OSError:
+            return frozenset()
+    
+    def _dir_entries(self, path: str) -> FrozenSet[str]:
+        """Names in a directory, from the sweep's listing when one is running"""
+        if self._dir_cache is not None and path in self._dir_cache:
+            return self._dir_cache[path]
+        return self._list_dir(path)
+    
+    def _any_dev(self, prefix: str) -> bool:
+        """Check for a /dev entry starting with prefix"""
+        return any(name.startswith(prefix) for name in self._dir_entries("/dev"))
     
     def check_spi_status(self) -> bool:
         """Check if SPI is enabled"""
-        # Check if devices exist
-        devices_exist = os.path.exists("/dev/spidev0.0") or os.path.exists("/dev/spidev0.1")
+        # Check if devices exist (spidev0.0 / spidev0.1)
+        devices_exist = self._any_dev("spidev0.")
         
         # Check if configured in boot config
         config_enabled = False
         try:
-            with open(self.config.BOOT_CONFIG_FILE, "r") as f:
-                config_content = f.read()
-            has_spi_param = "dtparam=spi=on" in config_content
-            has_spi_overlay = "dtoverlay=spi0-0cs" in config_content
+            directives = self._boot_directives()
+            has_spi_param = "dtparam=spi=on" in directives
+            has_spi_overlay = "dtoverlay=spi0-0cs" in directives
             config_enabled = has_spi_param and has_spi_overlay
         except:
             pass
@@ -311,13 +756,11 @@ class StatusChecker:
     
     def check_i2c_status(self) -> bool:
         """Check if I2C is enabled"""
-        devices_exist = any(os.path.exists(f"/dev/i2c-{i}") for i in range(0, 10))
+        devices_exist = self._any_dev("i2c-")
         
         config_enabled = False
         try:
-            with open(self.config.BOOT_CONFIG_FILE, "r") as f:
-                config_content = f.read()
-            config_enabled = "dtparam=i2c_arm=on" in config_content
+            config_enabled = "dtparam=i2c_arm=on" in self._boot_directives()
         except:
             pass
             
@@ -326,13 +769,12 @@ class StatusChecker:
     def check_gps_uart_status(self) -> bool:
         """Check if GPS/UART is enabled"""
         try:
-            with open(self.config.BOOT_CONFIG_FILE, "r") as f:
-                config_content = f.read()
+            directives = self._boot_directives()
             
-            has_uart_enabled = "enable_uart=1" in config_content
+            has_uart_enabled = "enable_uart=1" in directives
             
             if self.hardware.is_pi5():
-                has_uart0_overlay = "dtoverlay=uart0" in config_content
+                has_uart0_overlay = "dtoverlay=uart0" in directives
                 return has_uart_enabled and has_uart0_overlay
             else:
                 return has_uart_enabled
@@ -345,11 +787,10 @@ class StatusChecker:
             return False
             
         try:
-            with open(self.config.BOOT_CONFIG_FILE, "r") as f:
-                config_content = f.read()
+            directives = self._boot_directives()
                 
-            has_gpio_config = "gpio=4=op,dh" in config_content
-            has_pps_config = "pps-gpio,gpiopin=17" in config_content
+            has_gpio_config = "gpio=4=op,dh" in directives
+            has_pps_config = "dtoverlay=pps-gpio,gpiopin=17" in directives
             
             return has_gpio_config and has_pps_config
         except:
@@ -358,79 +799,40 @@ class StatusChecker:
     def check_hat_config_status(self) -> bool:
         """Check if HAT config file exists"""
         config_d_dir = f"{self.config.CONFIG_DIR}/config.d"
-        if not os.path.exists(config_d_dir):
-            return False
-            
-        try:
-            config_files = list(Path(config_d_dir).glob("*.yaml"))
-            return len(config_files) > 0
-        except:
-            return False
+        return any(name.endswith(".yaml") for name in self._dir_entries(config_d_dir))
     
     def check_config_exists(self) -> bool:
         """Check if config file exists"""
-        return (os.path.exists(f"{self.config.CONFIG_DIR}/config.yaml") or 
-                os.path.exists(f"{self.config.CONFIG_DIR}/config.json"))
+        entries = self._dir_entries(self.config.CONFIG_DIR)
+        return "config.yaml" in entries or "config.json" in entries
     
     def check_python_cli_status(self) -> bool:
         """Check if Meshtastic Python CLI is installed"""
-        try:
-            result = self.system.run_command(["meshtastic", "--version"])
-            return result.returncode == 0
-        except:
-            try:
-                result = self.system.run_command(["pipx", "list"])
-                return "meshtastic" in result.stdout
-            except:
-                return False
+        return self._batched_checks().get("python_cli") == "yes"
     
     def check_lora_region_status(self) -> str:
         """Check current LoRa region setting"""
         try:
+            region = self.mesh_client.get_region()
+            if region is not None:
+                return region
+            
             if not self.check_python_cli_status():
                 return "CLI Not Available"
                 
-            result = self.system.run_command(
+            result = self.system.run_command_streaming(
                 ["meshtastic", "--host", "localhost", "--get", "lora.region"],
-                timeout=10
+                on_line=logging.debug, timeout=10
             )
             
             if result.returncode == 0:
                 output = result.stdout.strip()
                 logging.info(f"Raw CLI output for region: '{output}'")
                 
-                region_map = {
-                    "0": "UNSET", "1": "US", "2": "EU_433", "3": "EU_868",
-                    "4": "CN", "5": "JP", "6": "ANZ", "7": "KR", "8": "TW",
-                    "9": "RU", "10": "IN", "11": "NZ_865", "12": "TH",
-                    "13": "UA_433", "14": "UA_868", "15": "MY_433",
-                    "16": "MY_919", "17": "SG_923"
-                }
-                
-                valid_regions = ["UNSET", "US", "EU_868", "EU_433", "ANZ", "CN", "IN", "JP", "KR", 
-                               "MY_433", "MY_919", "RU", "SG_923", "TH", "TW", "UA_433", "UA_868"]
-                
-                lines = output.split('\n')
-                for line in lines:
-                    line = line.strip()
-                    
-                    if not line or any(skip in line.lower() for skip in ['connected', 'requesting', 'node info']):
-                        continue
-                    
-                    if line in valid_regions:
-                        return line
-                    
-                    if "lora.region:" in line:
-                        parts = line.split(":", 1)
-                        if len(parts) > 1:
-                            value = parts[1].strip()
-                            if value in valid_regions:
-                                return value
-                            if value in region_map:
-                                return region_map[value]
-                    
-                    if line.isdigit() and line in region_map:
-                        return region_map[line]
+                for match in self.REGION_RE.finditer(output):
+                    region = self.REGION_TABLE.get(match.group(1) or match.group(2) or match.group(3))
+                    if region:
+                        return region
                 
                 return "Unknown"
             else:
@@ -441,23 +843,20 @@ class StatusChecker:
     
     def check_avahi_status(self) -> bool:
         """Check if Avahi is installed and configured"""
-        try:
-            avahi_installed = self.system.check_package_installed("avahi-daemon")
-            if not avahi_installed:
-                return False
-                
-            service_file = "/etc/avahi/services/meshtastic.service"
-            return os.path.exists(service_file)
-        except:
+        avahi_installed = self.system.check_package_installed("avahi-daemon")
+        if not avahi_installed:
             return False
+            
+        service_file = "/etc/avahi/services/meshtastic.service"
+        return os.path.exists(service_file)
     
     def check_meshtasticd_boot_status(self) -> bool:
         """Check if meshtasticd is enabled to start on boot"""
-        return self.system.check_service_enabled(self.config.PKG_NAME)
+        return SystemManager.parse_service_state(self._batched_checks().get("meshtasticd_state", ""))[0]
     
     def check_meshtasticd_service_status(self) -> bool:
         """Check if meshtasticd service is currently running"""
-        return self.system.check_service_active(self.config.PKG_NAME)
+        return SystemManager.parse_service_state(self._batched_checks().get("meshtasticd_state", ""))[1]
 
 # Progress Indicator
 class ProgressIndicator:
@@ -591,17 +990,11 @@ class LoggingManager:
     
     def get_messages(self) -> List[str]:
         """Get all pending log messages"""
-        messages = []
-        try:
-            while True:
-                try:
-                    message = self.output_queue.get_nowait()
-                    messages.append(message)
-                except queue.Empty:
-                    break
-        except Exception as e:
-            print(f"Error processing output queue: {e}")
-        
+        # Take the whole backlog under one lock acquisition instead of one get_nowait() per message.
+        # The queue is unbounded and never join()ed, so bypassing get() leaves nothing waiting on it.
+        with self.output_queue.mutex:
+            messages = list(self.output_queue.queue)
+            self.output_queue.queue.clear()
         return messages
 
 # Dependency Manager
@@ -646,19 +1039,73 @@ class DependencyManager:
             except Exception as e:
                 raise MeshtasticError("Failed to install PyYAML")
 
+# Application stylesheet, parsed once into MeshtasticGTK._css_provider
+CSS_DATA = b"""
+.status-green {
+    color: #4CAF50;
+    font-weight: bold;
+}
+.status-red {
+    color: #F44336;
+    font-weight: bold;
+}
+.status-orange {
+    color: #FF9800;
+    font-weight: bold;
+}
+.status-blue {
+    color: #2196F3;
+    font-weight: bold;
+}
+.title-large {
+    font-size: 18px;
+    font-weight: bold;
+}
+.subtitle {
+    font-size: 12px;
+    font-weight: bold;
+}
+.overlay-background {
+    background-color: rgba(0, 0, 0, 0.5);
+}
+.dim-label {
+    opacity: 0.8;
+}
+"""
+
 # Main GUI Class
 class MeshtasticGTK:
     """Main GUI application class"""
     
+    # Shared by every window, see _apply_styles
+    _css_provider: Optional[Gtk.CssProvider] = None
+    
+    # Color class of a status label for each status type
+    STATUS_CLASSES = {
+        StatusType.SUCCESS: "status-green",
+        StatusType.ERROR: "status-red",
+        StatusType.WARNING: "status-orange",
+        StatusType.INFO: "status-blue",
+        StatusType.CHECKING: "status-orange"
+    }
+    
     def __init__(self):
         # Initialize core components
         self.config = AppConfig()
         self.system_manager = SystemManager(self.config)
         self.thread_manager = ThreadManager()
-        self.hardware = HardwareDetector()
+        self.hardware = HardwareDetector(self.system_manager)
         self.status_checker = StatusChecker(self.config, self.system_manager, self.hardware)
+        # Set while a status sweep runs in the background, see update_status_indicators
+        self._status_sweep_running = False
+        self._status_sweep_again = False
+        # Set while a debounced refresh is waiting to fire, see _schedule_status
+        self._status_pending = False
         self.logging_manager = LoggingManager(self.config)
         
+        # Ask for the sudo password now, if it needs one, rather than failing later
+        self.system_manager.prime_sudo()
+        
         # Check dependencies
         dependency_manager = DependencyManager(self.system_manager)
         if not dependency_manager.check_and_install_dependencies():
@@ -667,6 +1114,9 @@ class MeshtasticGTK:
         # GUI components
         self.window = None
         self.status_labels = {}
+        # Style context and current color class of each status label, see _set_status_label
+        self.status_ctx: Dict[str, Gtk.StyleContext] = {}
+        self.status_class: Dict[str, str] = {}
         self.output_textview = None
         self.status_bar = None
         self.status_context_id = None
@@ -702,43 +1152,12 @@ class MeshtasticGTK:
         settings = Gtk.Settings.get_default()
         settings.set_property("gtk-application-prefer-dark-theme", True)
         
-        css_provider = Gtk.CssProvider()
-        css_data = """
-        .status-green {
-            color: #4CAF50;
-            font-weight: bold;
-        }
-        .status-red {
-            color: #F44336;
-            font-weight: bold;
-        }
-        .status-orange {
-            color: #FF9800;
-            font-weight: bold;
-        }
-        .status-blue {
-            color: #2196F3;
-            font-weight: bold;
-        }
-        .title-large {
-            font-size: 18px;
-            font-weight: bold;
-        }
-        .subtitle {
-            font-size: 12px;
-            font-weight: bold;
-        }
-        .overlay-background {
-            background-color: rgba(0, 0, 0, 0.5);
-        }
-        .dim-label {
-            opacity: 0.8;
-        }
-        """
-        css_provider.load_from_data(css_data.encode())
+        if MeshtasticGTK._css_provider is None:
+            MeshtasticGTK._css_provider = Gtk.CssProvider()
+            MeshtasticGTK._css_provider.load_from_data(CSS_DATA)
         Gtk.StyleContext.add_provider_for_screen(
             Gdk.Screen.get_default(),
-            css_provider,
+            MeshtasticGTK._css_provider,
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
     
@@ -846,7 +1265,9 @@ class MeshtasticGTK:
             
             # Status label
             status_label = Gtk.Label(label="Checking...")
-            status_label.get_style_context().add_class("status-orange")
+            self.status_ctx[status_key] = status_label.get_style_context()
+            self.status_ctx[status_key].add_class("status-orange")
+            self.status_class[status_key] = "status-orange"
             status_label.set_halign(Gtk.Align.START)
             grid.attach(status_label, 1, row, 1, 1)
             self.status_labels[status_key] = status_label
@@ -886,7 +1307,9 @@ class MeshtasticGTK:
             
             # Status label
             status_label = Gtk.Label(label="Checking...")
-            status_label.get_style_context().add_class("status-orange")
+            self.status_ctx[status_key] = status_label.get_style_context()
+            self.status_ctx[status_key].add_class("status-orange")
+            self.status_class[status_key] = "status-orange"
             status_label.set_halign(Gtk.Align.START)
             grid.attach(status_label, 1, row, 1, 1)
             self.status_labels[status_key] = status_label
@@ -963,8 +1386,9 @@ class MeshtasticGTK:
     def _check_output_queue(self):
         """Check for new output messages"""
         messages = self.logging_manager.get_messages()
-        for message in messages:
-            self._append_output(message)
+        if messages:
+            # One buffer insert and scroll for the whole batch
+            self._append_output("\n".join(messages))
         return True  # Continue the timeout
     
     def _show_error_dialog(self, title, message):
@@ -1008,28 +1432,20 @@ class MeshtasticGTK:
         return response == Gtk.ResponseType.YES
     
     def _set_status_label(self, key, text, status_type: StatusType):
-        """Set status label text and color"""
+        """Set status label text and color, touching the label only for what changed"""
         if key in self.status_labels:
             label = self.status_labels[key]
-            label.set_text(text)
-            
-            # Remove old color classes
-            context = label.get_style_context()
-            context.remove_class("status-green")
-            context.remove_class("status-red")
-            context.remove_class("status-orange")
-            context.remove_class("status-blue")
-            
-            # Add new color class based on status type
-            color_map = {
-                StatusType.SUCCESS: "status-green",
-                StatusType.ERROR: "status-red",
-                StatusType.WARNING: "status-orange",
-                StatusType.INFO: "status-blue",
-                StatusType.CHECKING: "status-orange"
-            }
-            
-            context.add_class(color_map.get(status_type, "status-orange"))
+            new_class = self.STATUS_CLASSES.get(status_type, "status-orange")
+            old_class = self.status_class[key]
+            if label.get_text() != text:
+                label.set_text(text)
+            
+            # Swap the color class only when it changes, so GTK doesn't restyle the label for nothing
+            if old_class != new_class:
+                context = self.status_ctx[key]
+                context.remove_class(old_class)
+                context.add_class(new_class)
+                self.status_class[key] = new_class
     
     def _show_progress_spinner(self, operation_id: str, message: str = "Processing..."):
         """Show a progress spinner for an operation"""
@@ -1109,93 +1525,148 @@ class MeshtasticGTK:
         
         self.thread_manager.submit_task(worker)
     
+    def _schedule_status(self):
+        """Ask for a status refresh, coalescing requests that arrive within STATUS_DEBOUNCE_MS.
+        
+        Returns False so it can be used directly as a GLib timeout callback.
+        """
+        if not self._status_pending:
+            self._status_pending = True
+            GLib.timeout_add(self.config.STATUS_DEBOUNCE_MS, self._do_status)
+        return False
+    
+    def _do_status(self):
+        """Run the refresh that _schedule_status deferred"""
+        self._status_pending = False
+        return self.update_status_indicators()
+    
     def update_status_indicators(self):
-        """Update all status indicators"""
+        """Refresh all status indicators from a background sweep.
+        
+        Returns False so it can be used directly as a GLib timeout callback.
+        """
+        if self._status_sweep_running:
+            # Pick up whatever changed once the sweep in flight is done
+            self._status_sweep_again = True
+            return False
+        self._status_sweep_running = True
+        future = self.thread_manager.submit_task(self._status_worker)
+        future.add_done_callback(lambda f: GLib.idle_add(self._on_status_sweep_done, f))
+        return False
+    
+    def _status_worker(self) -> Tuple[Dict[str, Tuple[str, StatusType]], str]:
+        """Run a status sweep and work out every label's new state, off the GTK thread"""
+        return self._compute_status_snapshot(self.status_checker.sweep())
+    
+    def _on_status_sweep_done(self, future: Future):
+        """Apply a finished sweep on the GTK thread, starting another if one was requested"""
+        self._status_sweep_running = False
+        try:
+            self._apply_status_snapshot(*future.result())
+        except Exception as e:
+            logging.error(f"Status update failed: {e}")
+        if self._status_sweep_again:
+            self._status_sweep_again = False
+            self.update_status_indicators()
+        return False
+    
+    def _compute_status_snapshot(self, results: Dict[str, Any]) -> Tuple[Dict[str, Tuple[str, StatusType]], str]:
+        """Turn the results of StatusChecker.sweep into ({label key: (text, status type)}, version text).
+        
+        Makes no GTK calls, so it runs on the sweep's worker thread.
+        """
+        snapshot = {}
+        
         # Status 1: meshtasticd
-        if self.status_checker.check_meshtasticd_status():
-            self._set_status_label("status1", "Installed", StatusType.SUCCESS)
+        if results["meshtasticd"]:
+            snapshot["status1"] = ("Installed", StatusType.SUCCESS)
         else:
-            self._set_status_label("status1", "Not Installed", StatusType.ERROR)
+            snapshot["status1"] = ("Not Installed", StatusType.ERROR)
             
         # Status 2: SPI
-        if self.status_checker.check_spi_status():
-            self._set_status_label("status2", "Enabled", StatusType.SUCCESS)
+        if results["spi"]:
+            snapshot["status2"] = ("Enabled", StatusType.SUCCESS)
         else:
-            self._set_status_label("status2", "Disabled", StatusType.ERROR)
+            snapshot["status2"] = ("Disabled", StatusType.ERROR)
             
         # Status 3: I2C
-        if self.status_checker.check_i2c_status():
-            self._set_status_label("status3", "Enabled", StatusType.SUCCESS)
+        if results["i2c"]:
+            snapshot["status3"] = ("Enabled", StatusType.SUCCESS)
         else:
-            self._set_status_label("status3", "Disabled", StatusType.ERROR)
+            snapshot["status3"] = ("Disabled", StatusType.ERROR)
             
         # Status 3.5: GPS/UART
-        if self.status_checker.check_gps_uart_status():
-            self._set_status_label("status3_5", "Enabled", StatusType.SUCCESS)
+        if results["gps_uart"]:
+            snapshot["status3_5"] = ("Enabled", StatusType.SUCCESS)
         else:
-            self._set_status_label("status3_5", "Disabled", StatusType.ERROR)
+            snapshot["status3_5"] = ("Disabled", StatusType.ERROR)
             
         # Status 4: HAT Specific
-        if self.status_checker.check_hat_specific_status():
-            self._set_status_label("status4", "Configured", StatusType.SUCCESS)
+        if results["hat_specific"]:
+            snapshot["status4"] = ("Configured", StatusType.SUCCESS)
         else:
-            self._set_status_label("status4", "Not Configured", StatusType.ERROR)
+            snapshot["status4"] = ("Not Configured", StatusType.ERROR)
             
         # Status 5: HAT Config
-        if self.status_checker.check_hat_config_status():
-            self._set_status_label("status5", "Set", StatusType.SUCCESS)
+        if results["hat_config"]:
+            snapshot["status5"] = ("Set", StatusType.SUCCESS)
         else:
-            self._set_status_label("status5", "Not Set", StatusType.ERROR)
+            snapshot["status5"] = ("Not Set", StatusType.ERROR)
             
         # Status 6: Config exists
-        if self.status_checker.check_config_exists():
-            self._set_status_label("status6", "Exists", StatusType.SUCCESS)
+        if results["config_exists"]:
+            snapshot["status6"] = ("Exists", StatusType.SUCCESS)
         else:
-            self._set_status_label("status6", "Missing", StatusType.ERROR)
+            snapshot["status6"] = ("Missing", StatusType.ERROR)
             
         # Status Python CLI
-        if self.status_checker.check_python_cli_status():
-            self._set_status_label("status_python_cli", "Installed", StatusType.SUCCESS)
-            self._set_status_label("status_send_message", "Ready", StatusType.SUCCESS)
+        if results["python_cli"]:
+            snapshot["status_python_cli"] = ("Installed", StatusType.SUCCESS)
+            snapshot["status_send_message"] = ("Ready", StatusType.SUCCESS)
         else:
-            self._set_status_label("status_python_cli", "Not Installed", StatusType.ERROR)
-            self._set_status_label("status_send_message", "CLI Required", StatusType.ERROR)
+            snapshot["status_python_cli"] = ("Not Installed", StatusType.ERROR)
+            snapshot["status_send_message"] = ("CLI Required", StatusType.ERROR)
             
         # Status Region
-        region_status = self.status_checker.check_lora_region_status()
+        region_status = results["lora_region"]
         if region_status == "UNSET":
-            self._set_status_label("status_region", "UNSET", StatusType.ERROR)
+            snapshot["status_region"] = ("UNSET", StatusType.ERROR)
         elif region_status in ["US", "EU_868", "EU_433", "ANZ", "CN", "IN", "JP", "KR", 
                                "MY_433", "MY_919", "RU", "SG_923", "TH", "TW", "UA_433", "UA_868"]:
-            self._set_status_label("status_region", region_status, StatusType.SUCCESS)
+            snapshot["status_region"] = (region_status, StatusType.SUCCESS)
         elif region_status == "CLI Not Available":
-            self._set_status_label("status_region", "CLI Required", StatusType.ERROR)
+            snapshot["status_region"] = ("CLI Required", StatusType.ERROR)
         elif region_status == "Error":
-            self._set_status_label("status_region", "Error", StatusType.WARNING)
+            snapshot["status_region"] = ("Error", StatusType.WARNING)
         else:
-            self._set_status_label("status_region", region_status, StatusType.INFO)
+            snapshot["status_region"] = (region_status, StatusType.INFO)
             
         # Status Avahi
-        if self.status_checker.check_avahi_status():
-            self._set_status_label("status_avahi", "Enabled", StatusType.SUCCESS)
+        if results["avahi"]:
+            snapshot["status_avahi"] = ("Enabled", StatusType.SUCCESS)
         else:
-            self._set_status_label("status_avahi", "Disabled", StatusType.ERROR)
+            snapshot["status_avahi"] = ("Disabled", StatusType.ERROR)
             
         # Status Boot
-        if self.status_checker.check_meshtasticd_boot_status():
-            self._set_status_label("status_boot", "Enabled", StatusType.SUCCESS)
+        if results["boot"]:
+            snapshot["status_boot"] = ("Enabled", StatusType.SUCCESS)
         else:
-            self._set_status_label("status_boot", "Disabled", StatusType.ERROR)
+            snapshot["status_boot"] = ("Disabled", StatusType.ERROR)
             
         # Status Service
-        if self.status_checker.check_meshtasticd_service_status():
-            self._set_status_label("status_service", "Running", StatusType.SUCCESS)
+        if results["service"]:
+            snapshot["status_service"] = ("Running", StatusType.SUCCESS)
         else:
-            self._set_status_label("status_service", "Stopped", StatusType.ERROR)
+            snapshot["status_service"] = ("Stopped", StatusType.ERROR)
         
-        # Update meshtasticd version display
-        current_version = self.hardware._get_meshtasticd_version()
-        self.version_label.set_text(f"Meshtasticd Version: {current_version}")
+        return snapshot, f"Meshtasticd Version: {results['meshtasticd_version']}"
+    
+    def _apply_status_snapshot(self, snapshot: Dict[str, Tuple[str, StatusType]], version_text: str):
+        """Apply a computed status snapshot to the labels in one pass on the GTK thread"""
+        for key, (text, status_type) in snapshot.items():
+            self._set_status_label(key, text, status_type)
+        if self.version_label.get_text() != version_text:
+            self.version_label.set_text(version_text)
     
     def _update_version_display(self):
         """Update just the version display"""
@@ -1222,7 +1693,7 @@ class MeshtasticGTK:
                 "enable_spi",
                 self._enable_spi,
                 "Enabling SPI interface...",
-                lambda result: self.update_status_indicators()
+                lambda result: self._schedule_status()
             )
     
     def handle_enable_i2c(self, widget):
@@ -1234,7 +1705,7 @@ class MeshtasticGTK:
                 "enable_i2c",
                 self._enable_i2c,
                 "Enabling I2C interface...",
-                lambda result: self.update_status_indicators()
+                lambda result: self._schedule_status()
             )
     
     def handle_enable_gps_uart(self, widget):
@@ -1246,7 +1717,7 @@ class MeshtasticGTK:
                 "enable_gps_uart",
                 self._enable_gps_uart,
                 "Enabling GPS/UART interface...",
-                lambda result: self.update_status_indicators()
+                lambda result: self._schedule_status()
             )
     
     def handle_hat_specific(self, widget):
@@ -1260,7 +1731,7 @@ class MeshtasticGTK:
             "configure_hat",
             self._configure_meshadv_mini,
             "Configuring MeshAdv Mini...",
-            lambda result: self.update_status_indicators()
+            lambda result: self._schedule_status()
         )
     
     def handle_hat_config(self, widget):
@@ -1354,7 +1825,7 @@ class MeshtasticGTK:
             self._show_error_dialog("Error", f"HAT configuration failed: {e}")
         
         # Update status after operation
-        self.update_status_indicators()
+        self._schedule_status()
     
     def _show_confirmation_dialog_with_options(self, title: str, message: str, options: List[str]) -> int:
         """Show a confirmation dialog with custom options, returns index of selected option or -1 for cancel"""
@@ -1665,7 +2136,7 @@ class MeshtasticGTK:
             self._show_info_dialog("Configuration Applied",
                 f"Configuration '{source_item.name}' has been applied.\nRestart meshtasticd service for changes to take effect.")
             
-            self.update_status_indicators()
+            self._schedule_status()
             
         except Exception as e:
             logging.error(f"Failed to copy config item: {e}")
@@ -1727,7 +2198,7 @@ class MeshtasticGTK:
             self._show_info_dialog("Configuration Applied",
                 f"Configuration '{config_file.name}' has been applied.\nRestart meshtasticd service for changes to take effect.")
             
-            self.update_status_indicators()
+            self._schedule_status()
         else:
             dialog.destroy()
     
@@ -1744,7 +2215,7 @@ class MeshtasticGTK:
                 "enable_boot",
                 self._enable_boot_service,
                 "Enabling meshtasticd on boot...",
-                lambda result: self.update_status_indicators()
+                lambda result: self._schedule_status()
             )
     
     def handle_start_stop(self, widget):
@@ -1754,14 +2225,14 @@ class MeshtasticGTK:
                 "stop_service",
                 self._stop_service,
                 "Stopping meshtasticd service...",
-                lambda result: self.update_status_indicators()
+                lambda result: self._schedule_status()
             )
         else:
             self._run_operation_with_progress(
                 "start_service",
                 self._start_service,
                 "Starting meshtasticd service...",
-                lambda result: self.update_status_indicators()
+                lambda result: self._schedule_status()
             )
     
     def handle_install_python_cli(self, widget):
@@ -1802,14 +2273,14 @@ class MeshtasticGTK:
                     "disable_avahi",
                     self._disable_avahi,
                     "Disabling Avahi...",
-                    lambda result: self.update_status_indicators()
+                    lambda result: self._schedule_status()
                 )
         else:
             self._run_operation_with_progress(
                 "enable_avahi",
                 self._enable_avahi,
                 "Enabling Avahi...",
-                lambda result: self.update_status_indicators()
+                lambda result: self._schedule_status()
             )
     
     # Operation Implementation Methods
@@ -1826,8 +2297,7 @@ class MeshtasticGTK:
             logging.info(f"Backed up config.txt to {backup_path}")
             
             # Read current config
-            result = self.system_manager.run_sudo_command(["cat", self.config.BOOT_CONFIG_FILE])
-            config_content = result.stdout
+            config_content = self.system_manager.read_file(self.config.BOOT_CONFIG_FILE)
             
             # Add SPI configurations
             config_updated = False
@@ -1844,8 +2314,7 @@ class MeshtasticGTK:
                 logging.info("Added SPI overlay to config.txt")
             
             if config_updated:
-                self.system_manager.run_sudo_command(["tee", self.config.BOOT_CONFIG_FILE], 
-                                                   input_text=config_content)
+                self.system_manager.write_file_atomic(self.config.BOOT_CONFIG_FILE, config_content)
                 logging.info("SPI configuration updated in config.txt")
             else:
                 logging.info("SPI configuration already present in config.txt")
@@ -1869,14 +2338,12 @@ class MeshtasticGTK:
             logging.info(f"Backed up config.txt to {backup_path}")
             
             # Read current config
-            result = self.system_manager.run_sudo_command(["cat", self.config.BOOT_CONFIG_FILE])
-            config_content = result.stdout
+            config_content = self.system_manager.read_file(self.config.BOOT_CONFIG_FILE)
             
             # Add I2C configuration
             if "dtparam=i2c_arm=on" not in config_content:
                 config_content += "\n# I2C Configuration\ndtparam=i2c_arm=on\n"
-                self.system_manager.run_sudo_command(["tee", self.config.BOOT_CONFIG_FILE], 
-                                                   input_text=config_content)
+                self.system_manager.write_file_atomic(self.config.BOOT_CONFIG_FILE, config_content)
                 logging.info("Added I2C ARM parameter to config.txt")
             else:
                 logging.info("I2C ARM parameter already present in config.txt")
@@ -1897,8 +2364,7 @@ class MeshtasticGTK:
             logging.info(f"Backed up config.txt to {backup_path}")
             
             # Read current config
-            result = self.system_manager.run_sudo_command(["cat", self.config.BOOT_CONFIG_FILE])
-            config_content = result.stdout
+            config_content = self.system_manager.read_file(self.config.BOOT_CONFIG_FILE)
             
             config_updated = False
             
@@ -1917,8 +2383,7 @@ class MeshtasticGTK:
                 logging.info("Added uart0 overlay for Pi 5 to config.txt")
             
             if config_updated:
-                self.system_manager.run_sudo_command(["tee", self.config.BOOT_CONFIG_FILE], 
-                                                   input_text=config_content)
+                self.system_manager.write_file_atomic(self.config.BOOT_CONFIG_FILE, config_content)
                 logging.info("GPS/UART configuration written to config.txt")
             
             # Disable serial console
@@ -1945,8 +2410,7 @@ class MeshtasticGTK:
             logging.info(f"Backed up config.txt to {backup_path}")
             
             # Read current config
-            result = self.system_manager.run_sudo_command(["cat", self.config.BOOT_CONFIG_FILE])
-            config_content = result.stdout
+            config_content = self.system_manager.read_file(self.config.BOOT_CONFIG_FILE)
             
             # MeshAdv Mini specific configurations
             meshadv_config = """
@@ -1961,8 +2425,7 @@ dtoverlay=pps-gpio,gpiopin=17
             # Check if already configured
             if "MeshAdv Mini Configuration" not in config_content:
                 config_content += meshadv_config
-                self.system_manager.run_sudo_command(["tee", self.config.BOOT_CONFIG_FILE], 
-                                                   input_text=config_content)
+                self.system_manager.write_file_atomic(self.config.BOOT_CONFIG_FILE, config_content)
                 logging.info("MeshAdv Mini configuration added to config.txt")
                 logging.info("Reboot required for changes to take effect")
                 
@@ -2089,8 +2552,8 @@ dtoverlay=pps-gpio,gpiopin=17
             
             # Step 1: Install python3-full
             logging.info("Step 1/5: Installing python3-full...")
-            result = self.system_manager.run_sudo_command(["apt", "install", "-y", "python3-full"], 
-                                                        timeout=self.config.DEFAULT_TIMEOUT)
+            result = self.system_manager.run_sudo_streaming(["apt", "install", "-y", "python3-full"], 
+                                                            timeout=self.config.DEFAULT_TIMEOUT)
             if result.returncode == 0:
                 logging.info("✅ python3-full installed successfully")
             else:
@@ -2112,8 +2575,8 @@ dtoverlay=pps-gpio,gpiopin=17
             
             # Step 3: Install pipx
             logging.info("Step 3/5: Installing pipx...")
-            result = self.system_manager.run_sudo_command(["apt", "install", "-y", "pipx"], 
-                                                        timeout=self.config.DEFAULT_TIMEOUT)
+            result = self.system_manager.run_sudo_streaming(["apt", "install", "-y", "pipx"], 
+                                                            timeout=self.config.DEFAULT_TIMEOUT)
             if result.returncode != 0:
                 raise InstallationError("Failed to install pipx")
             logging.info("✅ pipx installed successfully")
@@ -2161,7 +2624,7 @@ dtoverlay=pps-gpio,gpiopin=17
     
     def _on_cli_install_success(self, result: OperationResult):
         """Handle successful CLI installation"""
-        self.update_status_indicators()
+        self._schedule_status()
         self._show_info_dialog(
             "Installation Complete - Restart Required",
             f"Meshtastic Python CLI installed successfully!\n\n"
@@ -2431,7 +2894,7 @@ dtoverlay=pps-gpio,gpiopin=17
                 raise MeshtasticError(f"Region setting failed: {e}")
         
         def on_success(result):
-            self.update_status_indicators()
+            self._schedule_status()
             self._show_info_dialog("Region Updated",
                 f"LoRa region updated successfully!\n\nChanged from: {old_region}\nChanged to: {new_region}\n\nThe device may need to restart for changes to take full effect.")
         
@@ -2460,9 +2923,10 @@ dtoverlay=pps-gpio,gpiopin=17
             
             if not avahi_installed:
                 logging.info("Installing avahi-daemon...")
-                self.system_manager.run_sudo_command(["apt", "update"], timeout=120)
-                result = self.system_manager.run_sudo_command(["apt", "install", "-y", "avahi-daemon"], 
-                                                            timeout=300)
+                self.system_manager.run_sudo_streaming(["apt", "update"], timeout=120)
+                result = self.system_manager.run_sudo_streaming(["apt", "install", "-y", "avahi-daemon"], 
+                                                                timeout=300)
+                self.system_manager.invalidate_package_index()
                 if result.returncode != 0:
                     raise InstallationError("Failed to install avahi-daemon")
                 logging.info("✅ avahi-daemon installed successfully")
@@ -2614,7 +3078,8 @@ dtoverlay=pps-gpio,gpiopin=17
             
             # Step 2: Download GPG key
             logging.info(f"Step 2/5: Downloading GPG key...")
-            result = self.system_manager.run_command(["curl", "-fsSL", f"{repo_url}Release.key"])
+            # Keep the key as raw bytes; it goes straight to gpg without a decode/encode round trip
+            result = self.system_manager.run_command(["curl", "-fsSL", f"{repo_url}Release.key"], text=False)
             if result.returncode != 0:
                 raise InstallationError("Failed to download GPG key")
             logging.info(f"✅ GPG key downloaded successfully")
@@ -2628,7 +3093,7 @@ dtoverlay=pps-gpio,gpiopin=17
                 stderr=subprocess.PIPE
             )
             
-            gpg_output, gpg_error = gpg_process.communicate(input=result.stdout.encode('utf-8'))
+            gpg_output, gpg_error = gpg_process.communicate(input=result.stdout)
             
             if gpg_process.returncode != 0:
                 raise InstallationError("GPG key processing failed")
@@ -2659,7 +3124,7 @@ dtoverlay=pps-gpio,gpiopin=17
             
             # Step 4: Update package database
             logging.info(f"Step 4/5: Updating package database...")
-            result = self.system_manager.run_sudo_command(["apt", "update"], timeout=120)
+            result = self.system_manager.run_sudo_streaming(["apt", "update"], timeout=120)
             if result.returncode != 0:
                 logging.warning(f"⚠️ Package update had issues, continuing anyway")
             else:
@@ -2668,21 +3133,16 @@ dtoverlay=pps-gpio,gpiopin=17
             # Step 5: Install package
             logging.info(f"Step 5/5: Installing meshtasticd package...")
             
-            # Set non-interactive environment
-            env = os.environ.copy()
-            env['DEBIAN_FRONTEND'] = 'noninteractive'
-            
-            install_cmd = ["sudo", "-E", "apt", "install", "-y", 
+            # Set non-interactive environment inside the elevated command, where sudo's env_reset can't strip it
+            install_cmd = ["env", "DEBIAN_FRONTEND=noninteractive", "apt", "install", "-y", 
                           "-o", "Dpkg::Options::=--force-confdef", 
                           "-o", "Dpkg::Options::=--force-confold", 
                           self.config.PKG_NAME]
             
-            result = subprocess.run(
+            # apt's output is logged live; the returned tail is only used for the error message
+            result = self.system_manager.run_sudo_streaming(
                 install_cmd,
-                capture_output=True, 
-                text=True, 
-                timeout=self.config.APT_TIMEOUT, 
-                env=env
+                timeout=self.config.APT_TIMEOUT
             )
             
             if result.returncode == 0:
@@ -2691,9 +3151,8 @@ dtoverlay=pps-gpio,gpiopin=17
                 return OperationResult(True, f"Meshtasticd {channel} installed successfully")
             else:
                 logging.error(f"❌ Installation failed")
-                if result.stderr.strip():
-                    logging.error(f"Error details: {result.stderr}")
-                raise InstallationError(f"Package installation failed: {result.stderr}")
+                error_lines = result.stdout.splitlines()[-10:]
+                raise InstallationError(f"Package installation failed: {chr(10).join(error_lines)}")
             
         except Exception as e:
             logging.error(f"❌ INSTALLATION ERROR: {e}")
@@ -2701,8 +3160,10 @@ dtoverlay=pps-gpio,gpiopin=17
     
     def _on_install_success(self):
         """Handle successful installation"""
+        self.hardware.invalidate_version()
+        self.system_manager.invalidate_package_index()
         # Update status after a brief delay to ensure package is registered
-        GLib.timeout_add(2000, self.update_status_indicators)
+        GLib.timeout_add(2000, self._schedule_status)
         # Force immediate version update
         GLib.timeout_add(2000, self._update_version_display)
         self._show_info_dialog("Installation Complete", 
@@ -2743,8 +3204,8 @@ dtoverlay=pps-gpio,gpiopin=17
             
             # Step 3: Remove package
             logging.info("Step 3/4: Removing meshtasticd package...")
-            result = self.system_manager.run_sudo_command(["apt", "remove", "--purge", "-y", self.config.PKG_NAME], 
-                                                        timeout=300, input_text="n\n")
+            result = self.system_manager.run_sudo_streaming(["apt", "remove", "--purge", "-y", self.config.PKG_NAME], 
+                                                            timeout=300, input_text="n\n")
             
             if result.returncode != 0:
                 raise InstallationError("Package removal failed")
@@ -2786,7 +3247,9 @@ dtoverlay=pps-gpio,gpiopin=17
     
     def _on_removal_success(self):
         """Handle successful removal"""
-        self.update_status_indicators()
+        self.hardware.invalidate_version()
+        self.system_manager.invalidate_package_index()
+        self._schedule_status()
         # Force immediate version update
         GLib.idle_add(self._update_version_display)
         self._show_info_dialog("Removal Complete", 